@@ -8,36 +8,148 @@ import os
 import sys
 import subprocess
 import shutil
+import errno
+import struct
+import stat
 import json
 import zipfile
 import tarfile
+import io
 import urllib.request
 import urllib.error
+import urllib.parse
+import http.client
 from tkinter import simpledialog
-import xml.etree.ElementTree as ET
-import gzip
 from pathlib import Path
-from tkinter import Tk, Frame, Label, Button, Entry, Text, Scrollbar, Checkbutton, BooleanVar, filedialog, messagebox, Toplevel
+from tkinter import Tk, Frame, Label, Button, Entry, Text, Scrollbar, Listbox, Checkbutton, BooleanVar, filedialog, messagebox, Toplevel
 from tkinter import ttk
 import tkinter.font as tkfont
 import threading
 import re
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from queue import Queue
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from collections import namedtuple, deque
+from queue import Queue, Empty
 import time
 import threading as pythread
 import gc  # For memory management
+import locale
+import functools
+import types
 try:
     import psutil  # For CPU, memory, disk usage
     PSUTIL_AVAILABLE = True
 except ImportError:
     PSUTIL_AVAILABLE = False
+try:
+    import py7zr  # For in-process 7z extraction
+    PY7ZR_AVAILABLE = True
+except ImportError:
+    PY7ZR_AVAILABLE = False
+try:
+    import orjson  # Faster JSON for config/progress files
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+try:
+    import rarfile  # For listing .rar contents without spawning 7-Zip
+    RARFILE_AVAILABLE = True
+except ImportError:
+    RARFILE_AVAILABLE = False
+try:
+    import re2  # Linear-time DFA regex engine for bulk filename cleaning
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
 
 # MAME download configuration
 MAME_RELEASE_URL = "https://www.mamedev.org/release.html"
 MAME_GITHUB_RELEASES_API = "https://api.github.com/repos/mamedev/mame/releases/latest"
 
+# Version patterns for chdman --version output and the MAME release page
+MAME_TAG_RE = re.compile(r'\(mame(\d{4})\)')
+DOTTED_VERSION_RE = re.compile(r'(\d+\.\d+)')
+MAME_HTML_TAG_RE = re.compile(rb'mame(\d{4})', re.IGNORECASE)
+MAME_HTML_VERSION_RE = re.compile(rb'MAME\s+(\d+\.\d+)')
+
+# Hide console windows for helper tools spawned from the GUI (Windows only)
+NO_WINDOW_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0) if sys.platform == 'win32' else 0
+
+# Common 7-Zip install locations on Windows (PeaZip bundles 7z.exe)
+SEVEN_ZIP_INSTALL_ROOTS = (r"C:\Program Files", r"C:\Program Files (x86)")
+SEVEN_ZIP_APP_LAYOUTS = (
+    ('7-zip', (('7z.exe', "7-Zip"),)),
+    ('peazip', ((r"res\bin\7z\7z.exe", "PeaZip 7z"), (r"res\bin\7z\x64\7z.exe", "PeaZip 7z x64"))),
+)
+SEVEN_ZIP_SCOOP_PATH = os.path.join(os.path.expanduser("~"), "scoop", "apps", "7zip", "current", "7z.exe")
+
+# "name = value" lines of an aes_keys.txt file (comments start with #)
+AES_KEY_LINE_RE = re.compile(r'^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
+# aes_keys.txt entry -> NDecrypt config.json key (read-only; order is output order)
+AES_KEY_MAPPING = types.MappingProxyType({
+    # Generator -> AESHardwareConstant
+    'generator': 'AESHardwareConstant',
+    # KeyX slots
+    'slot0x18KeyX': 'KeyX0x18',
+    'slot0x1BKeyX': 'KeyX0x1B',
+    'slot0x25KeyX': 'KeyX0x25',
+    'slot0x2CKeyX': 'KeyX0x2C',
+    'slot0x2DKeyX': 'KeyX0x2D',
+    'slot0x2EKeyX': 'KeyX0x2E',
+    'slot0x2FKeyX': 'KeyX0x2F',
+    'slot0x30KeyX': 'KeyX0x30',
+    'slot0x31KeyX': 'KeyX0x31',
+    'slot0x32KeyX': 'KeyX0x32',
+    'slot0x33KeyX': 'KeyX0x33',
+    'slot0x34KeyX': 'KeyX0x34',
+    'slot0x35KeyX': 'KeyX0x35',
+    'slot0x36KeyX': 'KeyX0x36',
+    'slot0x37KeyX': 'KeyX0x37',
+    'slot0x38KeyX': 'KeyX0x38',
+    'slot0x39KeyX': 'KeyX0x39',
+    'slot0x3AKeyX': 'KeyX0x3A',
+    'slot0x3BKeyX': 'KeyX0x3B',
+    'slot0x3CKeyX': 'KeyX0x3C',
+    'slot0x3DKeyX': 'KeyX0x3D',
+    'slot0x3EKeyX': 'KeyX0x3E',
+    'slot0x3FKeyX': 'KeyX0x3F',
+    'slot0x03KeyX': 'KeyX0x03',
+    'slot0x19KeyX': 'KeyX0x19',
+    'slot0x1AKeyX': 'KeyX0x1A',
+    'slot0x1CKeyX': 'KeyX0x1C',
+    'slot0x1DKeyX': 'KeyX0x1D',
+    'slot0x1EKeyX': 'KeyX0x1E',
+    'slot0x1FKeyX': 'KeyX0x1F',
+    # KeyY slots
+    'slot0x18KeyY': 'KeyY0x18',
+    'slot0x1BKeyY': 'KeyY0x1B',
+    'slot0x25KeyY': 'KeyY0x25',
+    'slot0x2CKeyY': 'KeyY0x2C',
+    # KeyN (normal keys)
+    'slot0x18KeyN': 'KeyN0x18',
+    'slot0x1BKeyN': 'KeyN0x1B',
+    'slot0x25KeyN': 'KeyN0x25',
+    'slot0x2CKeyN': 'KeyN0x2C',
+})
+
+# Lines kept in the main log widget; older lines are dropped so inserts stay
+# cheap over a long batch
+MAX_LOG_LINES = 5000
+
+# Interval for draining log lines queued by worker threads; lines logged on
+# the Tk thread wake the drain right away with a <<LogMessage>> event
+LOG_POLL_MS = 500
+
+# Folder listings remembered between scans (see _scan_file_paths). A listing
+# is only stored once the folder's mtime is this old, so a change landing in
+# the same timestamp tick can't hide behind an unchanged mtime.
+SCAN_CACHE_SETTLE_NS = 2_000_000_000
+SCAN_CACHE_MAX_DIRS = 50_000
+
+# How long a remembered "is this really chdman/7-Zip/..." check stays valid
+TOOL_VERIFY_TTL_SECONDS = 30 * 24 * 3600
+
 # NDecrypt download configuration (for 3DS ROM decryption)
 NDECRYPT_GITHUB_RELEASES_API = "https://api.github.com/repos/SabreTools/NDecrypt/releases/latest"
 
@@ -104,9 +216,244 @@ SYSTEM_EXTENSIONS = {
     '.vb': 'Virtual Boy',
 }
 
+# 3DS ROM file extensions (lowercase tuple for str.endswith)
+THREEDS_EXTENSIONS = ('.3ds', '.cia')
+
+# Archive types whose member names archive_contains can list without extracting
+LISTABLE_ARCHIVE_EXTENSIONS = ('.zip', '.7z', '.rar')
+
+# Fast "is this a ROM?" check before the system lookup
+ROM_EXTENSIONS = frozenset(SYSTEM_EXTENSIONS)
+ROM_EXTENSIONS_BYTES = frozenset(ext.encode('ascii') for ext in ROM_EXTENSIONS)
+
 PSP_ID_PATTERNS = ('ulus', 'ules', 'uljm', 'uljs', 'ucus', 'uces', 'uckr', 'ulks')
 PS2_ID_PATTERNS = ('slus', 'sles', 'scus', 'sces', 'slpm', 'slps', 'scps')
 
+# Single-pass game ID matching (any ID anywhere in the lowercased name)
+PSP_ID_RE = re.compile('|'.join(PSP_ID_PATTERNS))
+PS2_ID_RE = re.compile('|'.join(PS2_ID_PATTERNS))
+
+# clean_rom_filename: tags to KEEP (case-insensitive patterns that should be preserved)
+CLEAN_KEEP_PATTERNS = [
+    r'\(Disc\s*\d+\)', r'\(Disk\s*\d+\)', r'\(Bonus\s*Disc\)', r'\(Bonus\s*Disk\)',
+    r'\(Demo\)', r'\(Beta\)', r'\(Proto\)', r'\(Prototype\)', r'\(Sample\)',
+    r'\(Limited\s*Edition\)', r'\(Collector.?s?\s*Edition\)', r'\(Special\s*Edition\)',
+    r'\(Game\s*of.*Year\)', r'\(GOTY\)', r'\(Director.?s?\s*Cut\)', r'\(Uncut\)',
+    r'\(Part\s*\d+\)', r'\(Side\s*[AB]\)',
+]
+
+# clean_rom_filename: tags to REMOVE
+CLEAN_REMOVE_PATTERNS = [
+    r'\(USA\)', r'\(U\)', r'\(America\)', r'\(Europe\)', r'\(E\)', r'\(EU\)',
+    r'\(Japan\)', r'\(J\)', r'\(JP\)', r'\(Korea\)', r'\(K\)', r'\(KR\)',
+    r'\(Asia\)', r'\(A\)', r'\(World\)', r'\(W\)', r'\(Australia\)', r'\(AU\)',
+    r'\(France\)', r'\(F\)', r'\(Fr\)', r'\(Germany\)', r'\(G\)', r'\(De\)',
+    r'\(Spain\)', r'\(S\)', r'\(Es\)', r'\(Italy\)', r'\(I\)', r'\(It\)',
+    r'\(En\)', r'\(En,.*?\)', r'\(English\)', r'\(French\)', r'\(German\)',
+    r'\(Spanish\)', r'\(Italian\)', r'\(Japanese\)',
+    r'\(Multi\)', r'\(Multi\d*\)', r'\(M\d+\)',
+    r'\(Rev\s*[\dA-Z\.]+\)', r'\(v[\d\.]+[a-z]?\)', r'\(Ver\.?\s*[\d\.]+\)',
+    r'\[!\]', r'\[a\d?\]', r'\[b\d?\]', r'\[c\]', r'\[f\d?\]',
+    r'\[h\d*[A-Za-z]*\]', r'\[o\d?\]', r'\[p\d?\]', r'\[t\d?\]',
+    r'\[T[+-][A-Za-z]+[^\]]*\]',
+    r'\(NTSC\)', r'\(NTSC-U\)', r'\(NTSC-J\)', r'\(PAL\)', r'\(SECAM\)',
+    r'\(\d{4}-\d{2}-\d{2}\)', r'\(\d{8}\)', r'\(Unl\)',
+    r'\(Decrypted\)', r'\(Encrypted\)',
+]
+
+# clean_rom_filename: words allowed in multi-region tags like "(USA, Europe)"
+CLEAN_REGION_WORDS = [
+    'USA', 'Europe', 'Japan', 'Asia', 'World', 'Korea', 'Australia',
+    'France', 'Germany', 'Spain', 'Italy', 'En', 'Fr', 'De', 'Es', 'It',
+    'U', 'E', 'J', 'A', 'K', 'W', 'G', 'F', 'S', 'I', 'EU', 'JP', 'KR', 'AU'
+]
+
+# Compiled once at import so cleaning a batch doesn't go through re's compile cache per name
+CLEAN_KEEP_RES = [re.compile(p, re.IGNORECASE) for p in CLEAN_KEEP_PATTERNS]
+CLEAN_REMOVE_RES = [re.compile(p, re.IGNORECASE) for p in CLEAN_REMOVE_PATTERNS]
+_clean_region_alt = '|'.join(re.escape(r) for r in CLEAN_REGION_WORDS)
+CLEAN_MULTI_REGION_PATTERN = r'\(\s*(?:' + _clean_region_alt + r')(?:\s*,\s*(?:' + _clean_region_alt + r'))+\s*\)'
+CLEAN_MULTI_REGION_RE = re.compile(CLEAN_MULTI_REGION_PATTERN, re.IGNORECASE)
+# Multi-region tag plus every remove pattern as one alternation, used only to
+# ask "is there anything to remove?" in a single scan. The removal itself
+# stays one pass per pattern in order: on nested or unbalanced parentheses a
+# fused sub matches differently (e.g. "(U(USA))"), so it can't replace them.
+# (compiled with RE2 when installed; the union has no lookarounds, so it is RE2-safe)
+_clean_remove_union = '|'.join([CLEAN_MULTI_REGION_PATTERN] + CLEAN_REMOVE_PATTERNS)
+CLEAN_REMOVE_RE = None
+if RE2_AVAILABLE:
+    try:
+        CLEAN_REMOVE_RE = re2.compile('(?i)' + _clean_remove_union)
+    except Exception:
+        CLEAN_REMOVE_RE = None
+if CLEAN_REMOVE_RE is None:
+    CLEAN_REMOVE_RE = re.compile(_clean_remove_union, re.IGNORECASE)
+# Leftover 1-3 letter codes in parentheses (not directly before the extension)
+SHORT_TAG_RE = re.compile(r'\s*\([A-Za-z]{1,3}\)(?!\s*\.)')
+
+# Clean ROM Names dialog: tags to KEEP (case-insensitive patterns that should be preserved)
+CLEAN_NAMES_KEEP_PATTERNS = [
+    r'\(Disc\s*\d+\)',           # (Disc 1), (Disc 2), etc.
+    r'\(Disk\s*\d+\)',           # (Disk 1), (Disk 2), etc.
+    r'\(Bonus\s*Disc\)',         # (Bonus Disc)
+    r'\(Bonus\s*Disk\)',         # (Bonus Disk)
+    r'\(Custom\s*Install\s*Disc\)', # (Custom Install Disc)
+    r'\(Install\s*Disc\)',       # (Install Disc)
+    r'\(Demo\)',                 # (Demo)
+    r'\(Beta\)',                 # (Beta)
+    r'\(Proto\)',                # (Proto)
+    r'\(Prototype\)',            # (Prototype)
+    r'\(Sample\)',               # (Sample)
+    r'\(Promo\)',                # (Promo)
+    r'\(Kiosk\)',                # (Kiosk)
+    r'\(Limited\s*Edition\)',    # (Limited Edition)
+    r'\(Collector.?s?\s*Edition\)', # (Collector's Edition)
+    r'\(Special\s*Edition\)',    # (Special Edition)
+    r'\(Game\s*of.*Year\)',      # (Game of the Year)
+    r'\(GOTY\)',                 # (GOTY)
+    r'\(Director.?s?\s*Cut\)',   # (Director's Cut)
+    r'\(Uncut\)',                # (Uncut)
+    r'\(Black\s*Label\)',        # (Black Label)
+    r'\(Greatest\s*Hits\)',      # (Greatest Hits)
+    r'\(Platinum\)',             # (Platinum)
+    r'\(Player.?s?\s*Choice\)',  # (Player's Choice)
+    r'\(Nintendo\s*Selects\)',   # (Nintendo Selects)
+    r'\(Budget\)',               # (Budget)
+    r'\(Reprint\)',              # (Reprint)
+    r'\(Alt\)',                  # (Alt) - alternate version
+    r'\(Part\s*\d+\)',           # (Part 1), (Part 2)
+    r'\(Side\s*[AB]\)',          # (Side A), (Side B)
+]
+CLEAN_NAMES_KEEP_RES = [re.compile(p, re.IGNORECASE) for p in CLEAN_NAMES_KEEP_PATTERNS]
+
+# Clean ROM Names dialog: tags to REMOVE (region codes, languages, revisions, etc.)
+CLEAN_NAMES_REMOVE_PATTERNS = [
+    r'\(USA\)',
+    r'\(U\)',
+    r'\(America\)',
+    r'\(Europe\)',
+    r'\(E\)',
+    r'\(EU\)',
+    r'\(Japan\)',
+    r'\(J\)',
+    r'\(JP\)',
+    r'\(Korea\)',
+    r'\(K\)',
+    r'\(KR\)',
+    r'\(Asia\)',
+    r'\(A\)',
+    r'\(World\)',
+    r'\(W\)',
+    r'\(Australia\)',
+    r'\(AU\)',
+    r'\(France\)',
+    r'\(F\)',
+    r'\(Fr\)',
+    r'\(Germany\)',
+    r'\(G\)',
+    r'\(De\)',
+    r'\(Spain\)',
+    r'\(S\)',
+    r'\(Es\)',
+    r'\(Italy\)',
+    r'\(I\)',
+    r'\(It\)',
+    r'\(Netherlands\)',
+    r'\(Nl\)',
+    r'\(Sweden\)',
+    r'\(Sw\)',
+    r'\(Sv\)',
+    r'\(Norway\)',
+    r'\(No\)',
+    r'\(Denmark\)',
+    r'\(Dk\)',
+    r'\(Da\)',
+    r'\(Finland\)',
+    r'\(Fi\)',
+    r'\(Portugal\)',
+    r'\(Pt\)',
+    r'\(Brazil\)',
+    r'\(Br\)',
+    r'\(Russia\)',
+    r'\(Ru\)',
+    r'\(China\)',
+    r'\(Cn\)',
+    r'\(Zh\)',
+    r'\(Taiwan\)',
+    r'\(Tw\)',
+    r'\(Hong\s*Kong\)',
+    r'\(HK\)',
+    r'\(En\)',                   # Language: English
+    r'\(En,.*?\)',               # (En,Fr), (En,De,Es), etc.
+    r'\(English\)',
+    r'\(French\)',
+    r'\(German\)',
+    r'\(Spanish\)',
+    r'\(Italian\)',
+    r'\(Japanese\)',
+    r'\(Multi\)',                # Multi-language
+    r'\(Multi\d*\)',             # (Multi5), (Multi6), etc.
+    r'\(M\d+\)',                 # (M3), (M5), etc.
+    r'\(Rev\s*[\dA-Z\.]+\)',    # (Rev 1), (Rev A), (Rev 1.1)
+    r'\(v[\d\.]+[a-z]?\)',      # (v1.0), (v1.1), (v2.0a)
+    r'\(Ver\.?\s*[\d\.]+\)',   # (Ver 1.0), (Ver. 2.0)
+    r'\(Version\s*[\d\.]+\)',  # (Version 1.0)
+    r'\[!\]',                    # Good dump indicator
+    r'\[a\d?\]',                 # Alternate version [a], [a1]
+    r'\[b\d?\]',                 # Bad dump [b], [b1]
+    r'\[c\]',                    # Cracked
+    r'\[f\d?\]',                 # Fixed [f], [f1]
+    r'\[h\d*[A-Za-z]*\]',        # Hack indicators
+    r'\[o\d?\]',                 # Overdump
+    r'\[p\d?\]',                 # Pirate
+    r'\[t\d?\]',                 # Trained/Trainer
+    r'\[T[+-][A-Za-z]+[^\]]*\]', # Translation [T+Eng], [T-Spa]
+    r'\(NTSC\)',
+    r'\(NTSC-U\)',
+    r'\(NTSC-J\)',
+    r'\(PAL\)',
+    r'\(SECAM\)',
+    r'\(\d{4}-\d{2}-\d{2}\)',   # Date stamps (2001-12-25)
+    r'\(\d{8}\)',                # Date stamps (20011225)
+    r'\(Unl\)',                  # Unlicensed
+]
+
+
+def _literal_tag(pattern):
+    """Plain text a pattern matches if it has no regex syntax beyond escaped brackets, else None"""
+    text = re.sub(r'\\([()\[\]])', r'\1', pattern)
+    if any(c in '\\.^$*+?{}[]|()' for c in re.sub(r'\\[()\[\]]', '', pattern)):
+        return None
+    return text
+
+
+# Applied in list order. Plain tags like "(USA)" or "[!]" carry their lowercase
+# text so the caller can skip the regex with a substring test when the tag
+# isn't in the name, which is the common case for most of the list.
+CLEAN_NAMES_REMOVE_STEPS = []
+for _pattern in CLEAN_NAMES_REMOVE_PATTERNS:
+    _literal = _literal_tag(_pattern)
+    CLEAN_NAMES_REMOVE_STEPS.append((_literal.lower() if _literal is not None else None,
+                                     re.compile(_pattern, re.IGNORECASE)))
+del _pattern, _literal
+
+# Clean ROM Names dialog: the wider region/language word list for multi-region tags
+CLEAN_NAMES_REGION_WORDS = [
+    'USA', 'Europe', 'Japan', 'Asia', 'World', 'Korea', 'Australia',
+    'France', 'Germany', 'Spain', 'Italy', 'Netherlands', 'Sweden',
+    'Norway', 'Denmark', 'Finland', 'Portugal', 'Brazil', 'Russia',
+    'China', 'Taiwan', 'Hong Kong', 'Canada', 'UK', 'America',
+    'En', 'Fr', 'De', 'Es', 'It', 'Ja', 'Ko', 'Zh', 'Pt', 'Ru', 'Nl',
+    'English', 'French', 'German', 'Spanish', 'Italian', 'Japanese',
+    'U', 'E', 'J', 'A', 'K', 'W', 'G', 'F', 'S', 'I',
+    'EU', 'JP', 'KR', 'AU', 'Br', 'Cn', 'Tw', 'HK', 'Dk', 'Fi', 'No', 'Sv', 'Sw'
+]
+_clean_names_region_alt = '|'.join(re.escape(r) for r in CLEAN_NAMES_REGION_WORDS)
+# Matches "(Region1, Region2, ...)" with 2+ regions
+CLEAN_NAMES_MULTI_REGION_RE = re.compile(
+    r'\(\s*(?:' + _clean_names_region_alt + r')(?:\s*,\s*(?:' + _clean_names_region_alt + r'))+\s*\)',
+    re.IGNORECASE)
+
 # Supported PS2 output formats
 PS2_OUTPUT_FORMATS = ['CHD', 'CSO', 'ZSO']
 
@@ -117,6 +464,9 @@ PS2_EMULATOR_RECOMMENDATIONS = {
     'AetherSX2': 'CHD',    # Mobile-friendly; CHD generally better than CSO
     'OPL (PS2)': 'ZSO',    # OPL supports ZSO; good size savings with low CPU hit
 }
+# The same, limited to formats we can write (checked once here, not per selection)
+PS2_RECOMMENDED_FORMAT = {emulator: fmt for emulator, fmt in PS2_EMULATOR_RECOMMENDATIONS.items()
+                          if fmt in PS2_OUTPUT_FORMATS}
 
 # Theme presets for different PlayStation eras
 THEME_PRESETS = {
@@ -178,17 +528,523 @@ THEME_PRESETS = {
     },
 }
 
-# Active colors (will be set from selected theme)
-COLORS = dict(THEME_PRESETS['PS2'])
+# Freeze each preset into an immutable Theme so palettes can be shared
+# (attribute access, no per-switch copying of nested dicts)
+Theme = namedtuple('Theme', THEME_PRESETS['PS2'].keys())
+THEME_PRESETS = {name: Theme(**values) for name, values in THEME_PRESETS.items()}
+
+
+def parse_progress_percent(line):
+    """Return the first "NN.N%" value in a line of tool output (bytes), or None"""
+    idx = line.find(b'%')
+    while idx >= 0:
+        start = idx
+        while start > 0 and line[start - 1] in b'0123456789.':
+            start -= 1
+        if start < idx:
+            try:
+                return float(line[start:idx])
+            except ValueError:
+                pass
+        idx = line.find(b'%', idx + 1)
+    return None
+
+
+@functools.lru_cache(maxsize=8192)
+def clean_rom_name(filename):
+    """Clean a ROM filename by removing unwanted tags while preserving important ones.
+    
+    Pure function of the name, so results are memoised (duplicate titles,
+    multi-disc sets and repeated dialog passes hit the cache).
+    """
+    name = filename
+    
+    # Every tag pattern needs a bracket; untagged names only need the space cleanup
+    if '(' not in name and '[' not in name:
+        return ' '.join(name.split()).replace(' .', '.')
+    
+    # Extract tags to keep
+    preserved_tags = []
+    for pattern in CLEAN_KEEP_RES:
+        preserved_tags.extend(pattern.findall(name))
+    
+    # Remove multi-region and other unwanted tags, pattern by pattern; names
+    # with none of them (the union finds no match) skip all the passes
+    if CLEAN_REMOVE_RE.search(name):
+        name = CLEAN_MULTI_REGION_RE.sub('', name)
+        for pattern in CLEAN_REMOVE_RES:
+            name = pattern.sub('', name)
+    
+    # Remove 2-3 letter codes in parentheses (separate pass: its lookahead
+    # depends on the tags after it already being gone)
+    name = SHORT_TAG_RE.sub('', name)
+    
+    # Clean up spaces (split/join collapses runs and trims the ends)
+    name = ' '.join(name.split())
+    name = name.replace(' .', '.')
+    
+    return name
+
+
+@functools.lru_cache(maxsize=8192)
+def clean_rom_name_extended(filename):
+    """Clean ROM Names dialog variant of clean_rom_name with wider region/language lists.
+    
+    Also a pure function of the name, so rescans and repeated passes hit the cache.
+    """
+    name = filename
+    
+    # Every tag pattern needs a bracket; untagged names only need the space cleanup
+    if '(' not in name and '[' not in name:
+        return ' '.join(name.split()).replace(' .', '.')
+    
+    # Extract tags to keep
+    preserved_tags = []
+    for pattern in CLEAN_NAMES_KEEP_RES:
+        preserved_tags.extend(pattern.findall(name))
+    
+    # Multi-region/multi-language combined tags (e.g., "(USA, Europe, Asia)"),
+    # matched by a regex compiled once at module load
+    name = CLEAN_NAMES_MULTI_REGION_RE.sub('', name)
+    
+    # Remove the unwanted tags. Plain tags are only handed to the regex
+    # when their text is present (checked on the lowercased name; names
+    # with non-ASCII characters always take the regex path since their
+    # case folding can differ from re.IGNORECASE).
+    ascii_name = name.isascii()
+    low = name.lower()
+    for literal, tag_re in CLEAN_NAMES_REMOVE_STEPS:
+        if literal is not None and ascii_name and literal not in low:
+            continue
+        stripped = tag_re.sub('', name)
+        if stripped != name:
+            name = stripped
+            low = name.lower()
+    
+    # Also remove any parentheses containing just 2-3 letter codes that weren't caught
+    # but avoid removing preserved tags
+    name = SHORT_TAG_RE.sub('', name)
+    
+    # Clean up multiple and leading/trailing spaces
+    name = ' '.join(name.split())
+    
+    # Clean up spaces before file extension (only single spaces remain)
+    name = name.replace(' .', '.')
+    
+    return name
+
+
+# FILE "<name>" BINARY lines of a CUE sheet (matched on the raw bytes), and
+# the track tag of such a name
+CUE_FILE_RE = re.compile(rb'FILE\s+"([^"]+)"\s+BINARY', re.IGNORECASE)
+CUE_TRACK_RE = re.compile(r'(Track\s*\d+|\(Track\s*\d+\))', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=512)
+def _cue_bin_names(path, mtime_ns, size):
+    # Only the matched names are decoded, not the whole sheet; they stay UTF-8
+    # since BIN names aren't always ASCII
+    with open(path, 'rb') as f:
+        return tuple(name.decode('utf-8', errors='ignore')
+                     for name in CUE_FILE_RE.findall(f.read()))
+
+
+def cue_bin_names(cue_path):
+    """BIN file names a CUE sheet references, in order.
+    
+    Cached on the file's mtime and size, so the scan, size estimate, convert
+    and cleanup steps don't each re-read the same sheet.
+    """
+    st = os.stat(cue_path)
+    return _cue_bin_names(os.fspath(cue_path), st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=None)
+def dir_mtime_tracks_changes(volume):
+    """Whether a folder's mtime changes when entries are added/removed on volume.
+    
+    Windows doesn't update it on FAT/exFAT (common on SD cards and USB sticks),
+    so cached folder listings can't be validated there.
+    """
+    if sys.platform != 'win32':
+        return True
+    import ctypes
+    fs_name = ctypes.create_unicode_buffer(64)
+    ok = ctypes.windll.kernel32.GetVolumeInformationW(
+        volume, None, 0, None, None, None, fs_name, len(fs_name))
+    return bool(ok) and fs_name.value.upper() not in ('FAT', 'FAT32', 'EXFAT')
+
+
+def native_binary_signature_ok(path, min_size=500_000):
+    """Cheap check that a downloaded tool is a native executable of plausible size"""
+    try:
+        with open(path, 'rb') as fh:
+            head = fh.read(4)
+        size = os.path.getsize(path)
+    except OSError:
+        return False
+    if sys.platform == "win32":
+        magic_ok = head[:2] == b'MZ'
+    elif sys.platform == "darwin":
+        magic_ok = head in (b'\xcf\xfa\xed\xfe', b'\xca\xfe\xba\xbe')  # Mach-O 64-bit / universal
+    else:
+        magic_ok = head == b'\x7fELF'
+    return magic_ok and size > min_size
+
+
+# Linux ioctl that makes a file share another file's extents (btrfs/XFS reflink)
+FICLONE = 0x40049409
+
+# shutil's read/write chunk for copies it can't hand to the kernel (64 KiB by
+# default off Windows). ROMs are large and often live on NAS/USB storage,
+# where bigger chunks mean far fewer round trips.
+if hasattr(shutil, 'COPY_BUFSIZE'):
+    shutil.COPY_BUFSIZE = max(shutil.COPY_BUFSIZE, 1024 * 1024)
+
+
+def _reflink_file(fsrc, fdst):
+    """Clone fsrc's extents into fdst (FICLONE); raises OSError where unsupported"""
+    import fcntl
+    fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+
+
+def _copy_file_range_all(fsrc, fdst):
+    """Copy a whole file with os.copy_file_range; the kernel moves the data.
+    
+    Lets NFS/SMB do a server-side copy and some filesystems share extents.
+    Raises OSError if the kernel or filesystem can't do it.
+    """
+    remaining = os.fstat(fsrc.fileno()).st_size
+    while remaining > 0:
+        copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+        if copied == 0:
+            # Some filesystems return 0 instead of failing; don't leave a short copy
+            raise OSError(errno.EIO, "copy_file_range stopped early", fsrc.name)
+        remaining -= copied
+
+
+def copy_file_cow(src, dst, exclusive=False):
+    """Copy src to dst, as a copy-on-write clone when the filesystem supports it.
+    
+    A reflink only writes metadata, so backing up a multi-GB ROM is instant on
+    btrfs/XFS. Failing that, Linux gets os.copy_file_range (server-side copy on
+    network shares); anywhere else (or if both fail) this is shutil.copy2.
+    With exclusive=True an existing dst is left alone and FileExistsError is
+    raised, which replaces a separate exists() check (and its race).
+    """
+    dst_mode = 'xb' if exclusive else 'wb'
+    if sys.platform.startswith('linux'):
+        methods = [_reflink_file]
+        if hasattr(os, 'copy_file_range'):
+            methods.append(_copy_file_range_all)
+        for copy_data in methods:
+            created = False
+            try:
+                with open(src, 'rb') as fsrc, open(dst, dst_mode) as fdst:
+                    created = True
+                    copy_data(fsrc, fdst)
+                shutil.copystat(src, dst)
+                return
+            except OSError:
+                if not created:
+                    raise  # src unreadable or dst already exists (exclusive)
+                try:
+                    os.unlink(dst)
+                except OSError:
+                    pass
+    if exclusive:
+        # Claim the name first; copy2 then fills in the file we created
+        open(dst, 'xb').close()
+    shutil.copy2(src, dst)
+
+
+def move_file(src, dst):
+    """Move a file: an atomic rename on the same filesystem, else clone/copy + delete.
+    
+    Cross-device moves go through copy_file_cow, so btrfs subvolumes (separate
+    st_dev, same filesystem) still get a reflink instead of a byte copy.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        copy_file_cow(src, dst)
+        src_size = os.stat(src).st_size
+        dst_size = os.stat(dst).st_size
+        if dst_size != src_size:
+            raise OSError(errno.EIO, f"Copy is {dst_size} bytes, source is {src_size}; source kept", dst)
+        os.unlink(src)
+
+
+def _delete_file(path):
+    """Unlink path (already gone counts as deleted); returns the OSError or None"""
+    try:
+        try:
+            os.unlink(path)
+        except PermissionError:
+            if sys.platform != 'win32':
+                raise
+            # Windows refuses to delete read-only files; clear the attribute
+            os.chmod(path, stat.S_IWRITE)
+            os.unlink(path)
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        return e
+    return None
+
+
+def delete_files(paths, max_workers=4):
+    """Delete paths a few at a time; returns [(path, OSError or None)] in order.
+    
+    Deletes are metadata writes that the filesystem journals one by one, so
+    overlapping them cuts the wall time of clearing out many archives.
+    """
+    if len(paths) <= 1:
+        return [(path, _delete_file(path)) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(zip(paths, executor.map(_delete_file, paths)))
+
+
+# Read/write chunk when streaming archive members to disk. extractall()
+# copies through zipfile's/tarfile's small default buffers.
+EXTRACT_CHUNK_SIZE = 1 << 20
+
+
+# Characters NTFS doesn't allow in a file name; zipfile maps them to '_'
+WINDOWS_NAME_TABLE = str.maketrans(':<>|"?*', '_______')
+
+
+def _safe_member_path(root, name):
+    """Where archive member name goes under root, or None if it would escape root.
+    
+    Absolute, drive-qualified and '..' names are refused. On Windows the name
+    is cleaned up the way zipfile's extract() does: characters NTFS doesn't
+    allow become '_' and trailing dots are dropped (a ':' would otherwise
+    open an alternate data stream).
+    """
+    name = name.replace('/', os.sep)
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+    if os.path.splitdrive(name)[0] or os.path.isabs(name):
+        return None
+    parts = [part for part in name.split(os.sep) if part not in ('', os.curdir)]
+    if os.pardir in parts:
+        return None
+    if os.sep == '\\':
+        parts = [part.translate(WINDOWS_NAME_TABLE).rstrip('.') for part in parts]
+        parts = [part for part in parts if part]
+    return os.path.join(root, *parts)
+
+
+def _write_member(src, target, made_dirs):
+    """Stream one archive member to target, creating each parent dir once"""
+    parent = os.path.dirname(target)
+    if parent not in made_dirs:
+        os.makedirs(parent, exist_ok=True)
+        made_dirs.add(parent)
+    with open(target, 'wb') as dst:
+        shutil.copyfileobj(src, dst, EXTRACT_CHUNK_SIZE)
+
+
+def extract_zip_streaming(zip_ref, dest):
+    """Extract every member of an open ZipFile into dest with 1 MiB copies.
+    
+    Returns the names of members skipped because they would land outside dest.
+    """
+    root = os.path.abspath(dest)
+    made_dirs = {root}
+    skipped = []
+    for zinfo in zip_ref.infolist():
+        target = _safe_member_path(root, zinfo.filename)
+        if target is None:
+            skipped.append(zinfo.filename)
+            continue
+        if zinfo.is_dir():
+            os.makedirs(target, exist_ok=True)
+            made_dirs.add(target)
+            continue
+        if target == root:
+            continue
+        with zip_ref.open(zinfo) as src:
+            _write_member(src, target, made_dirs)
+    return skipped
+
+
+def extract_tar_streaming(tar_ref, dest):
+    """Extract the directories and regular files of an open TarFile into dest.
+    
+    Links and device nodes are skipped; ROM archives don't need them and they
+    are the usual way a tarball writes outside its folder. Returns the names
+    of members skipped because they would land outside dest.
+    """
+    root = os.path.abspath(dest)
+    made_dirs = {root}
+    skipped = []
+    for member in tar_ref:
+        target = _safe_member_path(root, member.name)
+        if target is None:
+            skipped.append(member.name)
+        elif member.isdir():
+            os.makedirs(target, exist_ok=True)
+            made_dirs.add(target)
+        elif member.isfile() and target != root:
+            src = tar_ref.extractfile(member)
+            with src:
+                _write_member(src, target, made_dirs)
+            os.utime(target, (member.mtime, member.mtime))
+    return skipped
+
+
+def zip_has_member_suffix(path, suffixes):
+    """Scan a zip's central directory for a member name ending in one of suffixes.
+    
+    suffixes is a tuple of lowercase bytes. Only the end-of-central-directory
+    record and the central directory are read; no ZipInfo objects are built
+    and names aren't decoded, and the scan stops at the first hit. Raises
+    ValueError for layouts it doesn't handle (Zip64, damaged archives) so the
+    caller can fall back to zipfile.
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        file_size = f.tell()
+        tail_size = min(file_size, 22 + 65535)  # EOCD record + maximum comment
+        f.seek(file_size - tail_size)
+        tail = f.read(tail_size)
+        eocd = tail.rfind(b'PK\x05\x06')
+        if eocd < 0 or len(tail) - eocd < 22:
+            raise ValueError("no end of central directory record")
+        entries, cd_size, cd_offset = struct.unpack_from('<HII', tail, eocd + 10)
+        if entries == 0xFFFF or cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF:
+            raise ValueError("zip64 archive")
+        # Measure back from the EOCD so data prepended to the zip doesn't matter
+        cd_start = file_size - tail_size + eocd - cd_size
+        if cd_start < 0:
+            raise ValueError("bad central directory size")
+        f.seek(cd_start)
+        directory = f.read(cd_size)
+    
+    pos = 0
+    while pos + 46 <= len(directory):
+        if directory[pos:pos + 4] != b'PK\x01\x02':
+            raise ValueError("bad central directory entry")
+        name_len, extra_len, comment_len = struct.unpack_from('<HHH', directory, pos + 28)
+        name = directory[pos + 46:pos + 46 + name_len]
+        if name.lower().endswith(suffixes):
+            return True
+        pos += 46 + name_len + extra_len + comment_len
+    return False
+
+
+def json_dumps_bytes(obj, indent=True):
+    """Serialize to JSON bytes, indented unless indent=False (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2) if indent else orjson.dumps(obj)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads_bytes(data):
+    """Parse JSON bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# External tools looked up on PATH; all of them are found in a single pass
+PATH_TOOL_NAMES = ('chdman', '7z', 'peazip', 'maxcso')
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_path_for_tools(path_env):
+    """Find every PATH_TOOL_NAMES entry with one os.scandir per PATH directory.
+    
+    Like shutil.which, the first directory containing an executable wins.
+    """
+    if sys.platform == "win32":
+        extensions = [''] + os.environ.get('PATHEXT', '.COM;.EXE;.BAT;.CMD').lower().split(os.pathsep)
+    else:
+        extensions = ['']
+    wanted = {name + ext: name for name in PATH_TOOL_NAMES for ext in extensions}
+    found = {}
+    for directory in path_env.split(os.pathsep):
+        if not directory:
+            continue
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    entry_name = entry.name.lower() if sys.platform == "win32" else entry.name
+                    tool = wanted.get(entry_name)
+                    if tool and tool not in found:
+                        try:
+                            if entry.is_file() and os.access(entry.path, os.X_OK):
+                                found[tool] = entry.path
+                        except OSError:
+                            continue
+        except OSError:
+            continue
+        if len(found) == len(PATH_TOOL_NAMES):
+            break
+    return found
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_which(name, path_env):
+    return shutil.which(name, path=path_env)
+
+
+def which_cached(name):
+    """shutil.which, memoised per PATH value so repeated tool checks don't re-walk PATH"""
+    path_env = os.environ.get('PATH', os.defpath)
+    if name in PATH_TOOL_NAMES:
+        return _scan_path_for_tools(path_env).get(name)
+    return _cached_which(name, path_env)
+
+
+@functools.lru_cache(maxsize=1)
+def find_seven_zip_installs():
+    """Return (path, label) for the common 7-Zip install locations that exist (cached).
+    
+    Each Program Files root is listed once with os.scandir rather than
+    probing every candidate path on its own.
+    """
+    found = []
+    for root in SEVEN_ZIP_INSTALL_ROOTS:
+        try:
+            with os.scandir(root) as it:
+                app_dirs = {entry.name.lower(): entry.path for entry in it if entry.is_dir()}
+        except OSError:
+            continue
+        for app_name, layouts in SEVEN_ZIP_APP_LAYOUTS:
+            app_dir = app_dirs.get(app_name)
+            if not app_dir:
+                continue
+            for relative_path, label in layouts:
+                candidate = os.path.join(app_dir, relative_path)
+                if os.path.isfile(candidate):
+                    found.append((candidate, f"{label} ({os.path.basename(root)})"))
+    if os.path.isfile(SEVEN_ZIP_SCOOP_PATH):
+        found.append((SEVEN_ZIP_SCOOP_PATH, "7-Zip (Scoop)"))
+    return tuple(found)
+
+
+def clear_tool_discovery_cache():
+    """Forget cached tool lookups (after a download or manual browse)"""
+    _scan_path_for_tools.cache_clear()
+    _cached_which.cache_clear()
+    find_seven_zip_installs.cache_clear()
 
 
 class ROMConverter:
     def __init__(self, master):
         self.master = master
+        self.colors = THEME_PRESETS['PS2']  # Active theme (replaced by set_theme_colors)
         master.title("⚡ ROM CONVERTER ⚡")
         master.geometry("900x1200")
         master.resizable(True, True)
-        master.configure(bg=COLORS['bg_dark'])
+        master.configure(bg=self.colors.bg_dark)
         
         # Maximize window on startup (cross-platform)
         try:
@@ -214,6 +1070,9 @@ class ROMConverter:
             self.script_dir = Path(__file__).parent.resolve()
             self.bundle_dir = self.script_dir
         
+        # App folder as a string prefix (with trailing separator) for _make_portable_path
+        self._script_dir_prefix = os.path.join(str(self.script_dir), '')
+        
         self.config_candidates = [
             self.script_dir / ".rom_converter_config.json",
             Path.home() / ".rom_converter_config.json"
@@ -226,6 +1085,8 @@ class ROMConverter:
         self.move_to_backup = BooleanVar(value=True)
         self.recursive = BooleanVar(value=True)
         self.is_converting = False
+        self.convert_delete_originals = False
+        self.convert_move_to_backup = False
         # Keep one CPU core free for system responsiveness
         total_cores = multiprocessing.cpu_count()
         self.cpu_cores = max(1, total_cores - 1)
@@ -234,14 +1095,18 @@ class ROMConverter:
         self.ram_threshold_percent = 80  # Throttle if RAM usage exceeds this
         self.ram_critical_percent = 85  # Pause new conversions if RAM exceeds this
         self.ram_hard_limit_percent = 92  # Absolute max - force wait if exceeded
+        self.gc_rss_growth_bytes = 512 * 1024 * 1024  # Run a full gc once our RSS grows this much
+        self._gc_rss_baseline = None
         self.cpu_threshold_percent = 95  # Throttle if CPU usage exceeds this
         self.disk_write_throttle_mb_s = 500  # Throttle disk writes if exceeding this rate (MB/s) - raised for NVMe
+        self.strict_tool_verify = False  # Also run downloaded tools (--help) instead of just checking the file
         self.disk_io_check_interval = 0.5  # How often to check disk I/O (seconds)
         self.last_disk_throttle_check = 0  # Timestamp of last disk throttle check
         self.chdman_max_processors = self._detect_chdman_processors()  # Auto-detect based on RAM
         self.maxcso_threads = self._detect_maxcso_threads()  # Auto-detect based on CPU/RAM
         self.conversion_semaphore = None  # Will be initialized when conversions start
-        self.log_queue = Queue()
+        self.log_queue = deque()  # Pending log lines, drained in batches by process_log_queue
+        self.log_lock = pythread.Lock()
         self.total_original_size = 0
         self.total_chd_size = 0
         self.process_ps1_cues = BooleanVar(value=False)  # Toggle for PS1 CUE processing
@@ -274,19 +1139,28 @@ class ROMConverter:
         # Metrics / ETA tracking
         self.total_jobs = 0
         self.completed_jobs = 0
-        self.file_start_times = {}
-        self.file_durations = []
+        self.file_start_times = {}  # Written by workers; single dict stores are atomic
+        self.file_durations = deque(maxlen=1024)  # Rolling window for the average/ETA
         self.conversion_start_time = None
         self.initial_disk_write_bytes = 0
         self.last_disk_write_bytes = 0
         self.metrics_running = False
-        self.metrics_lock = pythread.Lock()
         self.last_ui_update = 0  # Throttle UI updates
         self.chdman_path = None  # Will store path to chdman executable
+        self.chdman_version_cache = {}  # (path, size, mtime_ns) -> parsed chdman version
+        self.tool_cache = {}  # download URL -> {'etag', 'last_modified', 'path'} for conditional GETs
+        self.tool_verify_cache = {}  # (path, size, mtime_ns) -> (True, unix time checked); passes only
+        self._save_after_id = None  # Pending debounced save_config (see schedule_save_config)
+        self._last_saved_config = None  # Bytes of the last config write, to skip identical rewrites
         self.build_timestamp = self.get_build_timestamp()
         
         # Progress tracking for crash recovery
-        self.progress_file = self.script_dir / ".rom_converter_progress.json"
+        self.progress_file = self.script_dir / ".rom_converter_progress.json"  # Batch header
+        self.progress_list_file = self.script_dir / ".rom_converter_progress.txt"  # One completed path per line
+        self.scan_cache_file = self.script_dir / ".rom_converter_scan_cache.json"
+        self._scan_cache = None  # folder -> [mtime_ns, file names, subfolder names]; loaded on first scan
+        self._scan_cache_lock = pythread.Lock()
+        self.progress_lock = pythread.Lock()
         self.completed_files = set()  # Track completed conversions
         self.current_batch_id = None
         
@@ -296,6 +1170,7 @@ class ROMConverter:
 
         # Apply theme colors before UI construction
         self.set_theme_colors(self.current_theme)
+        self._applied_theme = None  # Theme apply_theme last painted (skips re-applying the same one)
         self.init_fonts()
         
         # Check for 7-Zip (for .7z and .rar support)
@@ -326,6 +1201,7 @@ class ROMConverter:
             
             if response is True:  # Yes - download
                 if self.download_mame_tools():
+                    clear_tool_discovery_cache()
                     if not self.check_chdman():
                         messagebox.showerror("Error", "Failed to find chdman after download", parent=master)
                         master.destroy()
@@ -346,6 +1222,13 @@ class ROMConverter:
             self.check_for_chdman_update()
         
         self.setup_ui()
+        
+        # Write any debounced config change before the window goes away
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
+
+    def _on_close(self):
+        self.flush_pending_save()
+        self.master.destroy()
 
     def get_build_timestamp(self):
         """Return build timestamp for About dialog."""
@@ -371,20 +1254,14 @@ class ROMConverter:
         # Determine platform-specific binary name
         chdman_name = "chdman.exe" if sys.platform == "win32" else "chdman"
         
-        # First check bundled resources (PyInstaller)
-        bundled_chdman = self.bundle_dir / chdman_name
-        if bundled_chdman.exists():
-            self.chdman_path = str(bundled_chdman)
-            return True
-        
-        # Then check for chdman directly next to the executable/script
-        direct_chdman = self.script_dir / chdman_name
-        if direct_chdman.exists():
-            self.chdman_path = str(direct_chdman)
+        # Check bundled resources (PyInstaller), then next to the executable/script
+        local_chdman = self._find_local_tool(chdman_name)
+        if local_chdman:
+            self.chdman_path = local_chdman
             return True
         
         # Check PATH as fallback
-        chdman = shutil.which("chdman")
+        chdman = which_cached("chdman")
         if chdman:
             self.chdman_path = chdman
             return True
@@ -398,6 +1275,21 @@ class ROMConverter:
         
         return False
     
+    def _find_local_tool(self, tool_name):
+        """Return the tool's path if it is bundled or sits next to the app, else None.
+        
+        One os.stat per folder; the folders are only checked once when the
+        bundle and app directories are the same.
+        """
+        for folder in dict.fromkeys((str(self.bundle_dir), str(self.script_dir))):
+            candidate = os.path.join(folder, tool_name)
+            try:
+                os.stat(candidate)
+            except OSError:
+                continue
+            return candidate
+        return None
+    
     def _find_flatpak_chdman(self):
         """Search for chdman inside Flatpak MAME installations"""
         import glob
@@ -499,30 +1391,85 @@ class ROMConverter:
         if not self.chdman_path:
             return None
         
+        # The binary's version only changes when the file does
+        try:
+            st = os.stat(self.chdman_path)
+            cache_key = (self.chdman_path, st.st_size, st.st_mtime_ns)
+        except OSError:
+            cache_key = None
+        if cache_key in self.chdman_version_cache:
+            return self.chdman_version_cache[cache_key]
+        
+        version = None
         try:
             result = subprocess.run(
                 [self.chdman_path, '--version'],
-                capture_output=True, text=True, timeout=10
+                capture_output=True, timeout=10,
+                stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS
             )
             # Output typically like: "chdman - MAME Compressed Hunks of Data (CHD) manager 0.271 (mame0271)"
             # or "chdman - MAME ... 0.283 (mame0283)"
-            output = result.stdout + result.stderr
+            output = (result.stdout + result.stderr).decode('ascii', 'replace')
             
             # Look for version pattern like "0.283" or "(mame0283)"
-            version_match = re.search(r'\(mame(\d{4})\)', output)
-            if version_match:
-                return version_match.group(1)
-            
-            # Alternative: look for version number like "0.283"
-            version_match = re.search(r'(\d+\.\d+)', output)
+            version_match = MAME_TAG_RE.search(output)
             if version_match:
-                ver = version_match.group(1).replace('.', '')
-                return ver.zfill(4)
+                version = version_match.group(1)
+            else:
+                # Alternative: look for version number like "0.283"
+                version_match = DOTTED_VERSION_RE.search(output)
+                if version_match:
+                    version = version_match.group(1).replace('.', '').zfill(4)
                 
         except Exception as e:
             print(f"Error getting chdman version: {e}")
         
-        return None
+        if version and cache_key:
+            self.chdman_version_cache = {cache_key: version}
+            self.save_config()
+        
+        return version
+    
+    def _verify_tool(self, path, tokens, args=('--help',)):
+        """Run a tool once and check its output mentions one of tokens (lowercase).
+        
+        Passing results are remembered per (path, size, mtime_ns) so picking the
+        same binary again doesn't spawn it again. Failures are not: they often
+        come from a missing library or runtime, and the same binary should pass
+        once that is installed. Spawn errors propagate.
+        """
+        # Reject obviously wrong picks before paying for a process spawn
+        if sys.platform == "win32":
+            with open(path, 'rb') as fh:
+                if fh.read(2) != b'MZ':
+                    return False
+        elif not os.access(path, os.X_OK):
+            if not messagebox.askyesno(
+                    "Not Executable",
+                    f"{Path(path).name} is not marked as executable.\n\n"
+                    "Make it executable (chmod +x) and continue?"):
+                return False
+            os.chmod(path, os.stat(path).st_mode | 0o111)
+        
+        try:
+            st = os.stat(path)
+            cache_key = (path, st.st_size, st.st_mtime_ns)
+        except OSError:
+            cache_key = None
+        cached = self.tool_verify_cache.get(cache_key)
+        if cached and time.time() - cached[1] < TOOL_VERIFY_TTL_SECONDS:
+            return cached[0]
+        
+        result = subprocess.run(
+            [path, *args],
+            capture_output=True, timeout=5,
+            stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS
+        )
+        output = (result.stdout + result.stderr).decode('utf-8', 'replace').lower()
+        ok = any(token in output for token in tokens)
+        if cache_key and ok:
+            self.tool_verify_cache[cache_key] = (ok, time.time())
+        return ok
     
     def check_for_chdman_update(self):
         """Check if a newer version of chdman is available"""
@@ -561,26 +1508,171 @@ class ROMConverter:
                 MAME_RELEASE_URL,
                 headers={'User-Agent': 'Mozilla/5.0'}
             )
+            # Stream the page and stop as soon as the version tag shows up
+            # (it's near the top); keep a small tail so matches can span chunks
+            fallback_version = None
+            tail = b''
             with urllib.request.urlopen(req, timeout=30) as response:
-                html = response.read().decode('utf-8')
-            
-            # Look for version pattern like "mame0283" or "MAME 0.283"
-            version_match = re.search(r'mame(\d{4})', html, re.IGNORECASE)
-            if version_match:
-                return version_match.group(1)
+                while True:
+                    chunk = response.read(16384)
+                    window = tail + chunk
+                    
+                    # Look for version pattern like "mame0283"
+                    version_match = MAME_HTML_TAG_RE.search(window)
+                    if version_match:
+                        return version_match.group(1).decode('ascii')
+                    
+                    # Remember the first "MAME 0.283" in case no tag is found;
+                    # a match touching the window end may still be cut off
+                    if fallback_version is None:
+                        version_match = MAME_HTML_VERSION_RE.search(window)
+                        if version_match and (not chunk or version_match.end() < len(window)):
+                            fallback_version = version_match.group(1).decode('ascii')
+                    
+                    if not chunk:
+                        break
+                    tail = window[-64:]
             
-            # Alternative pattern
-            version_match = re.search(r'MAME\s+(\d+\.\d+)', html)
-            if version_match:
+            if fallback_version:
                 # Convert 0.283 to 0283
-                ver = version_match.group(1).replace('.', '')
-                return ver.zfill(4)
+                return fallback_version.replace('.', '').zfill(4)
             
         except Exception as e:
             print(f"Error fetching MAME version: {e}")
         
         return None
     
+    def run_in_background(self, worker, on_status=None):
+        """Run a blocking job (e.g. an HTTP download) off the Tk thread.
+        
+        worker(post_status) runs on a daemon thread; post_status(text) queues a
+        status line that is handed to on_status on the Tk thread. The Tk event
+        loop keeps running (nested via wait_variable) until the worker ends, so
+        progress bars keep animating. Returns the worker's result or re-raises
+        its exception.
+        """
+        updates = Queue()
+        finished = BooleanVar(master=self.master, value=False)
+        outcome = {}
+        
+        def run():
+            try:
+                outcome['result'] = worker(lambda text: updates.put(text))
+            except BaseException as e:
+                outcome['error'] = e
+            finally:
+                updates.put(None)
+        
+        def drain():
+            try:
+                while True:
+                    text = updates.get_nowait()
+                    if text is None:
+                        finished.set(True)
+                        return
+                    if on_status:
+                        on_status(text)
+            except Empty:
+                pass
+            self.master.after(100, drain)
+        
+        threading.Thread(target=run, daemon=True).start()
+        self.master.after(100, drain)
+        self.master.wait_variable(finished)
+        
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+    
+    def download_to_file(self, url, dest_path, timeout=60, user_agent='ROM-Converter', connection=None,
+                         cached_path=None, progress=None):
+        """Stream a URL to disk in 1MB chunks (constant memory, no full-body buffer).
+        
+        Pass an open http.client connection to the URL's host to reuse it
+        (keep-alive) across several downloads; anything other than a plain
+        200, or a connection error (e.g. the server closed the idle socket),
+        falls back to urllib, which handles redirects and errors.
+        
+        If an earlier download of this URL to the same path is still on disk,
+        a conditional GET is sent using its ETag/Last-Modified. Returns False
+        when the server answers 304 Not Modified (existing file kept), True
+        when a new body was written. cached_path names the file the download
+        ends up as when the caller moves it into place afterwards.
+        
+        dest_path may also be a writable binary file object (e.g. io.BytesIO)
+        to keep a small download in memory; those are never cached.
+        
+        progress(done_bytes, total_bytes) is called after every chunk (total
+        is 0 when the server sends no Content-Length).
+        """
+        in_memory = hasattr(dest_path, 'write')
+        final_path = None if in_memory else str(cached_path or dest_path)
+        headers = {'User-Agent': user_agent}
+        cached = self.tool_cache.get(url) if final_path else None
+        if cached and cached.get('path') == final_path and os.path.isfile(final_path):
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        def copy_body(response, f):
+            if not progress:
+                shutil.copyfileobj(response, f, length=1024 * 1024)
+                return
+            total = int(response.headers.get('Content-Length') or 0)
+            done = 0
+            while True:
+                chunk = response.read(1024 * 1024)
+                if not chunk:
+                    break
+                f.write(chunk)
+                done += len(chunk)
+                progress(done, total)
+        
+        def save_body(response):
+            if in_memory:
+                copy_body(response, dest_path)
+                return
+            with open(dest_path, 'wb') as f:
+                copy_body(response, f)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self.tool_cache[url] = {'etag': etag, 'last_modified': last_modified,
+                                        'path': final_path}
+            else:
+                self.tool_cache.pop(url, None)
+        
+        if connection is not None:
+            parts = urllib.parse.urlsplit(url)
+            path = parts.path + ('?' + parts.query if parts.query else '')
+            try:
+                connection.request('GET', path, headers=headers)
+                response = connection.getresponse()
+                if response.status == 200:
+                    save_body(response)
+                    return True
+                response.read()  # Drain so the connection stays usable
+                if response.status == 304:
+                    return False
+            except (http.client.HTTPException, OSError):
+                # Drop the broken socket (the next request reconnects) and
+                # start the body over through urllib
+                connection.close()
+                if in_memory:
+                    dest_path.seek(0)
+                    dest_path.truncate()
+        
+        req = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                save_body(response)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return False
+            raise
+        return True
+    
     def download_mame_tools(self):
         """Download and extract MAME tools"""
         try:
@@ -632,53 +1724,77 @@ class ROMConverter:
             status_label = Label(progress_window, text="Connecting...")
             status_label.pack()
             
-            progress_window.update()
+            # Coalesce status text changes: only the newest text is drawn,
+            # in one idle callback, whenever the window next processes events
+            pending_status = [None]
             
-            # Try downloading
-            downloaded = False
-            for url in [download_url] + alt_urls:
-                try:
-                    status_label.config(text=f"Trying: {url.split('/')[-1]}")
-                    progress_window.update()
-                    
-                    req = urllib.request.Request(
-                        url,
-                        headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ROM Converter'}
-                    )
-                    
-                    with urllib.request.urlopen(req, timeout=300) as response:
-                        total_size = int(response.headers.get('content-length', 0))
+            def flush_status():
+                text, pending_status[0] = pending_status[0], None
+                if text is not None and status_label.winfo_exists():
+                    status_label.config(text=text)
+            
+            def set_status(text):
+                if pending_status[0] is None:
+                    progress_window.after_idle(flush_status)
+                pending_status[0] = text
+            
+            progress_window.update_idletasks()
+            
+            # Try downloading (on a worker thread so the dialog stays responsive)
+            def fetch(post_status):
+                for url in [download_url] + alt_urls:
+                    try:
+                        post_status(f"Trying: {url.split('/')[-1]}")
                         
-                        with open(download_path, 'wb') as f:
-                            downloaded_size = 0
-                            block_size = 1024 * 1024  # 1MB blocks
+                        req = urllib.request.Request(
+                            url,
+                            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ROM Converter'}
+                        )
+                        
+                        with urllib.request.urlopen(req, timeout=300) as response:
+                            total_size = int(response.headers.get('content-length', 0))
                             
-                            while True:
-                                buffer = response.read(block_size)
-                                if not buffer:
-                                    break
-                                f.write(buffer)
-                                downloaded_size += len(buffer)
+                            with open(download_path, 'wb') as f:
+                                downloaded_size = 0
+                                # Reuse one 8MB buffer for every read
+                                buffer = memoryview(bytearray(8 * 1024 * 1024))
+                                last_update = 0
                                 
-                                if total_size > 0:
-                                    percent = (downloaded_size / total_size) * 100
-                                    mb_downloaded = downloaded_size / (1024 * 1024)
-                                    mb_total = total_size / (1024 * 1024)
-                                    status_label.config(text=f"Downloaded: {mb_downloaded:.1f} / {mb_total:.1f} MB ({percent:.1f}%)")
-                                else:
+                                while True:
+                                    n = response.readinto(buffer)
+                                    if not n:
+                                        break
+                                    f.write(buffer[:n])
+                                    downloaded_size += n
+                                    
+                                    # Throttle progress messages to ~4 per second
+                                    now = time.monotonic()
+                                    if now - last_update < 0.25:
+                                        continue
+                                    last_update = now
+                                    
                                     mb_downloaded = downloaded_size / (1024 * 1024)
-                                    status_label.config(text=f"Downloaded: {mb_downloaded:.1f} MB")
-                                progress_window.update()
-                    
-                    downloaded = True
-                    break
-                    
-                except urllib.error.HTTPError as e:
-                    if e.code == 404:
-                        continue  # Try next URL
-                    raise
-                except Exception:
-                    continue
+                                    if total_size > 0:
+                                        percent = (downloaded_size / total_size) * 100
+                                        mb_total = total_size / (1024 * 1024)
+                                        post_status(f"Downloaded: {mb_downloaded:.1f} / {mb_total:.1f} MB ({percent:.1f}%)")
+                                    else:
+                                        post_status(f"Downloaded: {mb_downloaded:.1f} MB")
+                                
+                                # Always show the final size
+                                post_status(f"Downloaded: {downloaded_size / (1024 * 1024):.1f} MB")
+                        
+                        return True
+                        
+                    except urllib.error.HTTPError as e:
+                        if e.code == 404:
+                            continue  # Try next URL
+                        raise
+                    except Exception:
+                        continue
+                return False
+            
+            downloaded = self.run_in_background(fetch, set_status)
             
             if not downloaded:
                 progress_window.destroy()
@@ -686,18 +1802,24 @@ class ROMConverter:
                 return False
             
             # Extract using 7-Zip or the self-extracting exe
-            status_label.config(text="Extracting chdman.exe...")
-            progress_window.update()
+            set_status("Extracting chdman.exe...")
+            progress_window.update_idletasks()
             
             # The MAME exe is a self-extracting 7z archive
             # We need 7-Zip to extract just chdman.exe, or run with specific args
             extracted = False
             
+            # Try in-process extraction first (no 7-Zip needed)
+            if PY7ZR_AVAILABLE:
+                set_status("Extracting with py7zr...")
+                progress_window.update_idletasks()
+                extracted = self.extract_sfx_member(download_path, 'chdman.exe', self.script_dir)
+            
             # Build list of all possible 7zip paths to try
             seven_zip_paths = []
             
             # Re-check for 7-Zip in case it was installed after app startup
-            if not self.seven_zip_path:
+            if not extracted and not self.seven_zip_path:
                 self.check_7zip()
             
             # Add current path if set
@@ -705,29 +1827,22 @@ class ROMConverter:
                 seven_zip_paths.append(self.seven_zip_path)
             
             # Add all fallback paths
-            fallback_paths = [
-                self.script_dir / "7za.exe",
-                r"C:\Program Files\7-Zip\7z.exe",
-                r"C:\Program Files (x86)\7-Zip\7z.exe",
-                r"C:\Program Files\PeaZip\res\bin\7z\7z.exe",
-                r"C:\Program Files (x86)\PeaZip\res\bin\7z\7z.exe",
-                r"C:\Program Files\PeaZip\res\bin\7z\x64\7z.exe",
-                r"C:\Program Files (x86)\PeaZip\res\bin\7z\x64\7z.exe",
-            ]
-            for path in fallback_paths:
-                path_str = str(path)
-                if path_str not in seven_zip_paths and os.path.exists(path_str):
+            local_7za = self.script_dir / "7za.exe"
+            if str(local_7za) not in seven_zip_paths and local_7za.exists():
+                seven_zip_paths.append(str(local_7za))
+            for path_str, _ in find_seven_zip_installs():
+                if path_str not in seven_zip_paths:
                     seven_zip_paths.append(path_str)
             
             # Also check PATH
-            seven_zip_in_path = shutil.which("7z")
+            seven_zip_in_path = which_cached("7z")
             if seven_zip_in_path and seven_zip_in_path not in seven_zip_paths:
                 seven_zip_paths.append(seven_zip_in_path)
             
             # Auto-download 7-Zip if no paths found
-            if not seven_zip_paths:
-                status_label.config(text="Downloading 7-Zip...")
-                progress_window.update()
+            if not extracted and not seven_zip_paths:
+                set_status("Downloading 7-Zip...")
+                progress_window.update_idletasks()
                 if self.download_7zip():
                     seven_zip_paths.append(self.seven_zip_path)
             
@@ -736,15 +1851,16 @@ class ROMConverter:
                 if extracted:
                     break
                 try:
-                    status_label.config(text=f"Extracting with {Path(sz_path).name}...")
-                    progress_window.update()
+                    set_status(f"Extracting with {Path(sz_path).name}...")
+                    progress_window.update_idletasks()
                     cmd = [
                         sz_path, 'e', str(download_path),
                         '-o' + str(self.script_dir),
                         'chdman.exe',
                         '-y'
                     ]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=120)
+                    result = subprocess.run(cmd, capture_output=True, timeout=120,
+                                            stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS)
                     if result.returncode == 0 and (self.script_dir / "chdman.exe").exists():
                         extracted = True
                         self.seven_zip_path = sz_path  # Remember working path
@@ -755,7 +1871,8 @@ class ROMConverter:
                 # Try running as self-extracting archive with output directory
                 try:
                     cmd = [str(download_path), '-o' + str(temp_dir), '-y']
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                    result = subprocess.run(cmd, capture_output=True, timeout=300,
+                                            stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS)
                     # Move chdman.exe to script directory
                     temp_chdman = temp_dir / "chdman.exe"
                     if temp_chdman.exists():
@@ -796,6 +1913,80 @@ class ROMConverter:
             messagebox.showerror("Error", f"Failed to download MAME tools:\n{e}", parent=self.master)
             return False
     
+    def iter_archive_names(self, archive_path):
+        """Yield member names of a .zip/.7z/.rar archive.
+        
+        Listing stays in-process (zipfile, py7zr, rarfile) where possible;
+        7-Zip is only spawned when the matching library isn't installed. With
+        the 7-Zip fallback each yielded name is a raw listing line, whose
+        filename is the last field.
+        """
+        archive_path = Path(archive_path)
+        ext = archive_path.suffix.lower()
+        if ext == '.zip':
+            with zipfile.ZipFile(archive_path, 'r') as zf:
+                yield from zf.namelist()
+        elif ext == '.7z' and PY7ZR_AVAILABLE:
+            with py7zr.SevenZipFile(archive_path, mode='r') as archive:
+                yield from archive.getnames()
+        elif ext == '.rar' and RARFILE_AVAILABLE:
+            with rarfile.RarFile(archive_path) as archive:
+                yield from archive.namelist()
+        elif ext in ('.7z', '.rar') and self.seven_zip_path:
+            listing = self._seven_zip_listing(archive_path)
+            if listing is not None:
+                encoding = locale.getpreferredencoding(False)
+                for line in listing.splitlines():
+                    yield line.rstrip().decode(encoding, 'replace')
+    
+    def _seven_zip_listing(self, archive_path):
+        """Raw `7z l -ba` stdout as bytes, or None if 7-Zip failed"""
+        cmd = [self.seven_zip_path, 'l', '-ba', str(archive_path)]
+        result = subprocess.run(cmd, capture_output=True, timeout=60,
+                                stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS)
+        return result.stdout if result.returncode == 0 else None
+    
+    def archive_contains(self, archive_path, extensions):
+        """True as soon as any member name ends with one of extensions (lowercase tuple)"""
+        ext = Path(archive_path).suffix.lower()
+        if ext == '.zip':
+            try:
+                return zip_has_member_suffix(archive_path, tuple(e.encode('ascii') for e in extensions))
+            except ValueError:
+                pass  # Zip64 or unusual layout: let zipfile parse it
+        elif ((ext == '.7z' and not PY7ZR_AVAILABLE) or (ext == '.rar' and not RARFILE_AVAILABLE)) \
+                and self.seven_zip_path:
+            # 7-Zip listing: search the raw output for a line ending in one of
+            # the extensions instead of decoding it line by line
+            listing = self._seven_zip_listing(archive_path)
+            if listing is None:
+                return False
+            suffix_re = re.compile(rb'(?:' + b'|'.join(re.escape(e.encode('ascii')) for e in extensions)
+                                   + rb')[ \t\r]*$', re.MULTILINE | re.IGNORECASE)
+            return suffix_re.search(listing) is not None
+        return any(name.lower().endswith(extensions) for name in self.iter_archive_names(archive_path))
+    
+    def extract_sfx_member(self, archive_path, member, dest_dir):
+        """Extract a single file from a (self-extracting) 7z archive using py7zr.
+        
+        Self-extracting .exe files have a PE stub in front of the 7z payload, so
+        the archive is opened at the offset of the 7z signature.
+        """
+        import mmap
+        try:
+            with open(archive_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    offset = mm.find(b'7z\xbc\xaf\x27\x1c')
+                if offset < 0:
+                    return False
+                f.seek(offset)
+                with py7zr.SevenZipFile(f, mode='r') as archive:
+                    archive.extract(path=str(dest_dir), targets=[member])
+            return (Path(dest_dir) / member).exists()
+        except Exception as e:
+            print(f"py7zr extraction error: {e}")
+            return False
+    
     def download_mame_tools_linux(self):
         """Download chdman for Linux systems (SteamOS, etc.)"""
         try:
@@ -828,7 +2019,7 @@ class ROMConverter:
             status_label = Label(progress_window, text="Connecting...", wraplength=400)
             status_label.pack(pady=5)
             
-            progress_window.update()
+            progress_window.update_idletasks()
             
             # Try multiple sources for prebuilt chdman
             download_sources = [
@@ -840,43 +2031,53 @@ class ROMConverter:
             
             downloaded = False
             
-            for source_url, source_type in download_sources:
+            # Direct mirrors are tried in order; each download goes to a part
+            # file so a failed attempt never leaves a truncated chdman behind
+            direct_urls = [url for url, source_type in download_sources if source_type == "direct"]
+            
+            def fetch_first(post_status):
+                part_path = temp_dir / "chdman.part"
+                for url in direct_urls:
+                    try:
+                        changed = self.download_to_file(url, part_path, user_agent='Mozilla/5.0 ROM Converter',
+                                                        cached_path=chdman_dest)
+                        # False means 304: the existing chdman is still current
+                        return part_path if changed else chdman_dest
+                    except Exception as e:
+                        print(f"Download from {url} failed: {e}")
+                return None
+            
+            if direct_urls:
+                status_label.config(text="Trying: direct...")
+                progress_window.update_idletasks()
                 try:
-                    status_label.config(text=f"Trying: {source_type}...")
-                    progress_window.update()
-                    
-                    if source_type == "direct":
-                        # Direct binary download
-                        req = urllib.request.Request(
-                            source_url,
-                            headers={'User-Agent': 'Mozilla/5.0 ROM Converter'}
-                        )
-                        
-                        with urllib.request.urlopen(req, timeout=60) as response:
-                            with open(chdman_dest, 'wb') as f:
-                                f.write(response.read())
-                        
+                    fetched = self.run_in_background(fetch_first)
+                    if fetched and fetched != chdman_dest:
+                        os.replace(fetched, chdman_dest)
+                    if fetched:
                         # Make executable
                         os.chmod(chdman_dest, 0o755)
                         
-                        # Verify it works
-                        result = subprocess.run([str(chdman_dest), '--help'], 
-                                              capture_output=True, timeout=5)
-                        if result.returncode == 0 or b'chdman' in result.stdout or b'chdman' in result.stderr:
+                        # Verify it's a native binary of plausible size; only run it
+                        # when strict verification is switched on in the config
+                        verified = native_binary_signature_ok(chdman_dest)
+                        if verified and self.strict_tool_verify:
+                            result = subprocess.run([str(chdman_dest), '--help'], 
+                                                  capture_output=True, timeout=5,
+                                                  stdin=subprocess.DEVNULL)
+                            verified = result.returncode == 0 or b'chdman' in result.stdout or b'chdman' in result.stderr
+                        if verified:
                             downloaded = True
-                            break
                         else:
                             chdman_dest.unlink(missing_ok=True)
-                            
                 except Exception as e:
-                    print(f"Download from {source_type} failed: {e}")
-                    continue
+                    print(f"Download from direct failed: {e}")
             
             # If direct download failed, try installing MAME via Flatpak
             if not downloaded:
                 try:
                     status_label.config(text="Trying Flatpak install of MAME...")
-                    progress_window.update()
+                    progress_window.update_idletasks()
                     
                     # Check if flatpak is available
                     if shutil.which('flatpak'):
@@ -890,7 +2091,7 @@ class ROMConverter:
                             try:
                                 install_type = '--user' if '--user' in flatpak_cmd else 'system'
                                 status_label.config(text=f"Trying Flatpak install ({install_type})...")
-                                progress_window.update()
+                                progress_window.update_idletasks()
                                 result = subprocess.run(
                                     flatpak_cmd,
                                     capture_output=True, text=True, timeout=300
@@ -947,15 +2148,6 @@ class ROMConverter:
     
     def check_7zip(self):
         """Check if 7-Zip is available (including PeaZip's bundled 7z)"""
-        # Check common locations on Windows
-        common_paths = [
-            r"C:\Program Files\7-Zip\7z.exe",
-            r"C:\Program Files (x86)\7-Zip\7z.exe",
-            # PeaZip bundles 7z.exe
-            r"C:\Program Files\PeaZip\res\bin\7z\7z.exe",
-            r"C:\Program Files (x86)\PeaZip\res\bin\7z\7z.exe",
-        ]
-        
         # Check for our downloaded 7za.exe first
         local_7za = self.script_dir / "7za.exe"
         if local_7za.exists():
@@ -963,13 +2155,13 @@ class ROMConverter:
             return True
         
         # Check PATH for 7z
-        seven_zip = shutil.which("7z")
+        seven_zip = which_cached("7z")
         if seven_zip:
             self.seven_zip_path = seven_zip
             return True
         
         # Check PATH for peazip (in case it's there)
-        peazip = shutil.which("peazip")
+        peazip = which_cached("peazip")
         if peazip:
             # PeaZip's 7z is relative to the peazip executable
             peazip_dir = Path(peazip).parent
@@ -979,10 +2171,10 @@ class ROMConverter:
                 return True
         
         # Check common install locations
-        for path in common_paths:
-            if os.path.exists(path):
-                self.seven_zip_path = path
-                return True
+        installs = find_seven_zip_installs()
+        if installs:
+            self.seven_zip_path = installs[0][0]
+            return True
         
         return False
 
@@ -994,32 +2186,52 @@ class ROMConverter:
         try:
             script_dir = self.script_dir
             temp_dir = script_dir / "temp_7zip"
-            temp_dir.mkdir(exist_ok=True)
             
-            # First download 7zr.exe (minimal 7z extractor)
+            # 7zr.exe (minimal 7z extractor), only needed when py7zr can't do the job
             url_7zr = "https://www.7-zip.org/a/7zr.exe"
             seven_zr_path = temp_dir / "7zr.exe"
             
-            response = requests.get(url_7zr, timeout=30)
-            response.raise_for_status()
-            with open(seven_zr_path, 'wb') as f:
-                f.write(response.content)
-            
             # Download 7-Zip Extra package (contains 7za.exe with full format support)
             url_extra = "https://www.7-zip.org/a/7z2409-extra.7z"
             extra_path = temp_dir / "7z-extra.7z"
             
-            response = requests.get(url_extra, timeout=60)
-            response.raise_for_status()
-            with open(extra_path, 'wb') as f:
-                f.write(response.content)
+            # Downloads run on a worker thread so the UI stays responsive
+            # (one keep-alive HTTPS connection serves both files). The extra
+            # package is small, so it is kept in memory and 7za.exe is pulled
+            # straight out of it with py7zr; 7-Zip itself can't read a .7z
+            # archive from stdin, so the 7zr.exe route still needs it on disk.
+            def fetch(post_status):
+                connection = http.client.HTTPSConnection("www.7-zip.org", timeout=60)
+                try:
+                    extra_data = io.BytesIO()
+                    self.download_to_file(url_extra, extra_data, timeout=60, connection=connection)
+                    if PY7ZR_AVAILABLE:
+                        try:
+                            extra_data.seek(0)
+                            with py7zr.SevenZipFile(extra_data, mode='r') as archive:
+                                archive.extract(path=str(script_dir), targets=['7za.exe'])
+                            if (script_dir / "7za.exe").exists():
+                                return True
+                        except Exception as e:
+                            print(f"py7zr extraction error: {e}")
+                    
+                    temp_dir.mkdir(exist_ok=True)
+                    self.download_to_file(url_7zr, seven_zr_path, timeout=30, connection=connection)
+                    with open(extra_path, 'wb') as f:
+                        f.write(extra_data.getbuffer())
+                    return False
+                finally:
+                    connection.close()
             
-            # Use 7zr.exe to extract 7za.exe from the extra package
-            cmd = [str(seven_zr_path), 'e', str(extra_path), '-o' + str(script_dir), '7za.exe', '-y']
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+            if not self.run_in_background(fetch):
+                # Use 7zr.exe to extract 7za.exe from the extra package
+                cmd = [str(seven_zr_path), 'e', str(extra_path), '-o' + str(script_dir), '7za.exe', '-y']
+                result = subprocess.run(cmd, capture_output=True, timeout=60,
+                                        stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS)
             
             seven_zip_path = script_dir / "7za.exe"
             if seven_zip_path.exists():
+                clear_tool_discovery_cache()
                 self.seven_zip_path = str(seven_zip_path)
                 self.save_config()
                 # Clean up temp files
@@ -1033,6 +2245,7 @@ class ROMConverter:
             fallback_path = script_dir / "7zr.exe"
             shutil.copy(seven_zr_path, fallback_path)
             if fallback_path.exists():
+                clear_tool_discovery_cache()
                 self.seven_zip_path = str(fallback_path)
                 self.save_config()
                 try:
@@ -1050,24 +2263,15 @@ class ROMConverter:
         """Get all detected extractor paths on the system"""
         extractors = []
         
-        # All possible paths to check
-        possible_paths = [
-            (self.script_dir / "7za.exe", "7za.exe (Local)"),
-            (r"C:\Program Files\7-Zip\7z.exe", "7-Zip (Program Files)"),
-            (r"C:\Program Files (x86)\7-Zip\7z.exe", "7-Zip (Program Files x86)"),
-            (r"C:\Program Files\PeaZip\res\bin\7z\7z.exe", "PeaZip 7z"),
-            (r"C:\Program Files (x86)\PeaZip\res\bin\7z\7z.exe", "PeaZip 7z (x86)"),
-            (r"C:\Program Files\PeaZip\res\bin\7z\x64\7z.exe", "PeaZip 7z x64"),
-            (r"C:\Program Files (x86)\PeaZip\res\bin\7z\x64\7z.exe", "PeaZip 7z x64 (x86)"),
-        ]
+        local_7za = self.script_dir / "7za.exe"
+        if local_7za.exists():
+            extractors.append((str(local_7za), "7za.exe (Local)"))
         
-        for path, name in possible_paths:
-            path_str = str(path)
-            if os.path.exists(path_str):
-                extractors.append((path_str, name))
+        # Program Files / Scoop installs (shared cached scan with check_7zip)
+        extractors.extend(find_seven_zip_installs())
         
         # Check PATH
-        seven_zip_in_path = shutil.which("7z")
+        seven_zip_in_path = which_cached("7z")
         if seven_zip_in_path:
             extractors.append((seven_zip_in_path, f"7z (PATH: {seven_zip_in_path})"))
         
@@ -1122,8 +2326,7 @@ class ROMConverter:
         listbox.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=listbox.yview)
         
-        for path, name in extractors:
-            listbox.insert("end", f"{name}")
+        listbox.insert("end", *[name for _, name in extractors])
         
         if extractors:
             listbox.selection_set(0)
@@ -1186,20 +2389,14 @@ class ROMConverter:
         # Determine platform-specific binary name
         maxcso_name = "maxcso.exe" if sys.platform == "win32" else "maxcso"
         
-        # First check bundled resources (PyInstaller)
-        bundled_maxcso = self.bundle_dir / maxcso_name
-        if bundled_maxcso.exists():
-            self.maxcso_path = str(bundled_maxcso)
-            return True
-        
-        # Then check for maxcso directly next to the executable/script
-        direct_maxcso = self.script_dir / maxcso_name
-        if direct_maxcso.exists():
-            self.maxcso_path = str(direct_maxcso)
+        # Check bundled resources (PyInstaller), then next to the executable/script
+        local_maxcso = self._find_local_tool(maxcso_name)
+        if local_maxcso:
+            self.maxcso_path = local_maxcso
             return True
 
         # Check PATH as fallback
-        maxcso = shutil.which("maxcso")
+        maxcso = which_cached("maxcso")
         if maxcso:
             self.maxcso_path = maxcso
             return True
@@ -1215,13 +2412,8 @@ class ROMConverter:
         )
         if seven_zip_file:
             try:
-                result = subprocess.run(
-                    [seven_zip_file],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if "7-zip" in result.stdout.lower() or "7-zip" in result.stderr.lower():
+                if self._verify_tool(seven_zip_file, ('7-zip',), args=()):
+                    clear_tool_discovery_cache()
                     self.seven_zip_path = seven_zip_file
                     self.save_config()
                     self.log(f"7-Zip location set to: {seven_zip_file}")
@@ -1242,14 +2434,7 @@ class ROMConverter:
         )
         if maxcso_file:
             try:
-                result = subprocess.run(
-                    [maxcso_file, "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                output = (result.stdout + result.stderr).lower()
-                if "maxcso" in output:
+                if self._verify_tool(maxcso_file, ('maxcso',)):
                     self.maxcso_path = maxcso_file
                     self.save_config()
                     self.log(f"maxcso location set to: {maxcso_file}")
@@ -1268,20 +2453,20 @@ class ROMConverter:
         help_window.geometry("600x500")
         
         # Apply theme to window
-        help_window.configure(bg=COLORS['bg_dark'])
+        help_window.configure(bg=self.colors.bg_dark)
         
         # Create main frame
-        main_frame = Frame(help_window, bg=COLORS['bg_dark'])
+        main_frame = Frame(help_window, bg=self.colors.bg_dark)
         main_frame.pack(fill="both", expand=True, padx=15, pady=15)
         
         # Title
         title = Label(main_frame, text="maxcso Setup Guide", font=self.font_title,
-                      fg=COLORS['accent_yellow'], bg=COLORS['bg_dark'])
+                      fg=self.colors.accent_yellow, bg=self.colors.bg_dark)
         title.pack(anchor="w", pady=(0, 10))
         
         # Info text
-        info_text = Text(main_frame, font=self.font_body, fg=COLORS['text_primary'],
-                        bg=COLORS['bg_light'], wrap="word", height=20, relief="flat", padx=10, pady=10)
+        info_text = Text(main_frame, font=self.font_body, fg=self.colors.text_primary,
+                        bg=self.colors.bg_light, wrap="word", height=20, relief="flat", padx=10, pady=10)
         info_text.pack(fill="both", expand=True, pady=(0, 10))
         
         # Disable editing
@@ -1332,16 +2517,16 @@ Format Recommendations
         info_text.config(state="disabled")
         
         # Button frame
-        button_frame = Frame(main_frame, bg=COLORS['bg_dark'])
+        button_frame = Frame(main_frame, bg=self.colors.bg_dark)
         button_frame.pack(fill="x", pady=(0, 0))
         
         Button(button_frame, text="[ Open GitHub Releases ]", 
                command=lambda: self.open_maxcso_releases(),
-               font=self.font_small, bg=COLORS['button_blue'], fg="white",
+               font=self.font_small, bg=self.colors.button_blue, fg="white",
                activeforeground="white", relief="flat", cursor="hand2").pack(side="left", padx=(0, 5))
         
         Button(button_frame, text="[ Close ]", command=help_window.destroy,
-               font=self.font_small, bg=COLORS['bg_light'],
+               font=self.font_small, bg=self.colors.bg_light,
                activeforeground="white", relief="flat", cursor="hand2").pack(side="left")
     
     def open_maxcso_releases(self):
@@ -1358,15 +2543,10 @@ Format Recommendations
             filetypes=filetypes
         )
         if chdman_file:
+            clear_tool_discovery_cache()
             # Verify it's actually chdman by trying to run it
             try:
-                result = subprocess.run(
-                    [chdman_file, "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                if "chdman" in result.stdout.lower() or "chdman" in result.stderr.lower():
+                if self._verify_tool(chdman_file, ('chdman',)):
                     self.chdman_path = chdman_file
                     self.save_config()
                     self.log(f"chdman location set to: {chdman_file}")
@@ -1388,20 +2568,13 @@ Format Recommendations
         )
         if ndecrypt_file:
             try:
-                result = subprocess.run(
-                    [ndecrypt_file, "--help"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5
-                )
-                output = (result.stdout + result.stderr).lower()
-                if "ndecrypt" in output or "decrypt" in output:
-                    self.ndecrypt_path = ndecrypt_file
+                if self._verify_tool(ndecrypt_file, ('ndecrypt', 'decrypt')):
+                    self._set_ndecrypt_path(ndecrypt_file)
                     self.save_config()
                     self.log(f"NDecrypt location set to: {ndecrypt_file}")
                     if hasattr(self, 'ndecrypt_label'):
                         self.ndecrypt_label.config(text=self.ndecrypt_path,
-                                                  fg=COLORS['text_secondary'])
+                                                  fg=self.colors.text_secondary)
                     messagebox.showinfo("Success", f"NDecrypt location set to:\n{ndecrypt_file}")
                 else:
                     messagebox.showerror("Error", "Selected file does not appear to be NDecrypt")
@@ -1429,43 +2602,79 @@ Format Recommendations
             
             self.log("Fetching NDecrypt release info from GitHub...")
             
-            # Get latest release info
-            req = urllib.request.Request(
-                NDECRYPT_GITHUB_RELEASES_API,
-                headers={'User-Agent': 'ROM-Converter'}
-            )
-            with urllib.request.urlopen(req, timeout=30) as response:
-                release_data = json.loads(response.read().decode())
-            
-            # Find matching asset
-            download_url = None
-            asset_name = None
-            for asset in release_data.get('assets', []):
-                name = asset.get('name', '')
-                if asset_pattern in name and name.endswith('.zip'):
-                    download_url = asset.get('browser_download_url')
-                    asset_name = name
-                    break
+            # Network work runs on a worker thread so the UI stays responsive
+            def fetch(post_status):
+                # Get latest release info; the response is kept on disk and
+                # revalidated by ETag, so a 304 doesn't count against GitHub's
+                # unauthenticated rate limit
+                release_cache = self.script_dir / ".ndecrypt_release.json"
+                self.download_to_file(NDECRYPT_GITHUB_RELEASES_API, release_cache, timeout=30)
+                with open(release_cache, 'rb') as f:
+                    release_data = json_loads_bytes(f.read())
+                
+                # Find matching asset
+                zip_assets = {asset.get('name', ''): asset.get('browser_download_url')
+                              for asset in release_data.get('assets', [])
+                              if asset.get('name', '').endswith('.zip')}
+                name = next((name for name in zip_assets if asset_pattern in name), None)
+                if not name:
+                    return None
+                
+                self.log(f"Downloading {name}...")
+                post_status(f"Downloading {name}...")
+                
+                # Download the zip
+                zip_path = self.script_dir / name
+                self.download_to_file(zip_assets[name], zip_path,
+                                      progress=lambda done, total: post_status((done, total)))
+                return zip_path
+            
+            # Small determinate progress dialog fed from the worker's status queue
+            progress_window = Toplevel(self.master)
+            progress_window.title("Downloading NDecrypt")
+            progress_window.geometry("450x150")
+            progress_window.resizable(False, False)
+            progress_window.transient(self.master)
+            progress_window.grab_set()
+            
+            progress_bar = ttk.Progressbar(progress_window, mode='determinate', length=350, maximum=100)
+            progress_bar.pack(pady=(20, 10))
+            status_label = Label(progress_window, text="Fetching release info...", wraplength=400)
+            status_label.pack(pady=5)
+            
+            def on_status(update):
+                if isinstance(update, tuple):
+                    done, total = update
+                    if total:
+                        progress_bar['value'] = 100 * done / total
+                        status_label.config(text=f"{done / 1048576:.1f} / {total / 1048576:.1f} MB")
+                    else:
+                        status_label.config(text=f"{done / 1048576:.1f} MB")
+                else:
+                    status_label.config(text=update)
             
-            if not download_url:
+            try:
+                zip_path = self.run_in_background(fetch, on_status=on_status)
+            finally:
+                progress_window.destroy()
+            
+            if not zip_path:
                 messagebox.showerror("Error", 
                     f"Could not find NDecrypt release for your platform ({asset_pattern}).\n\n"
                     "Please download manually from:\nhttps://github.com/SabreTools/NDecrypt/releases")
                 return
             
-            self.log(f"Downloading {asset_name}...")
-            
-            # Download the zip
-            zip_path = self.script_dir / asset_name
-            urllib.request.urlretrieve(download_url, zip_path)
-            
             # Extract
             self.log("Extracting NDecrypt...")
             extract_dir = self.script_dir / "ndecrypt"
             extract_dir.mkdir(exist_ok=True)
             
+            # Skip debug symbols and XML docs; the rest may be runtime
+            # dependencies of the executable, so it is kept
             with zipfile.ZipFile(zip_path, 'r') as zf:
-                zf.extractall(extract_dir)
+                members = [info for info in zf.infolist()
+                           if not info.filename.lower().endswith(('.pdb', '.xml'))]
+                zf.extractall(extract_dir, members=members)
             
             # Find the executable
             if sys.platform == "win32":
@@ -1477,12 +2686,12 @@ Format Recommendations
                     os.chmod(ndecrypt_exe, 0o755)
             
             if ndecrypt_exe.exists():
-                self.ndecrypt_path = str(ndecrypt_exe)
+                self._set_ndecrypt_path(str(ndecrypt_exe))
                 self.save_config()
                 self.log(f"✅ NDecrypt installed to: {self.ndecrypt_path}")
                 if hasattr(self, 'ndecrypt_label'):
                     self.ndecrypt_label.config(text=self.ndecrypt_path,
-                                              fg=COLORS['text_secondary'])
+                                              fg=self.colors.text_secondary)
                 messagebox.showinfo("Success", 
                     f"NDecrypt downloaded and installed!\n\n{self.ndecrypt_path}\n\n"
                     "Note: You'll need a config.json with encryption keys for decryption to work.")
@@ -1516,99 +2725,44 @@ Format Recommendations
     def convert_aes_keys_to_config(self, aes_keys_path, output_path):
         """Convert aes_keys.txt format to NDecrypt config.json format"""
         try:
-            keys = {}
             with open(aes_keys_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.split('=', 1)
-                        keys[key.strip()] = value.strip()
+                keys = dict(AES_KEY_LINE_RE.findall(f.read()))
             
             # Map aes_keys.txt format to NDecrypt config.json format
-            config = {}
-            
-            # Generator -> AESHardwareConstant
-            if 'generator' in keys:
-                config['AESHardwareConstant'] = keys['generator']
-            
-            # Map KeyX slots
-            key_mapping = {
-                'slot0x18KeyX': 'KeyX0x18',
-                'slot0x1BKeyX': 'KeyX0x1B',
-                'slot0x25KeyX': 'KeyX0x25',
-                'slot0x2CKeyX': 'KeyX0x2C',
-                'slot0x2DKeyX': 'KeyX0x2D',
-                'slot0x2EKeyX': 'KeyX0x2E',
-                'slot0x2FKeyX': 'KeyX0x2F',
-                'slot0x30KeyX': 'KeyX0x30',
-                'slot0x31KeyX': 'KeyX0x31',
-                'slot0x32KeyX': 'KeyX0x32',
-                'slot0x33KeyX': 'KeyX0x33',
-                'slot0x34KeyX': 'KeyX0x34',
-                'slot0x35KeyX': 'KeyX0x35',
-                'slot0x36KeyX': 'KeyX0x36',
-                'slot0x37KeyX': 'KeyX0x37',
-                'slot0x38KeyX': 'KeyX0x38',
-                'slot0x39KeyX': 'KeyX0x39',
-                'slot0x3AKeyX': 'KeyX0x3A',
-                'slot0x3BKeyX': 'KeyX0x3B',
-                'slot0x3CKeyX': 'KeyX0x3C',
-                'slot0x3DKeyX': 'KeyX0x3D',
-                'slot0x3EKeyX': 'KeyX0x3E',
-                'slot0x3FKeyX': 'KeyX0x3F',
-                'slot0x03KeyX': 'KeyX0x03',
-                'slot0x19KeyX': 'KeyX0x19',
-                'slot0x1AKeyX': 'KeyX0x1A',
-                'slot0x1CKeyX': 'KeyX0x1C',
-                'slot0x1DKeyX': 'KeyX0x1D',
-                'slot0x1EKeyX': 'KeyX0x1E',
-                'slot0x1FKeyX': 'KeyX0x1F',
-            }
-            
-            for aes_key, config_key in key_mapping.items():
-                if aes_key in keys:
-                    config[config_key] = keys[aes_key]
-            
-            # Map KeyY slots if present
-            keyy_mapping = {
-                'slot0x18KeyY': 'KeyY0x18',
-                'slot0x1BKeyY': 'KeyY0x1B',
-                'slot0x25KeyY': 'KeyY0x25',
-                'slot0x2CKeyY': 'KeyY0x2C',
-            }
-            
-            for aes_key, config_key in keyy_mapping.items():
-                if aes_key in keys:
-                    config[config_key] = keys[aes_key]
-            
-            # Map KeyN (normal keys) if present
-            keyn_mapping = {
-                'slot0x18KeyN': 'KeyN0x18',
-                'slot0x1BKeyN': 'KeyN0x1B',
-                'slot0x25KeyN': 'KeyN0x25',
-                'slot0x2CKeyN': 'KeyN0x2C',
-            }
-            
-            for aes_key, config_key in keyn_mapping.items():
-                if aes_key in keys:
-                    config[config_key] = keys[aes_key]
+            config = {config_key: keys[aes_key]
+                      for aes_key, config_key in AES_KEY_MAPPING.items() if aes_key in keys}
             
             # Write config.json
-            with open(output_path, 'w') as f:
-                json.dump(config, f, indent=2)
+            with open(output_path, 'wb') as f:
+                f.write(json_dumps_bytes(config))
             
             return True
         except Exception as e:
             self.log(f"❌ Failed to convert AES keys: {e}")
             return False
     
+    @functools.cached_property
+    def ndecrypt_dir(self):
+        """Folder holding the NDecrypt executable (and its config.json), or None"""
+        return Path(self.ndecrypt_path).parent if self.ndecrypt_path else None
+    
+    @functools.cached_property
+    def ndecrypt_config_path(self):
+        """NDecrypt's config.json next to the executable, or None"""
+        return self.ndecrypt_dir / "config.json" if self.ndecrypt_dir else None
+    
+    def _set_ndecrypt_path(self, path):
+        """Point at a new NDecrypt executable and drop the cached folder paths"""
+        self.ndecrypt_path = path
+        self.__dict__.pop('ndecrypt_dir', None)
+        self.__dict__.pop('ndecrypt_config_path', None)
+    
     def setup_ndecrypt_keys(self):
         """Setup NDecrypt with bundled AES keys if available"""
         if not self.ndecrypt_path:
             return False
         
-        ndecrypt_dir = Path(self.ndecrypt_path).parent
-        config_path = ndecrypt_dir / "config.json"
+        config_path = self.ndecrypt_config_path
         
         # Check if config.json already exists
         if config_path.exists():
@@ -1626,65 +2780,8 @@ Format Recommendations
         return False
     
     def clean_rom_filename(self, filename):
-        """Clean a ROM filename by removing unwanted tags while preserving important ones."""
-        name = filename
-        
-        # Tags to KEEP (case-insensitive patterns that should be preserved)
-        keep_patterns = [
-            r'\(Disc\s*\d+\)', r'\(Disk\s*\d+\)', r'\(Bonus\s*Disc\)', r'\(Bonus\s*Disk\)',
-            r'\(Demo\)', r'\(Beta\)', r'\(Proto\)', r'\(Prototype\)', r'\(Sample\)',
-            r'\(Limited\s*Edition\)', r'\(Collector.?s?\s*Edition\)', r'\(Special\s*Edition\)',
-            r'\(Game\s*of.*Year\)', r'\(GOTY\)', r'\(Director.?s?\s*Cut\)', r'\(Uncut\)',
-            r'\(Part\s*\d+\)', r'\(Side\s*[AB]\)',
-        ]
-        
-        # Extract tags to keep
-        preserved_tags = []
-        for pattern in keep_patterns:
-            matches = re.findall(pattern, name, re.IGNORECASE)
-            preserved_tags.extend(matches)
-        
-        # Tags to REMOVE
-        remove_patterns = [
-            r'\(USA\)', r'\(U\)', r'\(America\)', r'\(Europe\)', r'\(E\)', r'\(EU\)',
-            r'\(Japan\)', r'\(J\)', r'\(JP\)', r'\(Korea\)', r'\(K\)', r'\(KR\)',
-            r'\(Asia\)', r'\(A\)', r'\(World\)', r'\(W\)', r'\(Australia\)', r'\(AU\)',
-            r'\(France\)', r'\(F\)', r'\(Fr\)', r'\(Germany\)', r'\(G\)', r'\(De\)',
-            r'\(Spain\)', r'\(S\)', r'\(Es\)', r'\(Italy\)', r'\(I\)', r'\(It\)',
-            r'\(En\)', r'\(En,.*?\)', r'\(English\)', r'\(French\)', r'\(German\)',
-            r'\(Spanish\)', r'\(Italian\)', r'\(Japanese\)',
-            r'\(Multi\)', r'\(Multi\d*\)', r'\(M\d+\)',
-            r'\(Rev\s*[\dA-Z\.]+\)', r'\(v[\d\.]+[a-z]?\)', r'\(Ver\.?\s*[\d\.]+\)',
-            r'\[!\]', r'\[a\d?\]', r'\[b\d?\]', r'\[c\]', r'\[f\d?\]',
-            r'\[h\d*[A-Za-z]*\]', r'\[o\d?\]', r'\[p\d?\]', r'\[t\d?\]',
-            r'\[T[+-][A-Za-z]+[^\]]*\]',
-            r'\(NTSC\)', r'\(NTSC-U\)', r'\(NTSC-J\)', r'\(PAL\)', r'\(SECAM\)',
-            r'\(\d{4}-\d{2}-\d{2}\)', r'\(\d{8}\)', r'\(Unl\)',
-            r'\(Decrypted\)', r'\(Encrypted\)',
-        ]
-        
-        # Multi-region patterns
-        region_words = [
-            'USA', 'Europe', 'Japan', 'Asia', 'World', 'Korea', 'Australia',
-            'France', 'Germany', 'Spain', 'Italy', 'En', 'Fr', 'De', 'Es', 'It',
-            'U', 'E', 'J', 'A', 'K', 'W', 'G', 'F', 'S', 'I', 'EU', 'JP', 'KR', 'AU'
-        ]
-        region_pattern = r'\(\s*(?:' + '|'.join(re.escape(r) for r in region_words) + r')(?:\s*,\s*(?:' + '|'.join(re.escape(r) for r in region_words) + r'))+\s*\)'
-        name = re.sub(region_pattern, '', name, flags=re.IGNORECASE)
-        
-        # Remove unwanted tags
-        for pattern in remove_patterns:
-            name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-        
-        # Remove 2-3 letter codes in parentheses
-        name = re.sub(r'\s*\([A-Za-z]{1,3}\)(?!\s*\.)', '', name)
-        
-        # Clean up spaces
-        name = re.sub(r'\s+', ' ', name)
-        name = re.sub(r'\s+\.', '.', name)
-        name = name.strip()
-        
-        return name
+        """Clean a ROM filename (memoised module-level clean_rom_name)"""
+        return clean_rom_name(filename)
 
     def about_dialog(self):
         """Show About dialog with credits"""
@@ -1694,36 +2791,36 @@ Format Recommendations
         dialog.resizable(False, False)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=12)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=12)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="◄ ROM CONVERTER ►", font=self.font_title,
-              fg=COLORS['text_primary'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.text_primary, bg=self.colors.bg_light).pack()
         Label(title_frame, text="ROM Management & Conversion Tool", font=self.font_small,
-              fg=COLORS['text_muted'], bg=COLORS['bg_light']).pack(pady=(4, 0))
+              fg=self.colors.text_muted, bg=self.colors.bg_light).pack(pady=(4, 0))
         
         # Developer
-        dev_frame = Frame(dialog, bg=COLORS['bg_medium'], pady=10, padx=10)
+        dev_frame = Frame(dialog, bg=self.colors.bg_medium, pady=10, padx=10)
         dev_frame.pack(fill="x", padx=10, pady=5)
         Label(dev_frame, text="👨‍💻 DEVELOPED BY", font=self.font_label_bold,
-              fg=COLORS['accent_yellow'], bg=COLORS['bg_medium']).pack()
+              fg=self.colors.accent_yellow, bg=self.colors.bg_medium).pack()
         Label(dev_frame, text="WoofahRayetCode", font=self.font_heading_md,
-              fg=COLORS['accent_purple'], bg=COLORS['bg_medium']).pack(pady=(4, 0))
+              fg=self.colors.accent_purple, bg=self.colors.bg_medium).pack(pady=(4, 0))
         Label(dev_frame, text=f"Build: {self.build_timestamp}", font=self.font_small,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_medium']).pack(pady=(6, 0))
+              fg=self.colors.text_secondary, bg=self.colors.bg_medium).pack(pady=(6, 0))
         
         # Credits section
-        credits_frame = Frame(dialog, bg=COLORS['bg_dark'], padx=10, pady=5)
+        credits_frame = Frame(dialog, bg=self.colors.bg_dark, padx=10, pady=5)
         credits_frame.pack(fill="both", expand=True, padx=10)
         
         Label(credits_frame, text="🛠️ TOOLS & CREDITS", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(5, 8))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(5, 8))
         
         # Scrollable credits
         credits_text = Text(credits_frame, wrap="word", height=14, font=self.font_body,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
                            relief="flat", padx=10, pady=10)
         credits_text.pack(fill="both", expand=True)
         
@@ -1763,8 +2860,8 @@ obtained ROM files.
         
         # Close button
         Button(dialog, text="✕ CLOSE", command=dialog.destroy,
-               font=self.font_button, bg=COLORS['bg_light'],
-               fg=COLORS['text_primary'], relief="flat", cursor="hand2",
+               font=self.font_button, bg=self.colors.bg_light,
+               fg=self.colors.text_primary, relief="flat", cursor="hand2",
                padx=20, pady=5).pack(pady=10)
 
     def decrypt_3ds_dialog(self):
@@ -1775,53 +2872,53 @@ obtained ROM files.
         dialog.resizable(True, True)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=6)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=6)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="🎮 3DS ROM MANAGER", font=self.font_heading_md,
-              fg=COLORS['accent_purple'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.accent_purple, bg=self.colors.bg_light).pack()
         Label(title_frame, text="Extract → Decrypt → Move", font=self.font_small,
-              fg=COLORS['text_muted'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.text_muted, bg=self.colors.bg_light).pack()
         
         # Status frame
-        status_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        status_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         status_frame.pack(fill="x")
         
         # Check for keys and NDecrypt
         keys_available = self.find_aes_keys_file() is not None
         config_exists = False
         if self.ndecrypt_path:
-            config_exists = (Path(self.ndecrypt_path).parent / "config.json").exists()
+            config_exists = self.ndecrypt_config_path.exists()
         
         if self.ndecrypt_path and (keys_available or config_exists):
             ndecrypt_status = "✅ NDecrypt Ready"
-            status_color = COLORS['button_green']
+            status_color = self.colors.button_green
         elif self.ndecrypt_path:
             ndecrypt_status = "⚠️ NDecrypt OK, keys missing"
-            status_color = COLORS['accent_yellow']
+            status_color = self.colors.accent_yellow
         else:
             ndecrypt_status = "❌ NDecrypt not configured"
-            status_color = COLORS['accent_red']
+            status_color = self.colors.accent_red
         
         Label(status_frame, text=f"Decryption: {ndecrypt_status}", 
-              font=self.font_small, fg=status_color, bg=COLORS['bg_dark']).pack(side="left", padx=(0, 20))
+              font=self.font_small, fg=status_color, bg=self.colors.bg_dark).pack(side="left", padx=(0, 20))
         
         if not self.ndecrypt_path:
             Button(status_frame, text="[ DOWNLOAD ]", command=self.download_ndecrypt,
-                   font=self.font_small, bg=COLORS['accent_purple'],
+                   font=self.font_small, bg=self.colors.accent_purple,
                    fg="white", relief="flat", cursor="hand2").pack(side="left")
         
         # Source directory (for archives or ROMs)
-        source_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        source_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         source_frame.pack(fill="x")
         
         Label(source_frame, text="📂 Source Folder:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         source_entry = Entry(source_frame, font=self.font_body,
-                            bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'], relief="flat")
+                            bg=self.colors.bg_input, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary, relief="flat")
         source_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         # Pre-fill with saved 3DS source dir, fallback to general source_dir
         if self.threeds_source_dir:
@@ -1836,18 +2933,18 @@ obtained ROM files.
                 source_entry.insert(0, folder)
         
         Button(source_frame, text="📁", command=browse_source,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Destination directory (for moving)
-        dest_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        dest_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         dest_frame.pack(fill="x")
         
         Label(dest_frame, text="📁 Destination:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         dest_entry = Entry(dest_frame, font=self.font_body,
-                          bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                          insertbackground=COLORS['text_primary'], relief="flat")
+                          bg=self.colors.bg_input, fg=self.colors.text_primary,
+                          insertbackground=self.colors.text_primary, relief="flat")
         dest_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         
         # Pre-fill with saved 3DS destination, fallback to system_extract_dirs
@@ -1865,14 +2962,14 @@ obtained ROM files.
                 self.save_config()
         
         Button(dest_frame, text="📁", command=browse_dest,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Options
-        options_frame = Frame(dialog, padx=10, pady=8, bg=COLORS['bg_light'])
+        options_frame = Frame(dialog, padx=10, pady=8, bg=self.colors.bg_light)
         options_frame.pack(fill="x", padx=10, pady=5)
         
-        cb_bg = COLORS['bg_light']
+        cb_bg = self.colors.bg_light
         
         # Row 1
         opt_row1 = Frame(options_frame, bg=cb_bg)
@@ -1881,19 +2978,19 @@ obtained ROM files.
         recursive_scan = BooleanVar(value=True)
         Checkbutton(opt_row1, text="↳ Scan subdirectories", 
                    variable=recursive_scan, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left", padx=(0, 20))
         
         backup_original = BooleanVar(value=self.threeds_backup_original)
         Checkbutton(opt_row1, text="📁 Backup before decryption", 
                    variable=backup_original, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left", padx=(0, 20))
         
         auto_clean_names = BooleanVar(value=self.threeds_auto_clean_names)
         Checkbutton(opt_row1, text="✨ Clean filenames", 
                    variable=auto_clean_names, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left")
         
         # Row 2 - Workflow options
@@ -1903,13 +3000,13 @@ obtained ROM files.
         delete_archives = BooleanVar(value=self.threeds_delete_archives)
         Checkbutton(opt_row2, text="🗑️ Delete archives after extraction", 
                    variable=delete_archives, font=self.font_small,
-                   fg=COLORS['accent_red'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.accent_red, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left", padx=(0, 20))
         
         delete_after_move = BooleanVar(value=self.threeds_delete_after_move)
         Checkbutton(opt_row2, text="🗑️ Delete source after move", 
                    variable=delete_after_move, font=self.font_small,
-                   fg=COLORS['accent_red'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.accent_red, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left")
         
         # Function to save settings when checkboxes change
@@ -1918,7 +3015,7 @@ obtained ROM files.
             self.threeds_delete_archives = delete_archives.get()
             self.threeds_delete_after_move = delete_after_move.get()
             self.threeds_auto_clean_names = auto_clean_names.get()
-            self.save_config()
+            self.schedule_save_config()
         
         # Trace checkbox changes
         backup_original.trace_add('write', save_3ds_settings)
@@ -1929,34 +3026,34 @@ obtained ROM files.
         # Save paths when focus leaves entry fields
         def save_source_path(event=None):
             self.threeds_source_dir = source_entry.get().strip()
-            self.save_config()
+            self.schedule_save_config()
         
         def save_dest_path(event=None):
             self.threeds_dest_dir = dest_entry.get().strip()
             self.system_extract_dirs['Nintendo 3DS'] = self.threeds_dest_dir
-            self.save_config()
+            self.schedule_save_config()
         
         source_entry.bind('<FocusOut>', save_source_path)
         dest_entry.bind('<FocusOut>', save_dest_path)
         
         # Results area
-        results_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        results_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         results_frame.pack(fill="both", expand=True)
         
         Label(results_frame, text="◄ OPERATION LOG ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(0, 4))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(0, 4))
         
-        list_frame = Frame(results_frame, bg=COLORS['bg_dark'])
+        list_frame = Frame(results_frame, bg=self.colors.bg_dark)
         list_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(list_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'])
+        scrollbar = Scrollbar(list_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark)
         scrollbar.pack(side="right", fill="y")
         
         results_text = Text(list_frame, wrap="word", yscrollcommand=scrollbar.set,
                            height=18, font=self.font_mono,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                           insertbackground=COLORS['text_primary'], relief="flat",
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                           insertbackground=self.colors.text_primary, relief="flat",
                            padx=8, pady=8)
         results_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=results_text.yview)
@@ -1966,14 +3063,48 @@ obtained ROM files.
         found_roms = []
         extracted_roms = []
         
-        def log_msg(msg):
-            results_text.insert("end", msg + "\n")
-            results_text.see("end")
-            dialog.update()
+        # Log lines are buffered and written in batches: at most one Text insert
+        # and redraw per 50 ms, plus an idle flush for whatever is left over
+        log_buffer = []
+        log_state = {'last_flush': 0.0, 'flush_pending': False}
+        
+        def flush_log():
+            log_state['flush_pending'] = False
+            if log_buffer and results_text.winfo_exists():
+                results_text.insert("end", "\n".join(log_buffer) + "\n")
+                results_text.see("end")
+            log_buffer.clear()
+        
+        def log_msg(msg, flush=False):
+            """Queue a log line; lines are written to the Text widget in batches.
+            
+            flush=True writes everything queued right away (for summary lines
+            that should be on screen before a modal dialog opens).
+            """
+            log_buffer.append(msg)
+            now = time.monotonic()
+            if flush or now - log_state['last_flush'] >= 0.05:
+                log_state['last_flush'] = now
+                flush_log()
+                dialog.update_idletasks()
+            elif not log_state['flush_pending']:
+                log_state['flush_pending'] = True
+                dialog.after(50, flush_log)
         
         def clear_log():
+            log_buffer.clear()
             results_text.delete("1.0", "end")
         
+        def delete_extracted_archives(archives, log):
+            """Delete archives in one pass once extraction is done; log is log_msg or post_status"""
+            if archives:
+                log("")
+            for archive, error in delete_files(archives):
+                if error is None:
+                    log(f"🗑️ Archive deleted: {os.path.basename(archive)}")
+                else:
+                    log(f"⚠️ Could not delete {os.path.basename(archive)}: {error}")
+        
         # ===== STEP 1: EXTRACT =====
         def extract_3ds_archives():
             """Extract 3DS ROMs from archives"""
@@ -1990,8 +3121,11 @@ obtained ROM files.
             log_msg("=" * 50)
             log_msg(f"Scanning: {source}\n")
             
-            # Find archives
-            archives = self.find_compressed_files(source, recursive_scan.get())
+            # Find archives in one directory walk (find_compressed_files globs the
+            # tree once per archive type); only types archive_contains can list
+            # are worth sniffing for 3DS content
+            archives = sorted(Path(entry.path) for entry in self._scan_file_entries(source, recursive_scan.get())
+                              if entry.name.lower().endswith(LISTABLE_ARCHIVE_EXTENSIONS))
             
             if not archives:
                 log_msg("No archive files found.")
@@ -1999,36 +3133,28 @@ obtained ROM files.
             
             log_msg(f"Found {len(archives)} archive(s). Scanning for 3DS content...\n")
             
-            extensions_3ds = {'.3ds', '.cia'}
             archives_with_3ds = []
             
-            for archive in archives:
+            # Listing archives is I/O bound, so sniff several at once on worker
+            # threads; results come back in order and are logged on the Tk thread
+            def sniff(archive):
                 try:
-                    archive_path = Path(archive)
-                    ext = archive_path.suffix.lower()
-                    has_3ds = False
-                    
-                    if ext == '.zip':
-                        with zipfile.ZipFile(archive_path, 'r') as zf:
-                            for name in zf.namelist():
-                                if Path(name).suffix.lower() in extensions_3ds:
-                                    has_3ds = True
-                                    break
-                    elif ext in ['.7z', '.rar'] and self.seven_zip_path:
-                        cmd = [self.seven_zip_path, 'l', '-ba', str(archive_path)]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
-                        if result.returncode == 0:
-                            for line in result.stdout.split('\n'):
-                                if any(line.lower().endswith(e) for e in extensions_3ds):
-                                    has_3ds = True
-                                    break
-                    
-                    if has_3ds:
-                        archives_with_3ds.append(archive)
-                        found_archives.append(archive)
-                        log_msg(f"  📦 {archive.name} - contains 3DS ROMs")
+                    return self.archive_contains(archive, THREEDS_EXTENSIONS), None
                 except Exception as e:
-                    log_msg(f"  ⚠️ {archive.name} - scan error: {e}")
+                    return False, e
+            
+            def sniff_all(post_status):
+                workers = min(8, (os.cpu_count() or 1) * 2)
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='archive-sniff') as pool:
+                    return list(pool.map(sniff, archives))
+            
+            for archive, (has_3ds, error) in zip(archives, self.run_in_background(sniff_all)):
+                if error is not None:
+                    log_msg(f"  ⚠️ {archive.name} - scan error: {error}")
+                elif has_3ds:
+                    archives_with_3ds.append(archive)
+                    found_archives.append(archive)
+                    log_msg(f"  📦 {archive.name} - contains 3DS ROMs")
             
             if not archives_with_3ds:
                 log_msg("\nNo archives containing 3DS ROMs found.")
@@ -2038,27 +3164,28 @@ obtained ROM files.
             log_msg(f"Found {len(archives_with_3ds)} archive(s) with 3DS ROMs")
             log_msg(f"{'─' * 50}\n")
             
-            # Extract
+            # Extract (archives marked for deletion are removed after the loop,
+            # so unlinks don't interleave with extraction I/O)
+            remove_archives = delete_archives.get()
+            to_delete = []
             for archive in archives_with_3ds:
                 log_msg(f"📦 Extracting: {archive.name}")
                 success, folder = self.extract_archive(archive)
                 
                 if success and folder:
                     # Find extracted 3DS files
-                    for f in folder.rglob("*"):
-                        if f.is_file() and f.suffix.lower() in extensions_3ds:
-                            extracted_roms.append(f)
-                            log_msg(f"   ✅ {f.name}")
+                    for entry in self._scan_file_entries(folder):
+                        if entry.name.lower().endswith(THREEDS_EXTENSIONS):
+                            extracted_roms.append(Path(entry.path))
+                            log_msg(f"   ✅ {entry.name}")
                     
-                    if delete_archives.get():
-                        try:
-                            archive.unlink()
-                            log_msg(f"   🗑️ Archive deleted")
-                        except Exception as e:
-                            log_msg(f"   ⚠️ Could not delete archive: {e}")
+                    if remove_archives:
+                        to_delete.append(archive)
                 else:
                     log_msg(f"   ❌ Extraction failed")
             
+            delete_extracted_archives(to_delete, log_msg)
+            
             log_msg(f"\n{'━' * 50}")
             log_msg(f"✅ Extracted {len(extracted_roms)} 3DS ROM(s)")
             
@@ -2067,6 +3194,74 @@ obtained ROM files.
             found_roms.extend(extracted_roms)
         
         # ===== STEP 2: DECRYPT =====
+        def decrypt_roms_parallel(roms, make_backup):
+            """Decrypt roms with NDecrypt; returns (success_count, error_count).
+            
+            Each NDecrypt run is an independent process on its own file, so
+            several run at once (bounded by the concurrent-conversions
+            setting). Workers return their log lines; the Tk thread prints
+            them as each ROM finishes. make_backup is read by the caller
+            because Tk variables are only touched on the Tk thread.
+            """
+            # Resolved once per run: every worker shares the same executable
+            # and working directory, even if the setting changes mid-run
+            ndecrypt_exe = self.ndecrypt_path
+            ndecrypt_cwd = os.fspath(self.ndecrypt_dir)
+            
+            # One mkdir per source folder rather than one per ROM. A folder
+            # that can't be created surfaces as that ROM's backup copy error.
+            if make_backup:
+                for parent in {rom_file.parent for rom_file in roms}:
+                    try:
+                        (parent / "encrypted_backup").mkdir(exist_ok=True)
+                    except OSError:
+                        pass
+            
+            def decrypt_one(rom_file):
+                lines = [f"🔓 {rom_file.name}"]
+                try:
+                    if make_backup:
+                        try:
+                            copy_file_cow(rom_file, rom_file.parent / "encrypted_backup" / rom_file.name,
+                                          exclusive=True)
+                            lines.append(f"   📁 Backup created")
+                        except FileExistsError:
+                            pass  # Keep the backup from an earlier run
+                    
+                    cmd = [ndecrypt_exe, "d", str(rom_file)]
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600,
+                                          cwd=ndecrypt_cwd,
+                                          stdin=subprocess.DEVNULL, creationflags=NO_WINDOW_FLAGS)
+                    
+                    if result.returncode == 0:
+                        lines.append(f"   ✅ Decrypted")
+                        return True, lines
+                    error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
+                    lines.append(f"   ❌ Failed: {error_msg[:80]}")
+                except subprocess.TimeoutExpired:
+                    lines.append(f"   ❌ Timeout")
+                except Exception as e:
+                    lines.append(f"   ❌ Error: {e}")
+                return False, lines
+            
+            def decrypt_all(post_status):
+                workers = max(1, min(self.max_concurrent_conversions, len(roms)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='ndecrypt') as pool:
+                    futures = [pool.submit(decrypt_one, rom_file) for rom_file in roms]
+                    for future in as_completed(futures):
+                        post_status(future.result())
+            
+            counts = {True: 0, False: 0}
+            
+            def on_result(outcome):
+                ok, lines = outcome
+                counts[ok] += 1
+                for line in lines:
+                    log_msg(line)
+            
+            self.run_in_background(decrypt_all, on_status=on_result)
+            return counts[True], counts[False]
+        
         def decrypt_3ds_roms():
             """Decrypt 3DS ROM files"""
             if not self.ndecrypt_path:
@@ -2085,17 +3280,9 @@ obtained ROM files.
                 log_msg("=" * 50)
                 log_msg("Scanning for 3DS ROM files...\n")
                 
-                path = Path(source)
-                extensions_3ds = {'.3ds', '.cia'}
-                
-                if recursive_scan.get():
-                    all_files = list(path.rglob("*"))
-                else:
-                    all_files = list(path.glob("*"))
-                
-                for f in all_files:
-                    if f.is_file() and f.suffix.lower() in extensions_3ds:
-                        found_roms.append(f)
+                for entry in self._scan_file_entries(source, recursive_scan.get()):
+                    if entry.name.lower().endswith(THREEDS_EXTENSIONS):
+                        found_roms.append(Path(entry.path))
                 
                 if not found_roms:
                     log_msg("No .3ds or .cia files found.")
@@ -2112,50 +3299,74 @@ obtained ROM files.
             if self.setup_ndecrypt_keys():
                 log_msg("✅ Keys configured\n")
             else:
-                config_path = Path(self.ndecrypt_path).parent / "config.json"
-                if not config_path.exists():
-                    log_msg("❌ Keys not found!")
+                if not self.ndecrypt_config_path.exists():
+                    log_msg("❌ Keys not found!", flush=True)
                     messagebox.showerror("Error", "Encryption keys not found!")
                     return
             
-            success_count = 0
-            error_count = 0
+            success_count, error_count = decrypt_roms_parallel(found_roms, backup_original.get())
             
-            for rom_file in found_roms:
-                log_msg(f"🔓 {rom_file.name}")
-                
+            log_msg(f"\n{'━' * 50}")
+            log_msg(f"✅ Decrypted: {success_count} | ❌ Errors: {error_count}")
+        
+        # ===== STEP 3: MOVE =====
+        def transfer_roms_parallel(roms, dest_path, clean_names, delete_source):
+            """Move (or copy) roms into dest_path; returns (done_count, error_count).
+            
+            Target names are picked here on the Tk thread, so two ROMs that
+            clean to the same name can't both claim it. The file transfers are
+            independent and mostly wait on the disk, so they run on a small
+            thread pool; results are logged as each one finishes.
+            """
+            # Existence checks go straight to os.path on strings; a Path for
+            # the target is only built for files that will actually transfer
+            jobs = []
+            claimed = set()
+            dest_str = os.fspath(dest_path)
+            for rom_file in roms:
+                if not os.path.exists(os.fspath(rom_file)):
+                    continue
+                target_name = self.clean_rom_filename(rom_file.name) if clean_names else rom_file.name
+                if target_name in claimed or os.path.lexists(os.path.join(dest_str, target_name)):
+                    log_msg(f"⚠️ {rom_file.name} - already exists, skipping")
+                    continue
+                claimed.add(target_name)
+                jobs.append((rom_file, dest_path / target_name))
+            
+            if not jobs:
+                return 0, 0
+            
+            def transfer_one(rom_file, target):
                 try:
-                    if backup_original.get():
-                        backup_dir = rom_file.parent / "encrypted_backup"
-                        backup_dir.mkdir(exist_ok=True)
-                        backup_path = backup_dir / rom_file.name
-                        if not backup_path.exists():
-                            shutil.copy2(rom_file, backup_path)
-                            log_msg(f"   📁 Backup created")
-                    
-                    cmd = [self.ndecrypt_path, "d", str(rom_file)]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600,
-                                          cwd=Path(self.ndecrypt_path).parent)
-                    
-                    if result.returncode == 0:
-                        log_msg(f"   ✅ Decrypted")
-                        success_count += 1
+                    if delete_source:
+                        move_file(rom_file, target)
+                        action = "moved"
                     else:
-                        error_msg = result.stderr.strip() or result.stdout.strip() or "Unknown error"
-                        log_msg(f"   ❌ Failed: {error_msg[:80]}")
-                        error_count += 1
-                        
-                except subprocess.TimeoutExpired:
-                    log_msg(f"   ❌ Timeout")
-                    error_count += 1
+                        copy_file_cow(rom_file, target)
+                        action = "copied"
                 except Exception as e:
-                    log_msg(f"   ❌ Error: {e}")
-                    error_count += 1
+                    return False, f"❌ {rom_file.name} - {e}"
+                if target.name != rom_file.name:
+                    return True, f"✅ {rom_file.name} → {target.name}"
+                return True, f"✅ {rom_file.name} - {action}"
             
-            log_msg(f"\n{'━' * 50}")
-            log_msg(f"✅ Decrypted: {success_count} | ❌ Errors: {error_count}")
+            def transfer_all(post_status):
+                workers = max(1, min(8, self.max_concurrent_conversions, len(jobs)))
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='rom-move') as pool:
+                    futures = [pool.submit(transfer_one, rom_file, target) for rom_file, target in jobs]
+                    for future in as_completed(futures):
+                        post_status(future.result())
+            
+            counts = {True: 0, False: 0}
+            
+            def on_result(outcome):
+                ok, line = outcome
+                counts[ok] += 1
+                log_msg(line)
+            
+            self.run_in_background(transfer_all, on_status=on_result)
+            return counts[True], counts[False]
         
-        # ===== STEP 3: MOVE =====
         def move_3ds_roms():
             """Move 3DS ROMs to destination folder"""
             dest = dest_entry.get().strip()
@@ -2170,17 +3381,9 @@ obtained ROM files.
                     messagebox.showwarning("Warning", "Please select a valid source folder")
                     return
                 
-                path = Path(source)
-                extensions_3ds = {'.3ds', '.cia'}
-                
-                if recursive_scan.get():
-                    all_files = list(path.rglob("*"))
-                else:
-                    all_files = list(path.glob("*"))
-                
-                for f in all_files:
-                    if f.is_file() and f.suffix.lower() in extensions_3ds:
-                        found_roms.append(f)
+                for entry in self._scan_file_entries(source, recursive_scan.get()):
+                    if entry.name.lower().endswith(THREEDS_EXTENSIONS):
+                        found_roms.append(Path(entry.path))
             
             if not found_roms:
                 messagebox.showwarning("Warning", "No 3DS ROMs found to move")
@@ -2194,38 +3397,8 @@ obtained ROM files.
             dest_path = Path(dest)
             dest_path.mkdir(parents=True, exist_ok=True)
             
-            moved_count = 0
-            error_count = 0
-            
-            for rom_file in found_roms:
-                try:
-                    # Apply filename cleaning if enabled
-                    if auto_clean_names.get():
-                        clean_name = self.clean_rom_filename(rom_file.name)
-                        target = dest_path / clean_name
-                    else:
-                        target = dest_path / rom_file.name
-                    
-                    if target.exists():
-                        log_msg(f"⚠️ {rom_file.name} - already exists, skipping")
-                        continue
-                    
-                    if delete_after_move.get():
-                        shutil.move(str(rom_file), str(target))
-                        if auto_clean_names.get() and target.name != rom_file.name:
-                            log_msg(f"✅ {rom_file.name} → {target.name}")
-                        else:
-                            log_msg(f"✅ {rom_file.name} - moved")
-                    else:
-                        shutil.copy2(rom_file, target)
-                        if auto_clean_names.get() and target.name != rom_file.name:
-                            log_msg(f"✅ {rom_file.name} → {target.name}")
-                        else:
-                            log_msg(f"✅ {rom_file.name} - copied")
-                    moved_count += 1
-                except Exception as e:
-                    log_msg(f"❌ {rom_file.name} - {e}")
-                    error_count += 1
+            moved_count, error_count = transfer_roms_parallel(
+                found_roms, dest_path, auto_clean_names.get(), delete_after_move.get())
             
             log_msg(f"\n{'━' * 50}")
             log_msg(f"✅ Processed: {moved_count} | ❌ Errors: {error_count}")
@@ -2234,8 +3407,44 @@ obtained ROM files.
             self.system_extract_dirs['Nintendo 3DS'] = dest
             self.save_config()
         
+        # ===== BUSY GUARD =====
+        # The steps wait for their workers inside a nested Tk loop
+        # (run_in_background), so the dialog's buttons stay live meanwhile.
+        # Only one step or workflow may run at a time; a close request waits
+        # until it has finished.
+        dialog_state = {'busy': False, 'close_requested': False}
+        busy_buttons = []
+        
+        def close_dialog():
+            if dialog_state['busy']:
+                dialog_state['close_requested'] = True
+                log_msg("⏳ Closing once the current step finishes...", flush=True)
+                return
+            dialog.destroy()
+        
+        def exclusive(step):
+            """Wrap a step so it can't start while another step is running"""
+            def run_step():
+                if dialog_state['busy']:
+                    return
+                dialog_state['busy'] = True
+                for button in busy_buttons:
+                    button.config(state="disabled")
+                try:
+                    step()
+                finally:
+                    dialog_state['busy'] = False
+                    if dialog_state['close_requested']:
+                        dialog.destroy()
+                    elif dialog.winfo_exists():
+                        for button in busy_buttons:
+                            button.config(state="normal")
+            return run_step
+        
+        dialog.protocol("WM_DELETE_WINDOW", close_dialog)
+        
         # ===== ALL-IN-ONE =====
-        def run_full_workflow():
+        def full_workflow():
             """Run complete Extract → Decrypt → Move workflow"""
             source = source_entry.get()
             dest = dest_entry.get().strip()
@@ -2279,51 +3488,63 @@ obtained ROM files.
             log_msg("📦 STEP 1: EXTRACTING ARCHIVES")
             log_msg("─" * 40)
             
-            archives = self.find_compressed_files(source, recursive_scan.get())
-            extensions_3ds = {'.3ds', '.cia'}
-            
-            if archives:
+            # The walk, zip sniffing and extraction all run on a worker thread
+            # (run_in_background keeps the dialog repainting); log lines come
+            # back through post_status. Tk variables are read here first.
+            scan_root = os.path.normpath(source)
+            scan_recursive = recursive_scan.get()
+            remove_archives = delete_archives.get()
+            
+            def extract_step(post_status):
+                # One directory walk collects both the archives and the loose ROMs
+                # (instead of a glob per archive type plus a second full walk).
+                # Only archives archive_contains can list (zip/7z/rar) are
+                # collected; it picks the probe by extension. Paths stay plain
+                # strings from the DirEntry (the root is normalised once so they
+                # compare equal to the extracted folders' paths); Path objects
+                # are only built for the ROMs that make it into the result.
+                archives = []
+                loose_roms = []
+                for entry in self._scan_file_entries(scan_root, scan_recursive):
+                    lower_name = entry.name.lower()
+                    if lower_name.endswith(THREEDS_EXTENSIONS):
+                        loose_roms.append(entry.path)
+                    elif lower_name.endswith(LISTABLE_ARCHIVE_EXTENSIONS):
+                        archives.append(entry.path)
+                archives.sort()
+                
+                roms = []
+                seen_roms = set()  # path strings already in roms (O(1) dedupe)
+                to_delete = []  # removed in one pass after extraction
                 for archive in archives:
                     try:
-                        archive_path = Path(archive)
-                        ext = archive_path.suffix.lower()
-                        has_3ds = False
-                        
-                        if ext == '.zip':
-                            with zipfile.ZipFile(archive_path, 'r') as zf:
-                                for name in zf.namelist():
-                                    if Path(name).suffix.lower() in extensions_3ds:
-                                        has_3ds = True
-                                        break
-                        
-                        if has_3ds:
-                            log_msg(f"📦 {archive.name}")
+                        # Stops at the first .3ds/.cia name (zips: central directory only)
+                        if self.archive_contains(archive, THREEDS_EXTENSIONS):
+                            post_status(f"📦 {os.path.basename(archive)}")
                             success, folder = self.extract_archive(archive)
                             if success and folder:
-                                for f in folder.rglob("*"):
-                                    if f.is_file() and f.suffix.lower() in extensions_3ds:
-                                        found_roms.append(f)
-                                        log_msg(f"   ✅ {f.name}")
+                                for entry in self._scan_file_entries(folder):
+                                    if entry.name.lower().endswith(THREEDS_EXTENSIONS):
+                                        if entry.path not in seen_roms:
+                                            seen_roms.add(entry.path)
+                                            roms.append(Path(entry.path))
+                                        post_status(f"   ✅ {entry.name}")
                                 
-                                if delete_archives.get():
-                                    try:
-                                        archive.unlink()
-                                        log_msg(f"   🗑️ Archive deleted")
-                                    except:
-                                        pass
-                    except:
-                        pass
-            
-            # Also scan for loose ROM files
-            path = Path(source)
-            if recursive_scan.get():
-                all_files = list(path.rglob("*"))
-            else:
-                all_files = list(path.glob("*"))
+                                if remove_archives:
+                                    to_delete.append(archive)
+                    except Exception as e:
+                        post_status(f"   ⚠️ {os.path.basename(archive)}: {e}")
+                
+                delete_extracted_archives(to_delete, post_status)
+                
+                # Add the loose ROM files found by the initial walk
+                for rom_path in loose_roms:
+                    if rom_path not in seen_roms:
+                        seen_roms.add(rom_path)
+                        roms.append(Path(rom_path))
+                return roms
             
-            for f in all_files:
-                if f.is_file() and f.suffix.lower() in extensions_3ds and f not in found_roms:
-                    found_roms.append(f)
+            found_roms.extend(self.run_in_background(extract_step, on_status=log_msg))
             
             log_msg(f"\n✅ Found {len(found_roms)} 3DS ROM(s)\n")
             
@@ -2338,32 +3559,7 @@ obtained ROM files.
             if self.setup_ndecrypt_keys():
                 log_msg("✅ Keys configured\n")
             
-            decrypt_success = 0
-            decrypt_errors = 0
-            
-            for rom_file in found_roms:
-                log_msg(f"🔓 {rom_file.name}")
-                try:
-                    if backup_original.get():
-                        backup_dir = rom_file.parent / "encrypted_backup"
-                        backup_dir.mkdir(exist_ok=True)
-                        backup_path = backup_dir / rom_file.name
-                        if not backup_path.exists():
-                            shutil.copy2(rom_file, backup_path)
-                    
-                    cmd = [self.ndecrypt_path, "d", str(rom_file)]
-                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=600,
-                                          cwd=Path(self.ndecrypt_path).parent)
-                    
-                    if result.returncode == 0:
-                        log_msg(f"   ✅ Decrypted")
-                        decrypt_success += 1
-                    else:
-                        log_msg(f"   ❌ Failed")
-                        decrypt_errors += 1
-                except:
-                    log_msg(f"   ❌ Error")
-                    decrypt_errors += 1
+            decrypt_success, decrypt_errors = decrypt_roms_parallel(found_roms, backup_original.get())
             
             log_msg(f"\n✅ Decrypted: {decrypt_success} | ❌ Errors: {decrypt_errors}\n")
             
@@ -2375,45 +3571,15 @@ obtained ROM files.
             dest_path = Path(dest)
             dest_path.mkdir(parents=True, exist_ok=True)
             
-            move_success = 0
-            move_errors = 0
-            
-            for rom_file in found_roms:
-                try:
-                    if not rom_file.exists():
-                        continue
-                    
-                    # Apply filename cleaning if enabled
-                    if auto_clean_names.get():
-                        clean_name = self.clean_rom_filename(rom_file.name)
-                        target = dest_path / clean_name
-                    else:
-                        target = dest_path / rom_file.name
-                    
-                    if target.exists():
-                        log_msg(f"⚠️ {rom_file.name} - exists")
-                        continue
-                    
-                    if delete_after_move.get():
-                        shutil.move(str(rom_file), str(target))
-                    else:
-                        shutil.copy2(rom_file, target)
-                    
-                    if auto_clean_names.get() and target.name != rom_file.name:
-                        log_msg(f"✅ {rom_file.name} → {target.name}")
-                    else:
-                        log_msg(f"✅ {rom_file.name}")
-                    move_success += 1
-                except Exception as e:
-                    log_msg(f"❌ {rom_file.name}")
-                    move_errors += 1
+            move_success, move_errors = transfer_roms_parallel(
+                found_roms, dest_path, auto_clean_names.get(), delete_after_move.get())
             
             log_msg(f"\n{'━' * 50}")
             log_msg("🎉 WORKFLOW COMPLETE!")
             log_msg(f"{'━' * 50}")
             log_msg(f"Extracted: {len(found_roms)} ROM(s)")
             log_msg(f"Decrypted: {decrypt_success} | Errors: {decrypt_errors}")
-            log_msg(f"Moved: {move_success} | Errors: {move_errors}")
+            log_msg(f"Moved: {move_success} | Errors: {move_errors}", flush=True)
             
             # Save paths and settings
             self.threeds_source_dir = source
@@ -2428,47 +3594,70 @@ obtained ROM files.
                 f"Destination: {dest}")
         
         # Action buttons - Individual steps
-        steps_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        steps_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         steps_frame.pack(fill="x")
         
         Label(steps_frame, text="Individual Steps:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
-        
-        Button(steps_frame, text="1️⃣ EXTRACT", command=extract_3ds_archives,
-               font=self.font_small,
-               bg=COLORS['button_blue'], fg="white",
-               activebackground=COLORS['text_secondary'],
-               relief="flat", cursor="hand2", padx=10, pady=3).pack(side="left", padx=3)
-        
-        Button(steps_frame, text="2️⃣ DECRYPT", command=decrypt_3ds_roms,
-               font=self.font_small,
-               bg=COLORS['accent_purple'], fg="white",
-               activebackground=COLORS['accent_pink'],
-               relief="flat", cursor="hand2", padx=10, pady=3).pack(side="left", padx=3)
-        
-        Button(steps_frame, text="3️⃣ MOVE", command=move_3ds_roms,
-               font=self.font_small,
-               bg=COLORS['accent_orange'], fg="white",
-               activebackground=COLORS['accent_yellow'],
-               relief="flat", cursor="hand2", padx=10, pady=3).pack(side="left", padx=3)
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
+        
+        extract_button = Button(steps_frame, text="1️⃣ EXTRACT", command=exclusive(extract_3ds_archives),
+                                font=self.font_small,
+                                bg=self.colors.button_blue, fg="white",
+                                activebackground=self.colors.text_secondary,
+                                relief="flat", cursor="hand2", padx=10, pady=3)
+        extract_button.pack(side="left", padx=3)
+        
+        decrypt_button = Button(steps_frame, text="2️⃣ DECRYPT", command=exclusive(decrypt_3ds_roms),
+                                font=self.font_small,
+                                bg=self.colors.accent_purple, fg="white",
+                                activebackground=self.colors.accent_pink,
+                                relief="flat", cursor="hand2", padx=10, pady=3)
+        decrypt_button.pack(side="left", padx=3)
+        
+        move_button = Button(steps_frame, text="3️⃣ MOVE", command=exclusive(move_3ds_roms),
+                             font=self.font_small,
+                             bg=self.colors.accent_orange, fg="white",
+                             activebackground=self.colors.accent_yellow,
+                             relief="flat", cursor="hand2", padx=10, pady=3)
+        move_button.pack(side="left", padx=3)
         
         # Action buttons - All-in-one and close
-        action_frame = Frame(dialog, padx=10, pady=10, bg=COLORS['bg_dark'])
+        action_frame = Frame(dialog, padx=10, pady=10, bg=self.colors.bg_dark)
         action_frame.pack(fill="x")
         
-        Button(action_frame, text="🚀 RUN FULL WORKFLOW", command=run_full_workflow,
-               font=self.font_button,
-               bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['text_primary'],
-               relief="flat", cursor="hand2", padx=20, pady=5).pack(side="left", padx=5)
+        run_button = Button(action_frame, text="🚀 RUN FULL WORKFLOW", command=exclusive(full_workflow),
+                            font=self.font_button,
+                            bg=self.colors.button_green, fg=self.colors.bg_dark,
+                            activebackground=self.colors.text_primary,
+                            relief="flat", cursor="hand2", padx=20, pady=5)
+        run_button.pack(side="left", padx=5)
+        busy_buttons.extend((extract_button, decrypt_button, move_button, run_button))
         
-        Button(action_frame, text="✕ CLOSE", command=dialog.destroy,
+        Button(action_frame, text="✕ CLOSE", command=close_dialog,
                font=self.font_button,
-               activebackground=COLORS['accent_red'],
+               activebackground=self.colors.accent_red,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="right", padx=5)
 
+    def schedule_save_config(self, delay_ms=500):
+        """Debounced save_config: one write delay_ms after the last change"""
+        if self._save_after_id is not None:
+            self.master.after_cancel(self._save_after_id)
+        self._save_after_id = self.master.after(delay_ms, self.flush_pending_save)
+    
+    def flush_pending_save(self):
+        """Run a scheduled save now (no-op if none is pending)"""
+        if self._save_after_id is None:
+            return
+        self.master.after_cancel(self._save_after_id)
+        self._save_after_id = None
+        self.save_config()
+    
     def save_config(self):
-        """Save configuration to JSON file"""
+        """Save configuration to JSON file (atomically; skipped if nothing changed)"""
+        if self._save_after_id is not None:
+            # This write covers whatever the debounced save was waiting for
+            self.master.after_cancel(self._save_after_id)
+            self._save_after_id = None
         try:
             config = {
                 'source_dir': self._make_portable_path(self.source_dir),
@@ -2488,11 +3677,26 @@ obtained ROM files.
                 'seven_zip_path': self._make_portable_path(self.seven_zip_path),
                 'maxcso_path': self._make_portable_path(self.maxcso_path),
                 'ndecrypt_path': self._make_portable_path(self.ndecrypt_path),
+                'chdman_version_cache': [
+                    {'path': self._make_portable_path(path), 'size': size, 'mtime_ns': mtime_ns, 'version': version}
+                    for (path, size, mtime_ns), version in self.chdman_version_cache.items()
+                ],
+                'tool_verify_cache': [
+                    {'path': self._make_portable_path(path), 'size': size, 'mtime_ns': mtime_ns,
+                     'ok': ok, 'verified_at': verified_at}
+                    for (path, size, mtime_ns), (ok, verified_at) in self.tool_verify_cache.items()
+                    if ok and time.time() - verified_at < TOOL_VERIFY_TTL_SECONDS
+                ],
+                'tool_cache': {
+                    url: dict(entry, path=self._make_portable_path(entry.get('path')))
+                    for url, entry in self.tool_cache.items()
+                },
                 'ps2_output_format': self.ps2_output_format,
                 'psp_output_format': self.psp_output_format,
                 'ps2_emulator': self.ps2_emulator,
                 'max_concurrent_conversions': self.max_concurrent_conversions,
                 'disk_write_throttle_mb_s': self.disk_write_throttle_mb_s,
+                'strict_tool_verify': self.strict_tool_verify,
                 'theme': self.current_theme,
                 'system_extract_dirs': {k: self._make_portable_path(v) for k, v in self.system_extract_dirs.items()},
                 # 3DS workflow settings
@@ -2503,8 +3707,16 @@ obtained ROM files.
                 'threeds_source_dir': self._make_portable_path(self.threeds_source_dir),
                 'threeds_dest_dir': self._make_portable_path(self.threeds_dest_dir),
             }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            data = json_dumps_bytes(config)
+            if data == self._last_saved_config:
+                return
+            # Write a sibling temp file and rename it over the config, so a
+            # crash mid-write can't leave a truncated config behind
+            temp_path = self.config_file.with_name(self.config_file.name + '.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+            os.replace(temp_path, self.config_file)
+            self._last_saved_config = data
         except Exception as e:
             # Silently fail - don't interrupt user experience
             pass
@@ -2513,8 +3725,8 @@ obtained ROM files.
         """Load configuration from JSON file"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = json_loads_bytes(f.read())
                 
                 # Restore settings
                 self.source_dir = self._resolve_portable_path(config.get('source_dir', ''))
@@ -2535,6 +3747,7 @@ obtained ROM files.
                 self.ps2_emulator = config.get('ps2_emulator', 'PCSX2')
                 self.max_concurrent_conversions = config.get('max_concurrent_conversions', self._detect_optimal_workers())
                 self.disk_write_throttle_mb_s = config.get('disk_write_throttle_mb_s', 100)
+                self.strict_tool_verify = config.get('strict_tool_verify', False)
                 self.current_theme = config.get('theme', 'PS2')
                 
                 # Restore chdman path if saved and still exists
@@ -2542,6 +3755,26 @@ obtained ROM files.
                 if saved_chdman and os.path.exists(saved_chdman):
                     self.chdman_path = saved_chdman
                 
+                # Restore cached chdman version (validated by size/mtime on use)
+                for entry in config.get('chdman_version_cache', []):
+                    cached_path = self._resolve_portable_path(entry.get('path'))
+                    if cached_path and entry.get('version'):
+                        key = (cached_path, entry.get('size'), entry.get('mtime_ns'))
+                        self.chdman_version_cache[key] = entry['version']
+                
+                # Restore remembered tool verifications (expired ones are dropped on
+                # save; failures from older configs are ignored so they get re-run)
+                for entry in config.get('tool_verify_cache', []):
+                    cached_path = self._resolve_portable_path(entry.get('path'))
+                    if cached_path and entry.get('ok'):
+                        key = (cached_path, entry.get('size'), entry.get('mtime_ns'))
+                        self.tool_verify_cache[key] = (entry['ok'], entry.get('verified_at', 0))
+                
+                # Restore download validators (ETag/Last-Modified) for conditional GETs
+                for url, entry in config.get('tool_cache', {}).items():
+                    if isinstance(entry, dict):
+                        self.tool_cache[url] = dict(entry, path=self._resolve_portable_path(entry.get('path')))
+                
                 # Restore 7-Zip path if saved and still exists
                 saved_7zip = self._resolve_portable_path(config.get('seven_zip_path'))
                 if saved_7zip and os.path.exists(saved_7zip):
@@ -2555,7 +3788,7 @@ obtained ROM files.
                 # Restore ndecrypt path if saved and still exists
                 saved_ndecrypt = self._resolve_portable_path(config.get('ndecrypt_path'))
                 if saved_ndecrypt and os.path.exists(saved_ndecrypt):
-                    self.ndecrypt_path = saved_ndecrypt
+                    self._set_ndecrypt_path(saved_ndecrypt)
                 
                 # Restore system extraction directories
                 saved_system_dirs = config.get('system_extract_dirs', {})
@@ -2579,37 +3812,61 @@ obtained ROM files.
         """Load progress from previous conversion sessions for crash recovery"""
         try:
             if self.progress_file.exists():
-                with open(self.progress_file, 'r') as f:
-                    data = json.load(f)
-                    self.completed_files = set(data.get('completed_files', []))
+                with open(self.progress_file, 'rb') as f:
+                    data = json_loads_bytes(f.read())
+                    # Older progress files kept the completed list in the header;
+                    # move it into the list file so later header saves don't drop it
+                    legacy_files = data.get('completed_files', [])
+                    if legacy_files and not self.progress_list_file.exists():
+                        self.progress_list_file.write_bytes(
+                            ''.join(f"{p}\n" for p in legacy_files).encode('utf-8', 'surrogateescape')
+                        )
+                    self.completed_files = set(legacy_files)
                     self.current_batch_id = data.get('batch_id')
-                    if self.completed_files:
-                        self.log(f"📂 Loaded progress: {len(self.completed_files)} files previously completed")
+            if self.progress_list_file.exists():
+                self.completed_files.update(
+                    self.progress_list_file.read_bytes().decode('utf-8', 'surrogateescape').splitlines()
+                )
+            if self.completed_files:
+                self.log(f"📂 Loaded progress: {len(self.completed_files)} files previously completed")
         except Exception as e:
             self.log(f"⚠️  Could not load progress file: {e}")
             self.completed_files = set()
 
     def save_progress(self, source_dir):
-        """Save current conversion progress for crash recovery"""
+        """Save the batch header for crash recovery (completed files are appended separately)"""
         try:
             data = {
                 'batch_id': self.current_batch_id,
                 'source_dir': str(source_dir),
-                'completed_files': list(self.completed_files),
                 'timestamp': time.time()
             }
-            with open(self.progress_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(self.progress_file, 'wb') as f:
+                f.write(json_dumps_bytes(data))
         except Exception as e:
             self.log(f"⚠️  Could not save progress: {e}")
 
+    def record_completed(self, path):
+        """Mark a file as converted and append it to the progress list (thread-safe)"""
+        path_str = str(path)
+        with self.progress_lock:
+            if path_str in self.completed_files:
+                return
+            self.completed_files.add(path_str)
+            try:
+                with open(self.progress_list_file, 'ab') as f:
+                    f.write(path_str.encode('utf-8', 'surrogateescape') + b'\n')
+            except Exception as e:
+                self.log(f"⚠️  Could not save progress: {e}")
+
     def clear_progress(self):
         """Clear progress file after successful completion"""
         try:
-            if self.progress_file.exists():
-                self.progress_file.unlink()
-                self.completed_files = set()
-                self.current_batch_id = None
+            for progress_path in (self.progress_file, self.progress_list_file):
+                if progress_path.exists():
+                    progress_path.unlink()
+            self.completed_files = set()
+            self.current_batch_id = None
         except Exception:
             pass
     
@@ -2627,9 +3884,9 @@ obtained ROM files.
         lower_name = str(name).lower()
         
         # Check for game ID patterns in filename (very reliable)
-        if any(token in lower_name for token in PSP_ID_PATTERNS):
+        if PSP_ID_RE.search(lower_name):
             return 'PSP'
-        if any(token in lower_name for token in PS2_ID_PATTERNS):
+        if PS2_ID_RE.search(lower_name):
             return 'PlayStation 2'
         
         # Check folder path for system hints (use full path if available)
@@ -2664,6 +3921,12 @@ obtained ROM files.
         """Store paths relative to the app folder when possible for portability."""
         if not path_value:
             return ""
+        # Fast path: an already-normalised absolute string under the app folder
+        # just loses the prefix (same result as relative_to, without Path parsing)
+        if (isinstance(path_value, str) and path_value.startswith(self._script_dir_prefix)
+                and len(path_value) > len(self._script_dir_prefix)
+                and os.path.normpath(path_value) == path_value):
+            return path_value[len(self._script_dir_prefix):]
         try:
             path_obj = Path(path_value)
             # If already relative, keep as-is
@@ -2692,14 +3955,12 @@ obtained ROM files.
             return stored_value
 
     def set_theme_colors(self, theme_name):
-        """Set global COLORS to the chosen theme palette"""
-        palette = THEME_PRESETS.get(theme_name, THEME_PRESETS['PS2'])
-        global COLORS
-        COLORS = dict(palette)
+        """Set this window's colors to the chosen theme palette"""
+        self.colors = THEME_PRESETS.get(theme_name, THEME_PRESETS['PS2'])
         self.current_theme = theme_name
-        self.font_body_family = palette.get('font_body', 'Consolas')
-        self.font_heading_family = palette.get('font_heading', self.font_body_family)
-        self.font_mono_family = palette.get('font_mono', 'Consolas')
+        self.font_body_family = self.colors.font_body
+        self.font_heading_family = self.colors.font_heading
+        self.font_mono_family = self.colors.font_mono
 
     def init_fonts(self):
         """Create reusable font objects to allow live theme switching"""
@@ -2729,93 +3990,94 @@ obtained ROM files.
             if f:
                 f.configure(family=fam)
 
+    def configure_progress_style(self):
+        """(Re)configure the shared retro progress bar style for the current palette"""
+        self._style.configure("Retro.Horizontal.TProgressbar",
+                              troughcolor=self.colors.bg_light,
+                              background=self.colors.text_primary,
+                              darkcolor=self.colors.button_green,
+                              lightcolor=self.colors.text_primary,
+                              bordercolor=self.colors.text_primary)
+
     def apply_theme(self):
-        """Apply current theme colors across the UI"""
+        """Apply current theme colors across the UI (no-op if that theme is already applied)"""
+        if self.current_theme == self._applied_theme:
+            return
+        self._applied_theme = self.current_theme
         self.update_font_families()
         # Update ttk progress style
-        style = ttk.Style()
-        style.configure("Retro.Horizontal.TProgressbar",
-                        troughcolor=COLORS['bg_light'],
-                        background=COLORS['text_primary'],
-                        darkcolor=COLORS['button_green'],
-                        lightcolor=COLORS['text_primary'],
-                        bordercolor=COLORS['text_primary'])
+        self.configure_progress_style()
 
         # Window background
-        self.master.configure(bg=COLORS['bg_dark'])
+        self.master.configure(bg=self.colors.bg_dark)
         for widget in [self.main_frame, getattr(self, 'title_frame', None), getattr(self, 'options_frame', None)]:
             if widget:
-                widget.configure(bg=COLORS['bg_dark'] if widget is self.main_frame else COLORS['bg_light'])
+                widget.configure(bg=self.colors.bg_dark if widget is self.main_frame else self.colors.bg_light)
 
         # Header labels
         for lbl in [getattr(self, 'status_label', None), getattr(self, 'metrics_label', None)]:
             if lbl:
-                lbl.configure(bg=COLORS['bg_light'] if lbl is self.status_label else COLORS['bg_medium'],
-                              fg=COLORS['text_primary'] if lbl is self.status_label else COLORS['accent_yellow'])
+                lbl.configure(bg=self.colors.bg_light if lbl is self.status_label else self.colors.bg_medium,
+                              fg=self.colors.text_primary if lbl is self.status_label else self.colors.accent_yellow)
 
         # Inputs and labels
         for inp in [getattr(self, 'dir_entry', None)]:
             if inp:
-                inp.configure(bg=COLORS['bg_input'], fg=COLORS['text_primary'], insertbackground=COLORS['text_primary'])
+                inp.configure(bg=self.colors.bg_input, fg=self.colors.text_primary, insertbackground=self.colors.text_primary)
         for lbl in [getattr(self, 'chdman_label', None), getattr(self, 'seven_zip_label', None), getattr(self, 'maxcso_label', None)]:
             if lbl:
-                lbl.configure(bg=COLORS['bg_dark'], fg=COLORS['text_secondary'])
+                lbl.configure(bg=self.colors.bg_dark, fg=self.colors.text_secondary)
 
         # Buttons
         buttons = [getattr(self, 'scan_button', None), getattr(self, 'convert_button', None),
                    getattr(self, 'stop_button', None), getattr(self, 'move_chd_button', None)]
         for btn in buttons:
             if btn:
-                btn.configure(activebackground=COLORS['text_primary'])
+                btn.configure(activebackground=self.colors.text_primary)
         # Log area
         if getattr(self, 'log_text', None):
-            self.log_text.configure(bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                                    insertbackground=COLORS['text_primary'],
-                                    selectbackground=COLORS['accent_purple'])
+            self.log_text.configure(bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                                    insertbackground=self.colors.text_primary,
+                                    selectbackground=self.colors.accent_purple)
         # Progress bar
         if getattr(self, 'progress', None):
             self.progress.configure(style="Retro.Horizontal.TProgressbar")
 
         # Title frame background
         if getattr(self, 'title_frame', None):
-            self.title_frame.configure(bg=COLORS['bg_light'])
+            self.title_frame.configure(bg=self.colors.bg_light)
             for child in self.title_frame.winfo_children():
                 try:
-                    child.configure(bg=COLORS['bg_light'], fg=COLORS['text_primary'])
+                    child.configure(bg=self.colors.bg_light, fg=self.colors.text_primary)
                 except Exception:
                     pass
     
     def setup_ui(self):
         """Setup the user interface with retro gaming aesthetic"""
-        # Configure ttk styles for retro look
-        style = ttk.Style()
-        style.theme_use('clam')
-        style.configure("Retro.Horizontal.TProgressbar",
-                       troughcolor=COLORS['bg_light'],
-                       background=COLORS['text_primary'],
-                       darkcolor=COLORS['button_green'],
-                       lightcolor=COLORS['text_primary'],
-                       bordercolor=COLORS['text_primary'])
+        # Configure ttk styles for retro look (one Style object, reused on theme changes)
+        self._style = ttk.Style()
+        self._style.theme_use('clam')
+        self.configure_progress_style()
         
         # Main container with dark background
-        self.main_frame = Frame(self.master, padx=15, pady=15, bg=COLORS['bg_dark'])
+        self.main_frame = Frame(self.master, padx=15, pady=15, bg=self.colors.bg_dark)
         self.main_frame.pack(fill="both", expand=True)
         
         # Title banner
-        title_frame = Frame(self.main_frame, bg=COLORS['bg_light'], pady=8)
+        title_frame = Frame(self.main_frame, bg=self.colors.bg_light, pady=8)
         title_frame.pack(fill="x", pady=(0, 15))
         self.title_frame = title_frame
         
         title_label = Label(title_frame, text="◄ ROM CONVERTER ►", 
                    font=self.font_title,
-                           fg=COLORS['text_primary'], bg=COLORS['bg_light'])
+                           fg=self.colors.text_primary, bg=self.colors.bg_light)
         title_label.pack()
 
         # Theme selector
-        theme_frame = Frame(title_frame, bg=COLORS['bg_light'])
+        theme_frame = Frame(title_frame, bg=self.colors.bg_light)
         theme_frame.pack(pady=(6, 0))
         Label(theme_frame, text="Theme:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_light']).pack(side="left", padx=(0, 6))
+              fg=self.colors.text_secondary, bg=self.colors.bg_light).pack(side="left", padx=(0, 6))
         self.theme_combo = ttk.Combobox(theme_frame, values=list(THEME_PRESETS.keys()),
                                         state="readonly", width=8)
         if self.current_theme not in THEME_PRESETS:
@@ -2826,8 +4088,7 @@ obtained ROM files.
         def on_theme_change(event=None):
             chosen = self.theme_combo.get()
             self.set_theme_colors(chosen)
-            self.update_font_families()
-            self.save_config()
+            self.schedule_save_config()
             self.apply_theme()
             self.log(f"🖌 Theme set to {chosen}.")
 
@@ -2835,166 +4096,133 @@ obtained ROM files.
         
         # About button
         Button(theme_frame, text="ℹ️ About", command=self.about_dialog,
-               font=self.font_small, bg=COLORS['bg_medium'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2",
+               font=self.font_small, bg=self.colors.bg_medium,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2",
                padx=8).pack(side="left", padx=(15, 0))
         
         # Directory selection
-        dir_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        dir_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         dir_frame.pack(fill="x", pady=(0, 8))
         
         Label(dir_frame, text="📁 ROM Directory:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
         
         self.dir_entry = Entry(dir_frame, font=self.font_body,
-                              bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                              insertbackground=COLORS['text_primary'],
+                              bg=self.colors.bg_input, fg=self.colors.text_primary,
+                              insertbackground=self.colors.text_primary,
                               relief="flat", highlightthickness=1,
-                              highlightcolor=COLORS['text_secondary'],
-                              highlightbackground=COLORS['text_muted'])
+                              highlightcolor=self.colors.text_secondary,
+                              highlightbackground=self.colors.text_muted)
         self.dir_entry.pack(side="left", fill="x", expand=True, padx=(0, 10), ipady=4)
         if self.source_dir:
             self.dir_entry.insert(0, self.source_dir)
         
         Button(dir_frame, text="[ BROWSE ]", command=self.browse_directory,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], activebackground=COLORS['accent_purple'],
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, activebackground=self.colors.accent_purple,
                activeforeground="white", relief="flat", cursor="hand2").pack(side="left")
         
         # chdman location
-        chdman_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        chdman_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         chdman_frame.pack(fill="x", pady=(0, 8))
         
         Label(chdman_frame, text="⚙ chdman:", font=self.font_label_bold,
-              fg=COLORS['accent_yellow'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
+              fg=self.colors.accent_yellow, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
         self.chdman_label = Label(chdman_frame, text=self.chdman_path or "Not set",
                                   font=self.font_small,
-                                  fg=COLORS['text_secondary'], bg=COLORS['bg_dark'], anchor="w")
+                                  fg=self.colors.text_secondary, bg=self.colors.bg_dark, anchor="w")
         self.chdman_label.pack(side="left", fill="x", expand=True, padx=(0, 10))
         Button(chdman_frame, text="[ CHANGE ]", command=self.browse_chdman,
-               font=self.font_small, bg=COLORS['button_blue'],
-               fg="white", activebackground=COLORS['accent_purple'],
+               font=self.font_small, bg=self.colors.button_blue,
+               fg="white", activebackground=self.colors.accent_purple,
                activeforeground="white", relief="flat", cursor="hand2").pack(side="left")
         
         # 7-Zip location
-        seven_zip_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        seven_zip_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         seven_zip_frame.pack(fill="x", pady=(0, 12))
         
         Label(seven_zip_frame, text="📦 7-Zip:", font=self.font_label_bold,
-              fg=COLORS['accent_yellow'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
+              fg=self.colors.accent_yellow, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
         self.seven_zip_label = Label(seven_zip_frame, 
                                      text=self.seven_zip_path or "Not set (optional for .7z/.rar)",
                                      font=self.font_small,
-                                     fg=COLORS['text_secondary'] if self.seven_zip_path else COLORS['text_muted'],
-                                     bg=COLORS['bg_dark'], anchor="w")
+                                     fg=self.colors.text_secondary if self.seven_zip_path else self.colors.text_muted,
+                                     bg=self.colors.bg_dark, anchor="w")
         self.seven_zip_label.pack(side="left", fill="x", expand=True, padx=(0, 10))
         Button(seven_zip_frame, text="[ SET ]", command=self.browse_7zip,
-               font=self.font_small, bg=COLORS['button_blue'],
-               fg="white", activebackground=COLORS['accent_purple'],
+               font=self.font_small, bg=self.colors.button_blue,
+               fg="white", activebackground=self.colors.accent_purple,
                activeforeground="white", relief="flat", cursor="hand2").pack(side="left")
 
         # maxcso location (for CSO/ZSO output)
-        maxcso_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        maxcso_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         maxcso_frame.pack(fill="x", pady=(0, 8))
 
         Label(maxcso_frame, text="🗜  maxcso:", font=self.font_label_bold,
-              fg=COLORS['accent_yellow'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
+              fg=self.colors.accent_yellow, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
         self.maxcso_label = Label(maxcso_frame, 
                         text=self.maxcso_path or "Not set (required for CSO/ZSO)",
                         font=self.font_small,
-                                   fg=COLORS['text_secondary'] if self.maxcso_path else COLORS['text_muted'],
-                                   bg=COLORS['bg_dark'], anchor="w")
+                                   fg=self.colors.text_secondary if self.maxcso_path else self.colors.text_muted,
+                                   bg=self.colors.bg_dark, anchor="w")
         self.maxcso_label.pack(side="left", fill="x", expand=True)
         
         # NDecrypt path display (for 3DS decryption)
-        ndecrypt_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        ndecrypt_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         ndecrypt_frame.pack(fill="x", pady=(0, 12))
 
         Label(ndecrypt_frame, text="🔓 NDecrypt:", font=self.font_label_bold,
-              fg=COLORS['accent_purple'], bg=COLORS['bg_dark']).pack(side="left", padx=(0, 10))
+              fg=self.colors.accent_purple, bg=self.colors.bg_dark).pack(side="left", padx=(0, 10))
         self.ndecrypt_label = Label(ndecrypt_frame, 
                         text=self.ndecrypt_path or "Not set (required for 3DS decryption)",
                         font=self.font_small,
-                                   fg=COLORS['text_secondary'] if self.ndecrypt_path else COLORS['text_muted'],
-                                   bg=COLORS['bg_dark'], anchor="w")
+                                   fg=self.colors.text_secondary if self.ndecrypt_path else self.colors.text_muted,
+                                   bg=self.colors.bg_dark, anchor="w")
         self.ndecrypt_label.pack(side="left", fill="x", expand=True)
         
         Button(ndecrypt_frame, text="[ SET ]", command=self.browse_ndecrypt,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left", padx=2)
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left", padx=2)
         
         Button(ndecrypt_frame, text="[ DOWNLOAD ]", command=self.download_ndecrypt,
-               font=self.font_small, bg=COLORS['accent_purple'],
+               font=self.font_small, bg=self.colors.accent_purple,
                fg="white", relief="flat", cursor="hand2").pack(side="left", padx=2)
         
         # Options panel
-        options_frame = Frame(self.main_frame, bg=COLORS['bg_light'], padx=10, pady=8)
+        options_frame = Frame(self.main_frame, bg=self.colors.bg_light, padx=10, pady=8)
         options_frame.pack(fill="x", pady=(0, 12))
         self.options_frame = options_frame
         
         options_title = Label(options_frame, text="▼ OPTIONS ▼", font=self.font_label_bold,
-                             fg=COLORS['accent_pink'], bg=COLORS['bg_light'])
+                             fg=self.colors.accent_pink, bg=self.colors.bg_light)
         options_title.pack(anchor="w", pady=(0, 5))
         
         # Custom checkbox style
         cb_font = self.font_small
-        cb_bg = COLORS['bg_light']
-        
-        Checkbutton(options_frame, text="↳ Scan subdirectories recursively",
-                   variable=self.recursive, font=cb_font,
-                   fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-                   activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-        
-        Checkbutton(options_frame, text="↳ Move originals to backup folder after conversion",
-                   variable=self.move_to_backup, font=cb_font,
-                   fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-                   activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-        
-        Checkbutton(options_frame, text="⚠ Delete original files after successful conversion",
-                   variable=self.delete_originals, font=cb_font,
-                   fg=COLORS['accent_red'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-                   activebackground=cb_bg, activeforeground=COLORS['accent_red']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process PS1 CUE files (.cue)",
-                variable=self.process_ps1_cues, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process PS2 BIN/CUE files (.cue)",
-            variable=self.process_ps2_cues, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process PS2 ISO files (.iso)",
-                variable=self.process_ps2_isos, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process PSP ISO files (.iso → CSO/ZSO)",
-                variable=self.process_psp_isos, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process NES ROM files (.nes)",
-                variable=self.process_nes_roms, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process SNES ROM files (.sfc/.smc/.snes)",
-                variable=self.process_snes_roms, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="🎮 Process N64 ROM files (.n64/.z64/.v64)",
-                variable=self.process_n64_roms, font=cb_font,
-            fg=COLORS['text_primary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-            activebackground=cb_bg, activeforeground=COLORS['text_primary']).pack(anchor="w")
+        cb_bg = self.colors.bg_light
+        
+        def add_option(text, variable, fg=self.colors.text_primary):
+            """Add one left-aligned options checkbox in fg"""
+            Checkbutton(options_frame, text=text, variable=variable, font=cb_font,
+                        fg=fg, bg=cb_bg, selectcolor=self.colors.bg_dark,
+                        activebackground=cb_bg, activeforeground=fg).pack(anchor="w")
+        
+        add_option("↳ Scan subdirectories recursively", self.recursive)
+        add_option("↳ Move originals to backup folder after conversion", self.move_to_backup)
+        add_option("⚠ Delete original files after successful conversion", self.delete_originals, self.colors.accent_red)
+        add_option("🎮 Process PS1 CUE files (.cue)", self.process_ps1_cues)
+        add_option("🎮 Process PS2 BIN/CUE files (.cue)", self.process_ps2_cues)
+        add_option("🎮 Process PS2 ISO files (.iso)", self.process_ps2_isos)
+        add_option("🎮 Process PSP ISO files (.iso → CSO/ZSO)", self.process_psp_isos)
+        add_option("🎮 Process NES ROM files (.nes)", self.process_nes_roms)
+        add_option("🎮 Process SNES ROM files (.sfc/.smc/.snes)", self.process_snes_roms)
+        add_option("🎮 Process N64 ROM files (.n64/.z64/.v64)", self.process_n64_roms)
 
         # Emulator preset selection
         emulator_frame = Frame(options_frame, bg=cb_bg)
         emulator_frame.pack(fill="x", pady=(4, 2))
         Label(emulator_frame, text="↳ PS2 emulator:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=cb_bg).pack(side="left")
+              fg=self.colors.text_secondary, bg=cb_bg).pack(side="left")
         self.ps2_emulator_combo = ttk.Combobox(emulator_frame, values=PS2_EMULATORS,
                                                state="readonly", width=10)
         if self.ps2_emulator not in PS2_EMULATORS:
@@ -3006,7 +4234,7 @@ obtained ROM files.
         format_frame = Frame(options_frame, bg=cb_bg)
         format_frame.pack(fill="x", pady=(4, 4))
         Label(format_frame, text="↳ PS2 output format:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=cb_bg).pack(side="left")
+              fg=self.colors.text_secondary, bg=cb_bg).pack(side="left")
         self.ps2_format_combo = ttk.Combobox(format_frame, values=PS2_OUTPUT_FORMATS,
                             state="readonly", width=6)
         if self.ps2_output_format not in PS2_OUTPUT_FORMATS:
@@ -3016,7 +4244,7 @@ obtained ROM files.
 
         def on_ps2_format_change(event=None):
             self.ps2_output_format = self.ps2_format_combo.get()
-            self.save_config()
+            self.schedule_save_config()
             if self.ps2_output_format in ['CSO', 'ZSO'] and not self.maxcso_path:
                 self.log("⚠ maxcso is required for CSO/ZSO output. Set the path above.")
 
@@ -3025,14 +4253,14 @@ obtained ROM files.
         def on_ps2_emulator_change(event=None):
             self.ps2_emulator = self.ps2_emulator_combo.get()
             # Apply recommended format for selected emulator
-            recommended = PS2_EMULATOR_RECOMMENDATIONS.get(self.ps2_emulator, 'CHD')
-            if recommended in PS2_OUTPUT_FORMATS:
+            recommended = PS2_RECOMMENDED_FORMAT.get(self.ps2_emulator, 'CHD')
+            if recommended != self.ps2_output_format:
                 self.ps2_output_format = recommended
                 self.ps2_format_combo.set(recommended)
-                self.log(f"ℹ Using recommended format for {self.ps2_emulator}: {recommended}")
-                self.save_config()
-                if recommended in ['CSO', 'ZSO'] and not self.maxcso_path:
-                    self.log("⚠ maxcso is required for CSO/ZSO output. Set the path above.")
+            self.log(f"ℹ Using recommended format for {self.ps2_emulator}: {recommended}")
+            self.schedule_save_config()
+            if recommended in ('CSO', 'ZSO') and not self.maxcso_path:
+                self.log("⚠ maxcso is required for CSO/ZSO output. Set the path above.")
 
         self.ps2_emulator_combo.bind("<<ComboboxSelected>>", on_ps2_emulator_change)
 
@@ -3040,7 +4268,7 @@ obtained ROM files.
         psp_format_frame = Frame(options_frame, bg=cb_bg)
         psp_format_frame.pack(fill="x", pady=(4, 4))
         Label(psp_format_frame, text="↳ PSP output format:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=cb_bg).pack(side="left")
+              fg=self.colors.text_secondary, bg=cb_bg).pack(side="left")
         psp_formats = ['CSO', 'ZSO']
         self.psp_format_combo = ttk.Combobox(psp_format_frame, values=psp_formats,
                             state="readonly", width=6)
@@ -3051,29 +4279,22 @@ obtained ROM files.
 
         def on_psp_format_change(event=None):
             self.psp_output_format = self.psp_format_combo.get()
-            self.save_config()
+            self.schedule_save_config()
             if not self.maxcso_path:
                 self.log("⚠ maxcso is required for PSP CSO/ZSO output. Set the path above.")
 
         self.psp_format_combo.bind("<<ComboboxSelected>>", on_psp_format_change)
 
-        Checkbutton(options_frame, text="📦 Extract compressed files before conversion",
-                variable=self.extract_compressed, font=cb_font,
-                fg=COLORS['accent_orange'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-                activebackground=cb_bg, activeforeground=COLORS['accent_orange']).pack(anchor="w")
-
-        Checkbutton(options_frame, text="⚠ Delete archive files after extraction",
-                variable=self.delete_archives_after_extract, font=cb_font,
-                fg=COLORS['accent_red'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
-                activebackground=cb_bg, activeforeground=COLORS['accent_red']).pack(anchor="w")
+        add_option("📦 Extract compressed files before conversion", self.extract_compressed, self.colors.accent_orange)
+        add_option("⚠ Delete archive files after extraction", self.delete_archives_after_extract, self.colors.accent_red)
         
         # Max concurrent conversions slider
         concurrent_frame = Frame(options_frame, bg=cb_bg)
         concurrent_frame.pack(fill="x", pady=(8, 4))
         Label(concurrent_frame, text="⚡ Max concurrent conversions:", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=cb_bg).pack(side="left")
+              fg=self.colors.text_secondary, bg=cb_bg).pack(side="left")
         self.concurrent_label = Label(concurrent_frame, text=str(self.max_concurrent_conversions), 
-                                       font=self.font_label_bold, fg=COLORS['accent_yellow'], bg=cb_bg, width=3)
+                                       font=self.font_label_bold, fg=self.colors.accent_yellow, bg=cb_bg, width=3)
         self.concurrent_label.pack(side="left", padx=(8, 0))
         max_cores = multiprocessing.cpu_count()
         self.concurrent_slider = ttk.Scale(concurrent_frame, from_=1, to=max_cores, 
@@ -3082,28 +4303,28 @@ obtained ROM files.
         self.concurrent_slider.set(self.max_concurrent_conversions)
         self.concurrent_slider.pack(side="left", padx=(8, 0))
         Label(concurrent_frame, text=f"(1-{max_cores} cores)", font=cb_font,
-              fg=COLORS['text_muted'], bg=cb_bg).pack(side="left", padx=(8, 0))
+              fg=self.colors.text_muted, bg=cb_bg).pack(side="left", padx=(8, 0))
         
         # Action buttons
-        button_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        button_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         button_frame.pack(fill="x", pady=(0, 8))
         
         self.scan_button = Button(button_frame, text="▶ SCAN", 
                                  command=self.scan_directory,
                                  font=self.font_button,
-                                 bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-                                 activebackground=COLORS['text_primary'],
-                                 activeforeground=COLORS['bg_dark'],
+                                 bg=self.colors.button_green, fg=self.colors.bg_dark,
+                                 activebackground=self.colors.text_primary,
+                                 activeforeground=self.colors.bg_dark,
                                  relief="flat", cursor="hand2", padx=15, pady=5)
         self.scan_button.pack(side="left", padx=(0, 8))
         
         self.convert_button = Button(button_frame, text="Convert", 
                                     command=self.start_conversion,
                                     font=self.font_button,
-                                    bg=COLORS['button_blue'], fg="white",
-                                    activebackground=COLORS['text_secondary'],
-                                    activeforeground=COLORS['bg_dark'],
-                                    disabledforeground=COLORS['text_muted'],
+                                    bg=self.colors.button_blue, fg="white",
+                                    activebackground=self.colors.text_secondary,
+                                    activeforeground=self.colors.bg_dark,
+                                    disabledforeground=self.colors.text_muted,
                                     relief="flat", cursor="hand2", padx=15, pady=5,
                                     state="disabled")
         self.convert_button.pack(side="left", padx=(0, 8))
@@ -3111,8 +4332,8 @@ obtained ROM files.
         self.stop_button = Button(button_frame, text="■ STOP", 
                                  command=self.stop_conversion,
                                  font=self.font_button,
-                                 bg=COLORS['accent_red'], fg="white",
-                                 activebackground=COLORS['accent_orange'],
+                                 bg=self.colors.accent_red, fg="white",
+                                 activebackground=self.colors.accent_orange,
                                  disabledforeground="white",
                                  relief="flat", cursor="hand2", padx=15, pady=5,
                                  state="disabled")
@@ -3121,45 +4342,45 @@ obtained ROM files.
         self.move_chd_button = Button(button_frame, text="📁 MOVE CHD", 
                                      command=self.move_chd_files_dialog,
                                      font=self.font_button,
-                                     bg=COLORS['accent_purple'], fg="white",
-                                     activebackground=COLORS['accent_pink'],
+                                     bg=self.colors.accent_purple, fg="white",
+                                     activebackground=self.colors.accent_pink,
                                      relief="flat", cursor="hand2", padx=15, pady=5)
         self.move_chd_button.pack(side="left", padx=(0, 8))
         
         self.cleanup_button = Button(button_frame, text="🗑️ CLEANUP", 
                                     command=self.cleanup_compressed_dialog,
                                     font=self.font_button,
-                                    bg=COLORS['accent_orange'], fg="white",
-                                    activebackground=COLORS['accent_red'],
+                                    bg=self.colors.accent_orange, fg="white",
+                                    activebackground=self.colors.accent_red,
                                     relief="flat", cursor="hand2", padx=15, pady=5)
         self.cleanup_button.pack(side="left", padx=(0, 8))
         
         self.clean_names_button = Button(button_frame, text="✨ CLEAN NAMES", 
                                         command=self.clean_names_dialog,
                                         font=self.font_button,
-                                        bg=COLORS['accent_pink'], fg="white",
-                                        activebackground=COLORS['accent_purple'],
+                                        bg=self.colors.accent_pink, fg="white",
+                                        activebackground=self.colors.accent_purple,
                                         relief="flat", cursor="hand2", padx=15, pady=5)
         self.clean_names_button.pack(side="left", padx=(0, 8))
         
         self.extract_archives_button = Button(button_frame, text="📦 EXTRACT ARCHIVES", 
                                              command=self.extract_archives_dialog,
                                              font=self.font_button,
-                                             bg=COLORS['accent_yellow'], fg=COLORS['bg_dark'],
-                                             activebackground=COLORS['accent_orange'],
+                                             bg=self.colors.accent_yellow, fg=self.colors.bg_dark,
+                                             activebackground=self.colors.accent_orange,
                                              relief="flat", cursor="hand2", padx=15, pady=5)
         self.extract_archives_button.pack(side="left", padx=(0, 8))
         
         self.decrypt_3ds_button = Button(button_frame, text="🔓 DECRYPT 3DS", 
                                         command=self.decrypt_3ds_dialog,
                                         font=self.font_button,
-                                        bg=COLORS['accent_purple'], fg="white",
-                                        activebackground=COLORS['accent_pink'],
+                                        bg=self.colors.accent_purple, fg="white",
+                                        activebackground=self.colors.accent_pink,
                                         relief="flat", cursor="hand2", padx=15, pady=5)
         self.decrypt_3ds_button.pack(side="left")
         
         # Progress bar with retro style
-        progress_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        progress_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         progress_frame.pack(fill="x", pady=(0, 8))
         
         self.progress = ttk.Progressbar(progress_frame, mode='determinate',
@@ -3169,22 +4390,22 @@ obtained ROM files.
         # Log area with terminal aesthetic
         log_label = Label(self.main_frame, text="◄ TERMINAL OUTPUT ►", anchor="w",
                          font=self.font_label_bold,
-                         fg=COLORS['text_secondary'], bg=COLORS['bg_dark'])
+                         fg=self.colors.text_secondary, bg=self.colors.bg_dark)
         log_label.pack(fill="x", pady=(0, 4))
         
-        log_frame = Frame(self.main_frame, bg=COLORS['bg_dark'])
+        log_frame = Frame(self.main_frame, bg=self.colors.bg_dark)
         log_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(log_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'],
-                             activebackground=COLORS['text_primary'])
+        scrollbar = Scrollbar(log_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark,
+                             activebackground=self.colors.text_primary)
         scrollbar.pack(side="right", fill="y")
         
         self.log_text = Text(log_frame, wrap="word", yscrollcommand=scrollbar.set,
                             height=1000, font=self.font_mono,
-                            bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'],
-                            selectbackground=COLORS['accent_purple'],
+                            bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary,
+                            selectbackground=self.colors.accent_purple,
                             selectforeground="white",
                             relief="flat", padx=8, pady=8)
         self.log_text.pack(side="left", fill="both", expand=True)
@@ -3195,31 +4416,31 @@ obtained ROM files.
         self.status_label = Label(self.main_frame, 
                                  text=f"▶ READY | {self.cpu_cores}/{total_cores} CPU CORES | 1 CORE RESERVED",
                                  font=self.font_status,
-                                 fg=COLORS['text_primary'], bg=COLORS['bg_light'],
+                                 fg=self.colors.text_primary, bg=self.colors.bg_light,
                                  anchor="w", padx=8, pady=4)
         self.status_label.pack(fill="x", pady=(8, 4))
 
         # Metrics label with retro styling
         self.metrics_label = Label(self.main_frame, text="◆ METRICS: IDLE ◆", anchor="w", 
-                                   bg=COLORS['bg_medium'], fg=COLORS['accent_yellow'],
+                                   bg=self.colors.bg_medium, fg=self.colors.accent_yellow,
                                    font=self.font_status, padx=8, pady=4)
         self.metrics_label.pack(fill="x")
 
         if not PSUTIL_AVAILABLE:
             self.log("ℹ Resource metrics disabled (psutil not installed - this is optional)")
         
-        # Add trace callbacks to save config when options change
-        self.delete_originals.trace_add('write', lambda *args: self.save_config())
-        self.move_to_backup.trace_add('write', lambda *args: self.save_config())
-        self.recursive.trace_add('write', lambda *args: self.save_config())
-        self.process_ps1_cues.trace_add('write', lambda *args: self.save_config())
-        self.process_ps2_cues.trace_add('write', lambda *args: self.save_config())
-        self.process_ps2_isos.trace_add('write', lambda *args: self.save_config())
-        self.process_psp_isos.trace_add('write', lambda *args: self.save_config())
-        self.extract_compressed.trace_add('write', lambda *args: self.save_config())
-        self.delete_archives_after_extract.trace_add('write', lambda *args: self.save_config())
-        
-        # Start log queue processor
+        # Add trace callbacks to save config when options change; all of them
+        # share one debounced save, so a burst of toggles is a single write
+        on_option_change = lambda *args: self.schedule_save_config()
+        for var in (self.delete_originals, self.move_to_backup, self.recursive,
+                    self.process_ps1_cues, self.process_ps2_cues,
+                    self.process_ps2_isos, self.process_psp_isos,
+                    self.extract_compressed, self.delete_archives_after_extract):
+            var.trace_add('write', on_option_change)
+        
+        # Log lines from the Tk thread are drained on <<LogMessage>>; lines
+        # from worker threads wait for the process_log_queue timer
+        self.master.bind('<<LogMessage>>', self._drain_log_queue)
         self.process_log_queue()
         # Apply theme after UI construction
         self.apply_theme()
@@ -3236,32 +4457,44 @@ obtained ROM files.
     
     def log(self, message):
         """Add message to log (thread-safe)"""
-        self.log_queue.put(message)
+        with self.log_lock:
+            wake = not self.log_queue
+            self.log_queue.append(message)
+        # Only the first line of a batch wakes the Tk loop, and only from the
+        # Tk thread: from a worker, threaded _tkinter would block until the Tk
+        # thread runs the call, stalling it whenever that thread is busy (e.g.
+        # waiting on the very tool the worker is reading). Worker lines are
+        # picked up by the LOG_POLL_MS timer.
+        if wake and pythread.current_thread() is pythread.main_thread():
+            try:
+                self.master.event_generate('<<LogMessage>>', when='tail')
+            except Exception:
+                pass  # window gone or loop not running; the timer drains it
     
     def process_log_queue(self):
-        """Process queued log messages from threads - batched for performance"""
+        """Drain the log queue every LOG_POLL_MS (picks up worker-thread lines)"""
+        self._drain_log_queue()
+        self.master.after(LOG_POLL_MS, self.process_log_queue)
+    
+    def _drain_log_queue(self, event=None):
+        """Write all queued log messages to the log widget in one insert"""
         try:
-            messages = []
-            # Batch up to 20 messages at once to reduce UI updates
-            for _ in range(20):
-                try:
-                    message = self.log_queue.get_nowait()
-                    messages.append(message)
-                except:
-                    break
+            # Take everything pending under one lock acquisition
+            with self.log_lock:
+                messages = list(self.log_queue)
+                self.log_queue.clear()
             
             if messages:
                 # Insert all messages at once
                 self.log_text.insert("end", "\n".join(messages) + "\n")
+                # Trim the oldest lines past MAX_LOG_LINES ("end-1c" is on the
+                # empty line after the trailing newline)
+                excess = int(self.log_text.index("end-1c").split(".")[0]) - 1 - MAX_LOG_LINES
+                if excess > 0:
+                    self.log_text.delete("1.0", f"{excess + 1}.0")
                 self.log_text.see("end")
-                # Force UI update only once per batch
-                self.log_text.update_idletasks()
         except:
             pass
-        finally:
-            # Check less frequently when idle (200ms), more often when busy (50ms)
-            interval = 50 if self.is_converting else 200
-            self.master.after(interval, self.process_log_queue)
     
     def keep_ui_responsive(self):
         """Call periodically during long operations to keep UI responsive.
@@ -3276,30 +4509,115 @@ obtained ROM files.
             except:
                 pass
     
+    def _scan_file_entries(self, directory, recursive=True):
+        """Yield os.DirEntry objects for files under directory.
+
+        Uses os.scandir so the file type reported by the directory listing is
+        reused instead of re-stat'ing every path with Path.is_file().
+        Symlinked directories are not descended into (same as Path.rglob).
+        """
+        pending = [os.fspath(directory)]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_file():
+                                yield entry
+                            elif recursive and entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+    def _scan_file_paths(self, directory, recursive=True):
+        """List file paths under directory, reusing remembered listings of unchanged folders.
+        
+        Each folder is stat'ed; if its mtime matches the listing saved by an
+        earlier scan (kept on disk in scan_cache_file), that listing is used
+        instead of reading the folder again. Adding, removing or renaming an
+        entry changes the folder's mtime, so only changed folders are re-read,
+        which is most of the cost of a rescan on network and USB drives.
+        """
+        root = os.path.abspath(os.fspath(directory))
+        drive = os.path.splitdrive(root)[0]
+        use_cache = dir_mtime_tracks_changes(os.path.join(drive, os.sep) if drive else os.sep)
+        settled = time.time_ns() - SCAN_CACHE_SETTLE_NS
+        paths = []
+        with self._scan_cache_lock:
+            cache = self._load_scan_cache()
+            changed = False
+            pending = [root]
+            while pending:
+                current = pending.pop()
+                try:
+                    mtime = os.stat(current).st_mtime_ns
+                except OSError:
+                    continue
+                cached = cache.get(current) if use_cache else None
+                if cached and cached[0] == mtime:
+                    names, subdirs = cached[1], cached[2]
+                else:
+                    names, subdirs = [], []
+                    try:
+                        with os.scandir(current) as it:
+                            for entry in it:
+                                try:
+                                    if entry.is_file():
+                                        names.append(entry.name)
+                                    elif entry.is_dir(follow_symlinks=False):
+                                        subdirs.append(entry.name)
+                                except OSError:
+                                    continue
+                    except OSError:
+                        continue
+                    if use_cache and mtime < settled:
+                        cache[current] = [mtime, names, subdirs]
+                        changed = True
+                    elif cached:
+                        del cache[current]
+                        changed = True
+                paths.extend(os.path.join(current, name) for name in names)
+                if recursive:
+                    pending.extend(os.path.join(current, name) for name in subdirs)
+            if changed:
+                self._save_scan_cache()
+        return paths
+    
+    def _load_scan_cache(self):
+        """Return the folder listing cache, reading scan_cache_file the first time"""
+        if self._scan_cache is None:
+            try:
+                with open(self.scan_cache_file, 'rb') as f:
+                    self._scan_cache = json_loads_bytes(f.read())
+            except (OSError, ValueError):
+                self._scan_cache = {}
+        return self._scan_cache
+    
+    def _save_scan_cache(self):
+        """Write the folder listing cache (atomically), dropping it if it grew too big"""
+        if len(self._scan_cache) > SCAN_CACHE_MAX_DIRS:
+            self._scan_cache.clear()
+        try:
+            temp_path = self.scan_cache_file.with_name(self.scan_cache_file.name + '.tmp')
+            with open(temp_path, 'wb') as f:
+                f.write(json_dumps_bytes(self._scan_cache, indent=False))
+            os.replace(temp_path, self.scan_cache_file)
+        except OSError:
+            pass
+    
     def find_cue_files(self, directory, recursive=True):
         """Find all .cue files in directory"""
-        cue_files = []
-        path = Path(directory)
-        
-        if recursive:
-            cue_files = list(path.rglob("*.cue"))
-        else:
-            cue_files = list(path.glob("*.cue"))
-        
-        return sorted(cue_files)
+        return sorted(Path(p) for p in self._scan_file_paths(directory, recursive)
+                      if p.lower().endswith('.cue'))
 
     def find_compressed_files(self, directory, recursive=True):
-        """Find all compressed files in directory"""
-        path = Path(directory)
-        compressed_files = []
-        
-        for ext in COMPRESSED_EXTENSIONS:
-            if recursive:
-                compressed_files.extend(path.rglob(f"*{ext}"))
-            else:
-                compressed_files.extend(path.glob(f"*{ext}"))
-        
-        return sorted(compressed_files)
+        """Find all compressed files in directory (extensions matched case-insensitively)"""
+        suffixes = tuple(COMPRESSED_EXTENSIONS)
+        return sorted(Path(p) for p in self._scan_file_paths(directory, recursive)
+                      if p.lower().endswith(suffixes))
     
     def extract_archive(self, archive_path):
         """Extract a compressed archive to a folder with the same name"""
@@ -3323,19 +4641,24 @@ obtained ROM files.
             if ext == '.zip':
                 self.log(f"  📦 Extracting ZIP: {archive_path.name}")
                 with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(extract_folder)
+                    skipped = extract_zip_streaming(zip_ref, extract_folder)
+                for name in skipped:
+                    self.log(f"  ⚠️  Skipped unsafe path in archive: {name}")
                 self.log(f"  ✅ Extracted to: {extract_folder.name}/")
-                gc.collect()  # Free memory after extraction
                 return True, extract_folder
             
             # Handle .tar, .tar.gz, .tgz files using Python's tarfile
             elif ext in ['.tar', '.gz', '.tgz'] or archive_path.name.endswith('.tar.gz'):
                 self.log(f"  📦 Extracting TAR: {archive_path.name}")
-                mode = 'r:gz' if ext in ['.gz', '.tgz'] or archive_path.name.endswith('.tar.gz') else 'r'
-                with tarfile.open(archive_path, mode) as tar_ref:
-                    tar_ref.extractall(extract_folder)
+                # Stream mode: one forward pass, read in EXTRACT_CHUNK_SIZE blocks,
+                # which is all the member-by-member extraction needs. A plain
+                # .tar may still be compressed, so 'r|*' detects that.
+                mode = 'r|gz' if ext in ['.gz', '.tgz'] or archive_path.name.endswith('.tar.gz') else 'r|*'
+                with tarfile.open(archive_path, mode, bufsize=EXTRACT_CHUNK_SIZE) as tar_ref:
+                    skipped = extract_tar_streaming(tar_ref, extract_folder)
+                for name in skipped:
+                    self.log(f"  ⚠️  Skipped unsafe path in archive: {name}")
                 self.log(f"  ✅ Extracted to: {extract_folder.name}/")
-                gc.collect()  # Free memory after extraction
                 return True, extract_folder
             
             # Handle .7z and .rar files using 7-Zip
@@ -3352,20 +4675,41 @@ obtained ROM files.
                 if sys.platform == 'win32':
                     creationflags = 0x00004000  # BELOW_NORMAL_PRIORITY_CLASS
                 
-                result = subprocess.run(
-                    cmd, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=3600,
+                # Stream 7-Zip's output instead of buffering all of it; only
+                # the last lines are kept, for the failure message
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    errors='replace',
                     creationflags=creationflags if sys.platform == 'win32' else 0
                 )
+                output_tail = deque(maxlen=20)
+                
+                def read_output():
+                    for line in process.stdout:
+                        line = line.strip()
+                        if line:
+                            output_tail.append(line)
+                            if line.startswith(('ERROR', 'WARNING')):
+                                self.log(f"  {line}")
+                
+                reader = threading.Thread(target=read_output, daemon=True)
+                reader.start()
+                try:
+                    returncode = process.wait(timeout=3600)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    raise
+                finally:
+                    reader.join(timeout=5)
                 
-                if result.returncode == 0:
+                if returncode == 0:
                     self.log(f"  ✅ Extracted to: {extract_folder.name}/")
-                    gc.collect()  # Free memory after extraction
                     return True, extract_folder
                 else:
-                    self.log(f"  ❌ 7-Zip extraction failed: {result.stderr.strip()}")
+                    self.log(f"  ❌ 7-Zip extraction failed: {' | '.join(output_tail)}")
                     return False, None
             
             else:
@@ -3399,63 +4743,46 @@ obtained ROM files.
         self.log("")
         
         extracted_folders = []
+        delete_after = self.delete_archives_after_extract.get()
+        to_delete = []
         for archive in compressed_files:
             success, folder = self.extract_archive(archive)
+            self._collect_if_rss_grew()
             if success and folder:
                 extracted_folders.append(folder)
                 
-                # Delete archive if option is enabled
-                if self.delete_archives_after_extract.get():
-                    try:
-                        archive.unlink()
-                        self.log(f"  🗑️  Deleted archive: {archive.name}")
-                    except Exception as e:
-                        self.log(f"  ⚠️  Could not delete archive: {e}")
+                # Delete archive if option is enabled (batched after the loop)
+                if delete_after:
+                    to_delete.append(archive)
+        
+        for archive, error in delete_files(to_delete):
+            if error is None:
+                self.log(f"  🗑️  Deleted archive: {archive.name}")
+            else:
+                self.log(f"  ⚠️  Could not delete archive: {error}")
         
         return extracted_folders
 
     def find_game_files(self, directory, recursive=True):
         """Find all supported game descriptor files (.cue and optionally .iso, .nes, .sfc, .smc, .snes, .n64, .z64, .v64)"""
-        path = Path(directory)
-        files = set()
-        if recursive:
-            if self.process_ps1_cues.get():
-                files.update(path.rglob("*.cue"))
-            if self.process_ps2_cues.get():
-                files.update(path.rglob("*.cue"))
-            if self.process_ps2_isos.get():
-                files.update(path.rglob("*.iso"))
-            if self.process_psp_isos.get():
-                files.update(path.rglob("*.iso"))
-            if self.process_nes_roms.get():
-                files.update(path.rglob("*.nes"))
-            if self.process_snes_roms.get():
-                files.update(path.rglob("*.sfc"))
-                files.update(path.rglob("*.smc"))
-                files.update(path.rglob("*.snes"))
-            if self.process_n64_roms.get():
-                files.update(path.rglob("*.n64"))
-                files.update(path.rglob("*.z64"))
-                files.update(path.rglob("*.v64"))
-        else:
-            if self.process_ps1_cues.get():
-                files.update(path.glob("*.cue"))
-            if self.process_ps2_cues.get():
-                files.update(path.glob("*.cue"))
-            if self.process_ps2_isos.get():
-                files.update(path.glob("*.iso"))
-            if self.process_psp_isos.get():
-                files.update(path.glob("*.iso"))
-            if self.process_nes_roms.get():
-                files.update(path.glob("*.nes"))
-            if self.process_snes_roms.get():
-                files.update(path.glob("*.sfc"))
-                files.update(path.glob("*.smc"))
-                files.update(path.glob("*.snes"))
-            if self.process_n64_roms.get():
-                files.update(path.glob("*.n64"))
-                files.update(path.glob("*.z64"))
-                files.update(path.glob("*.v64"))
+        # Extensions wanted under the current toggles (a set, so .cue/.iso
+        # enabled by two toggles is still matched once), then one walk
+        extensions = set()
+        if self.process_ps1_cues.get() or self.process_ps2_cues.get():
+            extensions.add('.cue')
+        if self.process_ps2_isos.get() or self.process_psp_isos.get():
+            extensions.add('.iso')
+        if self.process_nes_roms.get():
+            extensions.add('.nes')
+        if self.process_snes_roms.get():
+            extensions.update(('.sfc', '.smc', '.snes'))
+        if self.process_n64_roms.get():
+            extensions.update(('.n64', '.z64', '.v64'))
+        if not extensions:
+            return []
+        
+        files = [Path(p) for p in self._scan_file_paths(directory, recursive)
+                 if os.path.splitext(p)[1].lower() in extensions]
         # Sort for stable processing order
         return sorted(files)
     
@@ -3471,12 +4798,8 @@ obtained ROM files.
         repairs = {}  # old_name -> new_name
         
         try:
-            with open(cue_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
             # Find FILE entries in CUE
-            file_pattern = re.compile(r'FILE\s+"([^"]+)"\s+BINARY', re.IGNORECASE)
-            matches = file_pattern.findall(content)
+            matches = cue_bin_names(cue_path)
             
             for match in matches:
                 bin_path = cue_dir / match
@@ -3491,7 +4814,7 @@ obtained ROM files.
                     
                     # Try finding by partial match - look for BINs that might be the cleaned version
                     # Extract track info if present
-                    track_match = re.search(r'(Track\s*\d+|\(Track\s*\d+\))', match, re.IGNORECASE)
+                    track_match = CUE_TRACK_RE.search(match)
                     track_info = track_match.group(1) if track_match else None
                     
                     # Get the CUE file's base name (likely already cleaned)
@@ -3530,7 +4853,8 @@ obtained ROM files.
             # Auto-repair CUE file if we found renamed BINs
             if auto_repair and cue_needs_repair and repairs:
                 try:
-                    new_content = content
+                    with open(cue_path, 'r', encoding='utf-8', errors='ignore') as f:
+                        new_content = f.read()
                     for old_name, new_name in repairs.items():
                         new_content = new_content.replace(f'"{old_name}"', f'"{new_name}"')
                     
@@ -4306,11 +5630,12 @@ obtained ROM files.
                 creationflags = 0x00000040
             
             # Use Popen for real-time progress monitoring
+            # stderr is merged into stdout so the one reader thread drains
+            # everything (an unread second pipe could fill and stall the tool)
             process = subprocess.Popen(
                 cmd,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.STDOUT,
                 creationflags=creationflags if sys.platform == 'win32' else 0
             )
             
@@ -4322,18 +5647,27 @@ obtained ROM files.
             stall_start_time = None  # Track when write speed dropped to 0
             last_shown_phase = None  # Avoid duplicate phase messages
             tool_progress = [None]  # Progress reported by chdman/maxcso (list for thread access)
-            stderr_lines = []  # Collect stderr for error reporting
+            output_chunks = []  # Collect raw tool output for error reporting
             
-            # Background thread to read stderr and parse tool progress
+            # Background thread to read tool output and parse progress.
+            # Output stays bytes; chdman redraws its progress line with \r,
+            # so split on both \r and \n and keep the newest percentage.
             def read_stderr():
                 try:
-                    for line in process.stderr:
-                        stderr_lines.append(line)
+                    pending = b''
+                    while True:
+                        chunk = process.stdout.read1(65536)
+                        if not chunk:
+                            break
+                        output_chunks.append(chunk)
+                        *lines, pending = (pending + chunk).replace(b'\r', b'\n').split(b'\n')
                         # Parse chdman progress (e.g., "Compressing, 45.3% complete...")
                         # or maxcso progress
-                        match = re.search(r'(\d+\.?\d*)%', line)
-                        if match:
-                            tool_progress[0] = float(match.group(1))
+                        for line in reversed(lines):
+                            percent = parse_progress_percent(line)
+                            if percent is not None:
+                                tool_progress[0] = percent
+                                break
                 except Exception:
                     pass
             
@@ -4404,8 +5738,8 @@ obtained ROM files.
             
             # Wait for stderr thread to finish and get final output
             stderr_thread.join(timeout=5.0)
-            stdout, _ = process.communicate(timeout=60)
-            stderr = ''.join(stderr_lines)
+            process.wait(timeout=60)
+            stderr = b''.join(output_chunks).decode('utf-8', 'replace')
             returncode = process.returncode
             
             elapsed_total = time.time() - start_time
@@ -4420,8 +5754,7 @@ obtained ROM files.
                 self.total_chd_size += new_size
 
                 # Track completion for crash recovery
-                self.completed_files.add(str(path))
-                self.save_progress(self.source_dir)
+                self.record_completed(path)
 
                 self.log(f"  ✅ Complete! Saved {savings:.1f}% space in {elapsed_total:.1f}s (avg: {avg_speed:.1f} MB/s)")
                 if original_size >= 1024*1024*1024:
@@ -4430,7 +5763,7 @@ obtained ROM files.
                     self.log(f"     Original: {original_size / (1024*1024):.1f} MB → {format_label}: {new_size / (1024*1024):.1f} MB")
                 return True
             else:
-                error_text = stderr.strip() or stdout.strip()
+                error_text = stderr.strip()
                 self.log(f"  ❌ Conversion failed: {error_text}")
                 # Clean up partial output file if it exists
                 if output_path.exists():
@@ -4532,23 +5865,42 @@ obtained ROM files.
                 pass
         
         # Record start time for metrics
-        with self.metrics_lock:
-            self.file_start_times[cue_file] = time.time()
+        self.file_start_times[cue_file] = time.time()
         self.log(f"\n[{file_num}/{total}] Processing: {cue_file.name}")
         
         success = self.convert_game(cue_file)
-        
-        # Force garbage collection after each conversion to free memory
-        gc.collect()
+        self._collect_if_rss_grew()
         
         if success:
-            if self.delete_originals.get():
+            if self.convert_delete_originals:
                 self.delete_original_files(cue_file)
-            elif self.move_to_backup.get():
+            elif self.convert_move_to_backup:
                 self.move_to_backup_folder(cue_file)
         
         return success
     
+    def _collect_if_rss_grew(self):
+        """Run a full gc.collect() only if this process's RSS grew gc_rss_growth_bytes since the last check.
+        
+        Extraction and conversion do their heavy lifting in streams and
+        external tools, so a full collection after every file mostly just
+        walks the live heap for nothing.
+        """
+        if not PSUTIL_AVAILABLE:
+            return
+        try:
+            rss = psutil.Process().memory_info().rss
+        except Exception:
+            return
+        baseline = self._gc_rss_baseline
+        if baseline is not None and rss - baseline > self.gc_rss_growth_bytes:
+            # Full collection: garbage that built up over a long batch sits in
+            # the oldest generation, which gc.collect(1) would not touch
+            gc.collect()
+            rss = psutil.Process().memory_info().rss
+        if baseline is None or rss - baseline > self.gc_rss_growth_bytes or rss < baseline:
+            self._gc_rss_baseline = rss
+    
     def _wait_for_memory_pressure(self, max_wait=120):
         """Wait if RAM usage is critically high to prevent system freeze.
         
@@ -4817,6 +6169,7 @@ obtained ROM files.
         
         extracted_folders = []
         extracted_archives = []
+        recursive = self.recursive.get()
         
         # First, extract any compressed files if enabled
         if self.extract_compressed.get():
@@ -4824,16 +6177,16 @@ obtained ROM files.
             self.log("EXTRACTING COMPRESSED FILES...")
             self.log("="*60)
             
-            extracted_folders = self.extract_all_archives(self.source_dir, self.recursive.get())
+            extracted_folders = self.extract_all_archives(self.source_dir, recursive)
             # Track which archives were extracted
             if extracted_folders:
-                extracted_archives = self.find_compressed_files(self.source_dir, self.recursive.get())
+                extracted_archives = self.find_compressed_files(self.source_dir, recursive)
             
             if extracted_folders:
                 self.log(f"\n✅ Extracted {len(extracted_folders)} archive(s)")
                 self.log("Now scanning for game files in extracted folders...\n")
         
-        game_files = self.find_game_files(self.source_dir, self.recursive.get())
+        game_files = self.find_game_files(self.source_dir, recursive)
         
         # Filter out already completed files (crash recovery)
         original_count = len(game_files)
@@ -4857,6 +6210,9 @@ obtained ROM files.
             self.master.after(0, self.conversion_complete)
             return
         
+        # Write the batch header once; completed files are appended as they finish
+        self.save_progress(self.source_dir)
+        
         # Reset size tracking
         self.total_original_size = 0
         self.total_chd_size = 0
@@ -4895,19 +6251,34 @@ obtained ROM files.
                 self.log(f"🔧 Using {self.max_workers} concurrent conversion(s) (user limit)")
         
         # Use ThreadPoolExecutor for parallel processing with dynamic worker adjustment
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all conversion jobs
-            futures = {executor.submit(self.process_single_file, f, i, total): f for i, f in enumerate(game_files, 1)}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='convert-worker') as executor:
+            # Keep at most 2x workers jobs in flight so huge batches don't
+            # queue a Future per file up front; refill as jobs finish
+            futures = {}
+            pending_jobs = enumerate(game_files, 1)
+            max_in_flight = self.max_workers * 2
+            
+            def submit_more():
+                while len(futures) < max_in_flight:
+                    job = next(pending_jobs, None)
+                    if job is None:
+                        break
+                    i, f = job
+                    futures[executor.submit(self.process_single_file, f, i, total)] = f
+            
+            submit_more()
             
             # Track last resource check time
             last_resource_check = time.time()
             resource_check_interval = 5.0  # Check every 5 seconds
             
             # Process results as they complete
-            for future in as_completed(futures):
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
                 if not self.is_converting:
                     self.log("\n⛔ Conversion stopped by user")
-                    executor.shutdown(wait=False, cancel_futures=True)
+                    for future in futures:
+                        future.cancel()
                     break
                 
                 # Periodically check system resources and warn if needed
@@ -4922,32 +6293,35 @@ obtained ROM files.
                             pass
                     last_resource_check = current_time
                 
-                try:
-                    result = future.result()
-                    if result is not None:
-                        if result:
-                            successful += 1
-                        else:
-                            failed += 1
-                        
-                        completed += 1
-                        # Metrics update
-                        with self.metrics_lock:
+                for future in done:
+                    game_file = futures.pop(future)
+                    try:
+                        result = future.result()
+                        if result is not None:
+                            if result:
+                                successful += 1
+                            else:
+                                failed += 1
+                            
+                            completed += 1
+                            # Metrics update (only this thread writes these; the
+                            # UI tick just reads a snapshot, so no lock is needed)
                             self.completed_jobs = completed
-                            started_at = self.file_start_times.get(futures[future])
+                            started_at = self.file_start_times.get(game_file)
                             if started_at:
                                 self.file_durations.append(time.time() - started_at)
-                        
-                        # Throttle progress bar updates (every 1% or every file if < 100 files)
-                        progress_value = (completed / total) * 100
-                        should_update = (total < 100) or (int(progress_value) > int((completed - 1) / total * 100))
-                        if should_update:
-                            self.master.after(0, lambda v=progress_value: self.progress.config(value=v))
+                            
+                            # Throttle progress bar updates (every 1% or every file if < 100 files)
+                            progress_value = (completed / total) * 100
+                            should_update = (total < 100) or (int(progress_value) > int((completed - 1) / total * 100))
+                            if should_update:
+                                self.master.after(0, lambda v=progress_value: self.progress.config(value=v))
+                    
+                    except Exception as e:
+                        failed += 1
+                        self.log(f"❌ Exception processing {game_file.name}: {e}")
                 
-                except Exception as e:
-                    failed += 1
-                    cue_file = futures[future]
-                    self.log(f"❌ Exception processing {cue_file.name}: {e}")
+                submit_more()
         
         self.log("\n" + "="*60)
         self.log("CONVERSION COMPLETE!")
@@ -5047,6 +6421,9 @@ obtained ROM files.
         self.current_batch_id = str(uuid.uuid4())
         
         self.is_converting = True
+        # Snapshot the post-conversion options; workers read these per file
+        self.convert_delete_originals = self.delete_originals.get()
+        self.convert_move_to_backup = self.move_to_backup.get()
         # Initialize metrics tracking
         self.metrics_running = True
         self.conversion_start_time = time.time()
@@ -5065,7 +6442,7 @@ obtained ROM files.
         self.convert_button.config(state="disabled")
         self.scan_button.config(state="disabled")
         self.stop_button.config(state="normal")
-        self.status_label.config(text="⚡ CONVERTING...", fg=COLORS['accent_yellow'])
+        self.status_label.config(text="⚡ CONVERTING...", fg=self.colors.accent_yellow)
         
         # Run conversion in separate thread
         thread = threading.Thread(target=self.conversion_thread, daemon=True)
@@ -5077,7 +6454,7 @@ obtained ROM files.
         """Stop the conversion process"""
         self.is_converting = False
         self.stop_button.config(state="disabled")
-        self.status_label.config(text="■ STOPPING...", fg=COLORS['accent_orange'])
+        self.status_label.config(text="■ STOPPING...", fg=self.colors.accent_orange)
     
     def conversion_complete(self):
         """Called when conversion is complete"""
@@ -5087,7 +6464,7 @@ obtained ROM files.
         self.progress.config(value=0)
         total_cores = multiprocessing.cpu_count()
         self.status_label.config(text=f"▶ READY | {self.cpu_cores}/{total_cores} CPU CORES | 1 CORE RESERVED", 
-                                fg=COLORS['text_primary'])
+                                fg=self.colors.text_primary)
         self.metrics_running = False
         self.metrics_label.config(text="◆ METRICS: IDLE ◆")
 
@@ -5105,10 +6482,9 @@ obtained ROM files.
     def update_metrics(self):
         if not self.metrics_running:
             return
-        with self.metrics_lock:
-            completed = self.completed_jobs
-            total = self.total_jobs
-            durations = list(self.file_durations)
+        completed = self.completed_jobs
+        total = self.total_jobs
+        durations = list(self.file_durations)
         avg_time = (sum(durations)/len(durations)) if durations else 0
         remaining = max(total - completed, 0)
         overall_eta = avg_time * (remaining / max(self.cpu_cores, 1)) if avg_time else None
@@ -5176,23 +6552,23 @@ obtained ROM files.
         dialog.resizable(True, True)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=6)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=6)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="📁 CHD FILE MANAGER", font=self.font_heading_md,
-              fg=COLORS['accent_purple'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.accent_purple, bg=self.colors.bg_light).pack()
         
         # Source directory
-        source_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        source_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         source_frame.pack(fill="x")
         
         Label(source_frame, text="📂 Source:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         source_entry = Entry(source_frame, font=self.font_body,
-                            bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'], relief="flat")
+                            bg=self.colors.bg_input, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary, relief="flat")
         source_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         if self.source_dir:
             source_entry.insert(0, self.source_dir)
@@ -5204,18 +6580,18 @@ obtained ROM files.
                 source_entry.insert(0, folder)
         
         Button(source_frame, text="[ BROWSE ]", command=browse_source,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Destination directory
-        dest_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        dest_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         dest_frame.pack(fill="x")
         
         Label(dest_frame, text="📁 Destination:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         dest_entry = Entry(dest_frame, font=self.font_body,
-                          bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                          insertbackground=COLORS['text_primary'], relief="flat")
+                          bg=self.colors.bg_input, fg=self.colors.text_primary,
+                          insertbackground=self.colors.text_primary, relief="flat")
         dest_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         
         def browse_dest():
@@ -5225,52 +6601,52 @@ obtained ROM files.
                 dest_entry.insert(0, folder)
         
         Button(dest_frame, text="[ BROWSE ]", command=browse_dest,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Options
-        options_frame = Frame(dialog, padx=10, pady=8, bg=COLORS['bg_light'])
+        options_frame = Frame(dialog, padx=10, pady=8, bg=self.colors.bg_light)
         options_frame.pack(fill="x", padx=10, pady=5)
         
         cb_font = ("Consolas", 9)
-        cb_bg = COLORS['bg_light']
+        cb_bg = self.colors.bg_light
         
         remove_locale = BooleanVar(value=True)
         Checkbutton(options_frame, text="↳ Remove locale descriptors (USA, Europe, Japan, etc.)", 
                    variable=remove_locale, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(anchor="w")
         
         recursive_scan = BooleanVar(value=True)
         Checkbutton(options_frame, text="↳ Scan subdirectories", 
                    variable=recursive_scan, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(anchor="w")
         
         copy_instead = BooleanVar(value=False)
         Checkbutton(options_frame, text="↳ Copy files instead of moving", 
                    variable=copy_instead, font=self.font_small,
-                   fg=COLORS['accent_orange'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.accent_orange, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(anchor="w")
         
         # Results area
-        results_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        results_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         results_frame.pack(fill="both", expand=True)
         
         Label(results_frame, text="◄ SCAN RESULTS ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(0, 4))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(0, 4))
         
-        list_frame = Frame(results_frame, bg=COLORS['bg_dark'])
+        list_frame = Frame(results_frame, bg=self.colors.bg_dark)
         list_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(list_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'])
+        scrollbar = Scrollbar(list_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark)
         scrollbar.pack(side="right", fill="y")
         
         results_text = Text(list_frame, wrap="word", yscrollcommand=scrollbar.set,
                            height=10, font=self.font_mono,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                           insertbackground=COLORS['text_primary'], relief="flat",
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                           insertbackground=self.colors.text_primary, relief="flat",
                            padx=8, pady=8)
         results_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=results_text.yview)
@@ -5391,24 +6767,24 @@ obtained ROM files.
                 messagebox.showinfo("Complete", f"Successfully {'copied' if copy_instead.get() else 'moved'} {success_count} file(s)")
         
         # Action buttons with retro styling
-        action_frame = Frame(dialog, padx=10, pady=10, bg=COLORS['bg_dark'])
+        action_frame = Frame(dialog, padx=10, pady=10, bg=self.colors.bg_dark)
         action_frame.pack(fill="x")
         
         Button(action_frame, text="▶ SCAN", command=scan_for_chd,
                font=self.font_button,
-               bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['text_primary'],
+               bg=self.colors.button_green, fg=self.colors.bg_dark,
+               activebackground=self.colors.text_primary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
  
         Button(action_frame, text="📁 MOVE/COPY", command=execute_move,
                font=self.font_button,
-               bg=COLORS['button_blue'], fg="white",
-               activebackground=COLORS['text_secondary'],
+               bg=self.colors.button_blue, fg="white",
+               activebackground=self.colors.text_secondary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
  
         Button(action_frame, text="✕ CLOSE", command=dialog.destroy,
                font=self.font_button,
-               activebackground=COLORS['accent_red'],
+               activebackground=self.colors.accent_red,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="right", padx=5)
 
     def cleanup_compressed_dialog(self):
@@ -5419,23 +6795,23 @@ obtained ROM files.
         dialog.resizable(True, True)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=6)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=6)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="🗑️ CLEANUP MANAGER", font=self.font_heading_md,
-              fg=COLORS['accent_orange'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.accent_orange, bg=self.colors.bg_light).pack()
         
         # Source directory
-        source_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        source_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         source_frame.pack(fill="x")
         
         Label(source_frame, text="📂 Source:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         source_entry = Entry(source_frame, font=self.font_body,
-                            bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'], relief="flat")
+                            bg=self.colors.bg_input, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary, relief="flat")
         source_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         if self.source_dir:
             source_entry.insert(0, self.source_dir)
@@ -5447,39 +6823,39 @@ obtained ROM files.
                 source_entry.insert(0, folder)
         
         Button(source_frame, text="[ BROWSE ]", command=browse_source,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Options
-        options_frame = Frame(dialog, padx=10, pady=8, bg=COLORS['bg_light'])
+        options_frame = Frame(dialog, padx=10, pady=8, bg=self.colors.bg_light)
         options_frame.pack(fill="x", padx=10, pady=5)
         
-        cb_bg = COLORS['bg_light']
+        cb_bg = self.colors.bg_light
         
         recursive_scan = BooleanVar(value=True)
         Checkbutton(options_frame, text="↳ Scan subdirectories", 
                    variable=recursive_scan, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(anchor="w")
         
         # Results area
-        results_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        results_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         results_frame.pack(fill="both", expand=True)
         
         Label(results_frame, text="◄ SCAN RESULTS ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(0, 4))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(0, 4))
         
-        list_frame = Frame(results_frame, bg=COLORS['bg_dark'])
+        list_frame = Frame(results_frame, bg=self.colors.bg_dark)
         list_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(list_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'])
+        scrollbar = Scrollbar(list_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark)
         scrollbar.pack(side="right", fill="y")
         
         results_text = Text(list_frame, wrap="word", yscrollcommand=scrollbar.set,
                            height=10, font=self.font_mono,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                           insertbackground=COLORS['text_primary'], relief="flat",
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                           insertbackground=self.colors.text_primary, relief="flat",
                            padx=8, pady=8)
         results_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=results_text.yview)
@@ -5501,14 +6877,6 @@ obtained ROM files.
             # Find compressed files
             archives = self.find_compressed_files(source, recursive_scan.get())
             
-            # Find extracted folders (folders matching archive names without extensions)
-            path = Path(source)
-            all_dirs = []
-            if recursive_scan.get():
-                all_dirs = [d for d in path.rglob("*") if d.is_dir()]
-            else:
-                all_dirs = [d for d in path.glob("*") if d.is_dir()]
-            
             total_archive_size = 0
             total_folder_size = 0
             
@@ -5535,9 +6903,8 @@ obtained ROM files.
                         found_folders.append(potential_folder)
                         # Calculate folder size
                         folder_size = 0
-                        for item in potential_folder.rglob("*"):
-                            if item.is_file():
-                                folder_size += item.stat().st_size
+                        for entry in self._scan_file_entries(potential_folder):
+                            folder_size += entry.stat().st_size
                         folder_mb = folder_size / (1024 * 1024)
                         total_folder_size += folder_size
                         results_text.insert("end", f"📁 {potential_folder.name}/ ({folder_mb:.1f} MB)\n")
@@ -5609,24 +6976,24 @@ obtained ROM files.
             found_folders.clear()
         
         # Action buttons with retro styling
-        action_frame = Frame(dialog, padx=10, pady=10, bg=COLORS['bg_dark'])
+        action_frame = Frame(dialog, padx=10, pady=10, bg=self.colors.bg_dark)
         action_frame.pack(fill="x")
         
         Button(action_frame, text="▶ SCAN", command=scan_for_cleanup,
                font=self.font_button,
-               bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['text_primary'],
+               bg=self.colors.button_green, fg=self.colors.bg_dark,
+               activebackground=self.colors.text_primary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
  
         Button(action_frame, text="🗑️ DELETE", command=execute_cleanup,
                font=self.font_button,
-               bg=COLORS['accent_red'], fg="white",
-               activebackground=COLORS['accent_orange'],
+               bg=self.colors.accent_red, fg="white",
+               activebackground=self.colors.accent_orange,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
  
         Button(action_frame, text="✕ CLOSE", command=dialog.destroy,
                font=self.font_button,
-               activebackground=COLORS['accent_red'],
+               activebackground=self.colors.accent_red,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="right", padx=5)
 
     def clean_names_dialog(self):
@@ -5637,25 +7004,25 @@ obtained ROM files.
         dialog.resizable(True, True)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=6)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=6)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="✨ CLEAN ROM NAMES", font=self.font_heading_md,
-              fg=COLORS['accent_pink'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.accent_pink, bg=self.colors.bg_light).pack()
         Label(title_frame, text="Remove region codes, revision tags, and other metadata from filenames",
-              font=self.font_small, fg=COLORS['text_muted'], bg=COLORS['bg_light']).pack()
+              font=self.font_small, fg=self.colors.text_muted, bg=self.colors.bg_light).pack()
         
         # Source directory
-        source_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        source_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         source_frame.pack(fill="x")
         
         Label(source_frame, text="📂 Source:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         source_entry = Entry(source_frame, font=self.font_body,
-                            bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'], relief="flat")
+                            bg=self.colors.bg_input, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary, relief="flat")
         source_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         if self.source_dir:
             source_entry.insert(0, self.source_dir)
@@ -5667,48 +7034,48 @@ obtained ROM files.
                 source_entry.insert(0, folder)
         
         Button(source_frame, text="[ BROWSE ]", command=browse_source,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Options
-        options_frame = Frame(dialog, padx=10, pady=8, bg=COLORS['bg_light'])
+        options_frame = Frame(dialog, padx=10, pady=8, bg=self.colors.bg_light)
         options_frame.pack(fill="x", padx=10, pady=5)
         
-        cb_bg = COLORS['bg_light']
+        cb_bg = self.colors.bg_light
         
         recursive_scan = BooleanVar(value=True)
         Checkbutton(options_frame, text="↳ Scan subdirectories", 
                    variable=recursive_scan, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(anchor="w")
         
         # Info about what will be removed
-        info_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        info_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         info_frame.pack(fill="x")
         
         Label(info_frame, text="Will REMOVE: (USA), (Europe), (Japan), (En), (Rev 1), (v1.0), [!], etc.",
-              font=self.font_small, fg=COLORS['accent_red'], bg=COLORS['bg_dark']).pack(anchor="w")
+              font=self.font_small, fg=self.colors.accent_red, bg=self.colors.bg_dark).pack(anchor="w")
         Label(info_frame, text="Will KEEP: (Disc 1), (Disc 2), (Bonus Disc), (Demo), (Beta), (Proto), etc.",
-              font=self.font_small, fg=COLORS['button_green'], bg=COLORS['bg_dark']).pack(anchor="w")
+              font=self.font_small, fg=self.colors.button_green, bg=self.colors.bg_dark).pack(anchor="w")
         
         # Results area
-        results_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        results_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         results_frame.pack(fill="both", expand=True)
         
         Label(results_frame, text="◄ PREVIEW CHANGES ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(0, 4))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(0, 4))
         
-        list_frame = Frame(results_frame, bg=COLORS['bg_dark'])
+        list_frame = Frame(results_frame, bg=self.colors.bg_dark)
         list_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(list_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'])
+        scrollbar = Scrollbar(list_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark)
         scrollbar.pack(side="right", fill="y")
         
         results_text = Text(list_frame, wrap="word", yscrollcommand=scrollbar.set,
                            height=15, font=self.font_mono,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                           insertbackground=COLORS['text_primary'], relief="flat",
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                           insertbackground=self.colors.text_primary, relief="flat",
                            padx=8, pady=8)
         results_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=results_text.yview)
@@ -5718,176 +7085,7 @@ obtained ROM files.
         # Store rename history for undo (list of (new_path, original_path) tuples)
         rename_history = []
         
-        def get_clean_name(filename):
-            """Clean a ROM filename by removing unwanted tags while preserving important ones."""
-            name = filename
-            
-            # Tags to KEEP (case-insensitive patterns that should be preserved)
-            keep_patterns = [
-                r'\(Disc\s*\d+\)',           # (Disc 1), (Disc 2), etc.
-                r'\(Disk\s*\d+\)',           # (Disk 1), (Disk 2), etc.
-                r'\(Bonus\s*Disc\)',         # (Bonus Disc)
-                r'\(Bonus\s*Disk\)',         # (Bonus Disk)
-                r'\(Custom\s*Install\s*Disc\)', # (Custom Install Disc)
-                r'\(Install\s*Disc\)',       # (Install Disc)
-                r'\(Demo\)',                 # (Demo)
-                r'\(Beta\)',                 # (Beta)
-                r'\(Proto\)',                # (Proto)
-                r'\(Prototype\)',            # (Prototype)
-                r'\(Sample\)',               # (Sample)
-                r'\(Promo\)',                # (Promo)
-                r'\(Kiosk\)',                # (Kiosk)
-                r'\(Limited\s*Edition\)',    # (Limited Edition)
-                r'\(Collector.?s?\s*Edition\)', # (Collector's Edition)
-                r'\(Special\s*Edition\)',    # (Special Edition)
-                r'\(Game\s*of.*Year\)',      # (Game of the Year)
-                r'\(GOTY\)',                 # (GOTY)
-                r'\(Director.?s?\s*Cut\)',   # (Director's Cut)
-                r'\(Uncut\)',                # (Uncut)
-                r'\(Black\s*Label\)',        # (Black Label)
-                r'\(Greatest\s*Hits\)',      # (Greatest Hits)
-                r'\(Platinum\)',             # (Platinum)
-                r'\(Player.?s?\s*Choice\)',  # (Player's Choice)
-                r'\(Nintendo\s*Selects\)',   # (Nintendo Selects)
-                r'\(Budget\)',               # (Budget)
-                r'\(Reprint\)',              # (Reprint)
-                r'\(Alt\)',                  # (Alt) - alternate version
-                r'\(Part\s*\d+\)',           # (Part 1), (Part 2)
-                r'\(Side\s*[AB]\)',          # (Side A), (Side B)
-            ]
-            
-            # Extract tags to keep
-            preserved_tags = []
-            for pattern in keep_patterns:
-                matches = re.findall(pattern, name, re.IGNORECASE)
-                preserved_tags.extend(matches)
-            
-            # Tags to REMOVE (region codes, languages, revisions, etc.)
-            remove_patterns = [
-                r'\(USA\)',
-                r'\(U\)',
-                r'\(America\)',
-                r'\(Europe\)',
-                r'\(E\)',
-                r'\(EU\)',
-                r'\(Japan\)',
-                r'\(J\)',
-                r'\(JP\)',
-                r'\(Korea\)',
-                r'\(K\)',
-                r'\(KR\)',
-                r'\(Asia\)',
-                r'\(A\)',
-                r'\(World\)',
-                r'\(W\)',
-                r'\(Australia\)',
-                r'\(AU\)',
-                r'\(France\)',
-                r'\(F\)',
-                r'\(Fr\)',
-                r'\(Germany\)',
-                r'\(G\)',
-                r'\(De\)',
-                r'\(Spain\)',
-                r'\(S\)',
-                r'\(Es\)',
-                r'\(Italy\)',
-                r'\(I\)',
-                r'\(It\)',
-                r'\(Netherlands\)',
-                r'\(Nl\)',
-                r'\(Sweden\)',
-                r'\(Sw\)',
-                r'\(Sv\)',
-                r'\(Norway\)',
-                r'\(No\)',
-                r'\(Denmark\)',
-                r'\(Dk\)',
-                r'\(Da\)',
-                r'\(Finland\)',
-                r'\(Fi\)',
-                r'\(Portugal\)',
-                r'\(Pt\)',
-                r'\(Brazil\)',
-                r'\(Br\)',
-                r'\(Russia\)',
-                r'\(Ru\)',
-                r'\(China\)',
-                r'\(Cn\)',
-                r'\(Zh\)',
-                r'\(Taiwan\)',
-                r'\(Tw\)',
-                r'\(Hong\s*Kong\)',
-                r'\(HK\)',
-                r'\(En\)',                   # Language: English
-                r'\(En,.*?\)',               # (En,Fr), (En,De,Es), etc.
-                r'\(English\)',
-                r'\(French\)',
-                r'\(German\)',
-                r'\(Spanish\)',
-                r'\(Italian\)',
-                r'\(Japanese\)',
-                r'\(Multi\)',                # Multi-language
-                r'\(Multi\d*\)',             # (Multi5), (Multi6), etc.
-                r'\(M\d+\)',                 # (M3), (M5), etc.
-                r'\(Rev\s*[\dA-Z\.]+\)',    # (Rev 1), (Rev A), (Rev 1.1)
-                r'\(v[\d\.]+[a-z]?\)',      # (v1.0), (v1.1), (v2.0a)
-                r'\(Ver\.?\s*[\d\.]+\)',   # (Ver 1.0), (Ver. 2.0)
-                r'\(Version\s*[\d\.]+\)',  # (Version 1.0)
-                r'\[!\]',                    # Good dump indicator
-                r'\[a\d?\]',                 # Alternate version [a], [a1]
-                r'\[b\d?\]',                 # Bad dump [b], [b1]
-                r'\[c\]',                    # Cracked
-                r'\[f\d?\]',                 # Fixed [f], [f1]
-                r'\[h\d*[A-Za-z]*\]',        # Hack indicators
-                r'\[o\d?\]',                 # Overdump
-                r'\[p\d?\]',                 # Pirate
-                r'\[t\d?\]',                 # Trained/Trainer
-                r'\[T[+-][A-Za-z]+[^\]]*\]', # Translation [T+Eng], [T-Spa]
-                r'\(NTSC\)',
-                r'\(NTSC-U\)',
-                r'\(NTSC-J\)',
-                r'\(PAL\)',
-                r'\(SECAM\)',
-                r'\(\d{4}-\d{2}-\d{2}\)',   # Date stamps (2001-12-25)
-                r'\(\d{8}\)',                # Date stamps (20011225)
-                r'\(Unl\)',                  # Unlicensed
-            ]
-            
-            # Multi-region/multi-language combined patterns (e.g., "(USA, Europe, Asia)")
-            # These need to be handled separately with a more flexible regex
-            region_words = [
-                'USA', 'Europe', 'Japan', 'Asia', 'World', 'Korea', 'Australia',
-                'France', 'Germany', 'Spain', 'Italy', 'Netherlands', 'Sweden',
-                'Norway', 'Denmark', 'Finland', 'Portugal', 'Brazil', 'Russia',
-                'China', 'Taiwan', 'Hong Kong', 'Canada', 'UK', 'America',
-                'En', 'Fr', 'De', 'Es', 'It', 'Ja', 'Ko', 'Zh', 'Pt', 'Ru', 'Nl',
-                'English', 'French', 'German', 'Spanish', 'Italian', 'Japanese',
-                'U', 'E', 'J', 'A', 'K', 'W', 'G', 'F', 'S', 'I',
-                'EU', 'JP', 'KR', 'AU', 'Br', 'Cn', 'Tw', 'HK', 'Dk', 'Fi', 'No', 'Sv', 'Sw'
-            ]
-            # Build a pattern that matches "(Region1, Region2, ...)" with 2+ regions
-            region_pattern = r'\(\s*(?:' + '|'.join(re.escape(r) for r in region_words) + r')(?:\s*,\s*(?:' + '|'.join(re.escape(r) for r in region_words) + r'))+\s*\)'
-            name = re.sub(region_pattern, '', name, flags=re.IGNORECASE)
-            
-            # Remove the unwanted tags
-            for pattern in remove_patterns:
-                name = re.sub(pattern, '', name, flags=re.IGNORECASE)
-            
-            # Also remove any parentheses containing just 2-3 letter codes that weren't caught
-            # but avoid removing preserved tags
-            name = re.sub(r'\s*\([A-Za-z]{1,3}\)(?!\s*\.)', '', name)
-            
-            # Clean up multiple spaces
-            name = re.sub(r'\s+', ' ', name)
-            
-            # Clean up spaces before file extension
-            name = re.sub(r'\s+\.', '.', name)
-            
-            # Clean up leading/trailing spaces
-            name = name.strip()
-            
-            return name
+        get_clean_name = clean_rom_name_extended
         
         def scan_for_cleaning():
             source = source_entry.get()
@@ -5906,54 +7104,52 @@ obtained ROM files.
                              '.xci', '.nsp', '.xiso'}
             
             path = Path(source)
-            if recursive_scan.get():
-                all_files = list(path.rglob("*"))
-            else:
-                all_files = list(path.glob("*"))
-            
-            # Filter to ROM files only
-            rom_files = [f for f in all_files if f.is_file() and f.suffix.lower() in rom_extensions]
-            
-            if not rom_files:
-                results_text.insert("end", "No ROM files found in the selected directory.\n")
-                return
             
-            results_text.insert("end", f"Found {len(rom_files)} ROM file(s)...\n\n")
-            
-            # Group CUE files with their BIN files for coordinated renaming
+            # Group CUE files with their BIN files for coordinated renaming.
+            # Entries are classified straight off the directory walk; only BINs
+            # are held back (they need every CUE seen first), so no list of
+            # every ROM in the tree is built.
             cue_bin_groups = {}  # cue_path -> [bin_paths]
             standalone_files = []
+            bin_candidates = []
+            rom_count = 0
             
-            for rom_file in rom_files:
-                if rom_file.suffix.lower() == '.cue':
+            for entry in self._scan_file_entries(source, recursive_scan.get()):
+                ext = os.path.splitext(entry.name)[1].lower()
+                if ext not in rom_extensions:
+                    continue
+                rom_count += 1
+                rom_file = Path(entry.path)
+                if ext == '.cue':
                     # Parse CUE to find its BIN files
                     bin_files = []
                     try:
-                        with open(rom_file, 'r', encoding='utf-8', errors='ignore') as f:
-                            content = f.read()
-                        file_pattern = re.compile(r'FILE\s+"([^"]+)"\s+BINARY', re.IGNORECASE)
-                        matches = file_pattern.findall(content)
-                        for match in matches:
+                        for match in cue_bin_names(rom_file):
                             bin_path = rom_file.parent / match
                             if bin_path.exists():
                                 bin_files.append(bin_path)
                     except:
                         pass
                     cue_bin_groups[rom_file] = bin_files
-                elif rom_file.suffix.lower() == '.bin':
-                    # Check if this BIN is already associated with a CUE
-                    # Will be handled via cue_bin_groups
-                    pass
+                elif ext == '.bin':
+                    # May belong to a CUE; decided once the walk is done
+                    bin_candidates.append(rom_file)
                 else:
                     standalone_files.append(rom_file)
             
+            if not rom_count:
+                results_text.insert("end", "No ROM files found in the selected directory.\n")
+                return
+            
+            results_text.insert("end", f"Found {rom_count} ROM file(s)...\n\n")
+            
             # Find orphan BIN files (not referenced by any CUE)
             all_grouped_bins = set()
             for bins in cue_bin_groups.values():
                 all_grouped_bins.update(bins)
             
-            for rom_file in rom_files:
-                if rom_file.suffix.lower() == '.bin' and rom_file not in all_grouped_bins:
+            for rom_file in bin_candidates:
+                if rom_file not in all_grouped_bins:
                     standalone_files.append(rom_file)
             
             changes_found = 0
@@ -5992,18 +7188,21 @@ obtained ROM files.
                             results_text.insert("end", f"    ✅ {new_bin_name}\n")
                     results_text.insert("end", "\n")
             
-            # Process standalone files
-            for rom_file in sorted(standalone_files):
-                original_name = rom_file.name
-                clean_name = get_clean_name(original_name)
-                
-                if clean_name != original_name:
-                    changes_found += 1
-                    files_to_rename.append((rom_file, clean_name))
-                    relative_path = rom_file.parent.relative_to(path) if rom_file.parent != path else Path('.')
-                    results_text.insert("end", f"📁 {relative_path}\n")
-                    results_text.insert("end", f"  ❌ {original_name}\n")
-                    results_text.insert("end", f"  ✅ {clean_name}\n\n")
+            # Process standalone files - collect changes first, then sort only those
+            standalone_changes = []
+            for rom_file in standalone_files:
+                clean_name = get_clean_name(rom_file.name)
+                if clean_name != rom_file.name:
+                    standalone_changes.append((rom_file, clean_name))
+            standalone_changes.sort(key=lambda t: str(t[0]))
+
+            for rom_file, clean_name in standalone_changes:
+                changes_found += 1
+                files_to_rename.append((rom_file, clean_name))
+                relative_path = rom_file.parent.relative_to(path) if rom_file.parent != path else Path('.')
+                results_text.insert("end", f"📁 {relative_path}\n")
+                results_text.insert("end", f"  ❌ {rom_file.name}\n")
+                results_text.insert("end", f"  ✅ {clean_name}\n\n")
             
             if changes_found == 0:
                 results_text.insert("end", "✨ All file names are already clean! No changes needed.\n")
@@ -6201,30 +7400,30 @@ obtained ROM files.
             messagebox.showinfo("Undo Complete", f"Reverted {reverted_count} file(s) to original names.")
         
         # Action buttons
-        action_frame = Frame(dialog, padx=10, pady=10, bg=COLORS['bg_dark'])
+        action_frame = Frame(dialog, padx=10, pady=10, bg=self.colors.bg_dark)
         action_frame.pack(fill="x")
         
         Button(action_frame, text="▶ SCAN", command=scan_for_cleaning,
                font=self.font_button,
-               bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['text_primary'],
+               bg=self.colors.button_green, fg=self.colors.bg_dark,
+               activebackground=self.colors.text_primary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="✨ RENAME", command=execute_rename,
                font=self.font_button,
-               bg=COLORS['accent_pink'], fg="white",
-               activebackground=COLORS['accent_purple'],
+               bg=self.colors.accent_pink, fg="white",
+               activebackground=self.colors.accent_purple,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="↩️ UNDO", command=undo_rename,
                font=self.font_button,
-               bg=COLORS['accent_orange'], fg="white",
-               activebackground=COLORS['accent_yellow'],
+               bg=self.colors.accent_orange, fg="white",
+               activebackground=self.colors.accent_yellow,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="✕ CLOSE", command=dialog.destroy,
                font=self.font_button,
-               activebackground=COLORS['accent_red'],
+               activebackground=self.colors.accent_red,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="right", padx=5)
 
     def extract_archives_dialog(self):
@@ -6235,23 +7434,23 @@ obtained ROM files.
         dialog.resizable(True, True)
         dialog.transient(self.master)
         dialog.grab_set()
-        dialog.configure(bg=COLORS['bg_dark'])
+        dialog.configure(bg=self.colors.bg_dark)
         
         # Title
-        title_frame = Frame(dialog, bg=COLORS['bg_light'], pady=6)
+        title_frame = Frame(dialog, bg=self.colors.bg_light, pady=6)
         title_frame.pack(fill="x", padx=10, pady=(10, 10))
         Label(title_frame, text="📦 ARCHIVE EXTRACTOR - SORT BY SYSTEM", font=self.font_heading_md,
-              fg=COLORS['accent_yellow'], bg=COLORS['bg_light']).pack()
+              fg=self.colors.accent_yellow, bg=self.colors.bg_light).pack()
         
         # Source directory
-        source_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        source_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         source_frame.pack(fill="x")
         
         Label(source_frame, text="📂 Source:", font=self.font_label_bold,
-              fg=COLORS['text_primary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_primary, bg=self.colors.bg_dark).pack(side="left")
         source_entry = Entry(source_frame, font=self.font_body,
-                            bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                            insertbackground=COLORS['text_primary'], relief="flat")
+                            bg=self.colors.bg_input, fg=self.colors.text_primary,
+                            insertbackground=self.colors.text_primary, relief="flat")
         source_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=3)
         if self.source_dir:
             source_entry.insert(0, self.source_dir)
@@ -6263,43 +7462,43 @@ obtained ROM files.
                 source_entry.insert(0, folder)
         
         Button(source_frame, text="[ BROWSE ]", command=browse_source,
-               font=self.font_small, bg=COLORS['bg_light'],
-               fg=COLORS['text_secondary'], relief="flat", cursor="hand2").pack(side="left")
+               font=self.font_small, bg=self.colors.bg_light,
+               fg=self.colors.text_secondary, relief="flat", cursor="hand2").pack(side="left")
         
         # Options
-        options_frame = Frame(dialog, padx=10, pady=8, bg=COLORS['bg_light'])
+        options_frame = Frame(dialog, padx=10, pady=8, bg=self.colors.bg_light)
         options_frame.pack(fill="x", padx=10, pady=5)
         
-        cb_bg = COLORS['bg_light']
+        cb_bg = self.colors.bg_light
         
         recursive_scan = BooleanVar(value=True)
         Checkbutton(options_frame, text="↳ Scan subdirectories", 
                    variable=recursive_scan, font=self.font_small,
-                   fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left", padx=(0, 20))
         
         delete_after_extract = BooleanVar(value=False)
         Checkbutton(options_frame, text="⚠ Delete archives after extraction", 
                    variable=delete_after_extract, font=self.font_small,
-                   fg=COLORS['accent_red'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+                   fg=self.colors.accent_red, bg=cb_bg, selectcolor=self.colors.bg_dark,
                    activebackground=cb_bg).pack(side="left")
 
         copy_archives_var = BooleanVar(value=False)
         Checkbutton(options_frame, text="📁 Copy archives instead of move", 
                variable=copy_archives_var, font=self.font_small,
-               fg=COLORS['text_secondary'], bg=cb_bg, selectcolor=COLORS['bg_dark'],
+               fg=self.colors.text_secondary, bg=cb_bg, selectcolor=self.colors.bg_dark,
                activebackground=cb_bg).pack(side="left", padx=(20, 0))
         
         # System folder configuration frame
-        system_config_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        system_config_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         system_config_frame.pack(fill="x")
         
         # Header with label and base folder button
-        system_header_frame = Frame(system_config_frame, bg=COLORS['bg_dark'])
+        system_header_frame = Frame(system_config_frame, bg=self.colors.bg_dark)
         system_header_frame.pack(fill="x", pady=(0, 4))
         
         Label(system_header_frame, text="◄ SYSTEM EXTRACTION FOLDERS ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(side="left")
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(side="left")
         
         # Base folder for quick setup
         base_folder_var = {"path": ""}
@@ -6322,25 +7521,25 @@ obtained ROM files.
         
         Button(system_header_frame, text="📁 SET BASE FOLDER (Auto-create subfolders)", 
                command=set_base_folder,
-               font=self.font_small, bg=COLORS['accent_yellow'], fg=COLORS['bg_dark'],
+               font=self.font_small, bg=self.colors.accent_yellow, fg=self.colors.bg_dark,
                relief="flat", cursor="hand2", padx=10).pack(side="right")
         
         # Scrollable frame for system folder configuration
-        system_canvas_frame = Frame(system_config_frame, bg=COLORS['bg_medium'], height=150)
+        system_canvas_frame = Frame(system_config_frame, bg=self.colors.bg_medium, height=150)
         system_canvas_frame.pack(fill="x", pady=5)
         system_canvas_frame.pack_propagate(False)
         
-        system_scrollbar = Scrollbar(system_canvas_frame, bg=COLORS['bg_light'],
-                                     troughcolor=COLORS['bg_dark'])
+        system_scrollbar = Scrollbar(system_canvas_frame, bg=self.colors.bg_light,
+                                     troughcolor=self.colors.bg_dark)
         system_scrollbar.pack(side="right", fill="y")
         
         from tkinter import Canvas
-        system_canvas = Canvas(system_canvas_frame, bg=COLORS['bg_medium'],
+        system_canvas = Canvas(system_canvas_frame, bg=self.colors.bg_medium,
                               yscrollcommand=system_scrollbar.set, highlightthickness=0)
         system_canvas.pack(side="left", fill="both", expand=True)
         system_scrollbar.config(command=system_canvas.yview)
         
-        system_list_frame = Frame(system_canvas, bg=COLORS['bg_medium'])
+        system_list_frame = Frame(system_canvas, bg=self.colors.bg_medium)
         system_canvas.create_window((0, 0), window=system_list_frame, anchor="nw")
         
         def update_scroll_region(event=None):
@@ -6354,25 +7553,25 @@ obtained ROM files.
         
         def create_system_folder_row(parent, system_name, rom_count=0):
             """Create a row for configuring a system's extraction folder"""
-            row_frame = Frame(parent, bg=COLORS['bg_medium'], pady=3)
+            row_frame = Frame(parent, bg=self.colors.bg_medium, pady=3)
             row_frame.pack(fill="x", padx=5, pady=2)
             
             # Checkbox to include/exclude this system
             include_var = BooleanVar(value=True)
             system_checkboxes[system_name] = include_var
             Checkbutton(row_frame, variable=include_var,
-                       bg=COLORS['bg_medium'], selectcolor=COLORS['bg_dark'],
-                       activebackground=COLORS['bg_medium']).pack(side="left")
+                       bg=self.colors.bg_medium, selectcolor=self.colors.bg_dark,
+                       activebackground=self.colors.bg_medium).pack(side="left")
             
             # System name with ROM count
             Label(row_frame, text=f"{system_name} ({rom_count} ROMs):", width=25, anchor="w",
-                  font=self.font_small, fg=COLORS['text_primary'], 
-                  bg=COLORS['bg_medium']).pack(side="left")
+                  font=self.font_small, fg=self.colors.text_primary, 
+                  bg=self.colors.bg_medium).pack(side="left")
             
             # Editable entry field for folder path
             folder_entry = Entry(row_frame, font=self.font_small,
-                                bg=COLORS['bg_input'], fg=COLORS['text_primary'],
-                                insertbackground=COLORS['text_primary'], relief="flat", width=40)
+                                bg=self.colors.bg_input, fg=self.colors.text_primary,
+                                insertbackground=self.colors.text_primary, relief="flat", width=40)
             folder_entry.pack(side="left", fill="x", expand=True, padx=5, ipady=2)
             
             # Pre-fill with saved path if available
@@ -6390,8 +7589,8 @@ obtained ROM files.
                     self.save_config()
             
             Button(row_frame, text="📂", command=browse_system_folder,
-                   font=self.font_small, bg=COLORS['bg_light'],
-                   fg=COLORS['text_secondary'], relief="flat", cursor="hand2",
+                   font=self.font_small, bg=self.colors.bg_light,
+                   fg=self.colors.text_secondary, relief="flat", cursor="hand2",
                    width=3).pack(side="left", padx=2)
             
             def save_entry_path(event=None):
@@ -6400,7 +7599,7 @@ obtained ROM files.
                     self.system_extract_dirs[system_name] = path
                 elif system_name in self.system_extract_dirs:
                     del self.system_extract_dirs[system_name]
-                self.save_config()
+                self.schedule_save_config()
             
             folder_entry.bind("<FocusOut>", save_entry_path)
             folder_entry.bind("<Return>", save_entry_path)
@@ -6408,28 +7607,28 @@ obtained ROM files.
         # Placeholder text when no systems detected
         placeholder_label = Label(system_list_frame, 
                                  text="Scan archives to detect systems and configure extraction folders",
-                                 font=self.font_small, fg=COLORS['text_muted'],
-                                 bg=COLORS['bg_medium'], pady=20)
+                                 font=self.font_small, fg=self.colors.text_muted,
+                                 bg=self.colors.bg_medium, pady=20)
         placeholder_label.pack()
         
         # Results area
-        results_frame = Frame(dialog, padx=10, pady=5, bg=COLORS['bg_dark'])
+        results_frame = Frame(dialog, padx=10, pady=5, bg=self.colors.bg_dark)
         results_frame.pack(fill="both", expand=True)
         
         Label(results_frame, text="◄ SCAN RESULTS ►", font=self.font_label_bold,
-              fg=COLORS['text_secondary'], bg=COLORS['bg_dark']).pack(anchor="w", pady=(0, 4))
+              fg=self.colors.text_secondary, bg=self.colors.bg_dark).pack(anchor="w", pady=(0, 4))
         
-        list_frame = Frame(results_frame, bg=COLORS['bg_dark'])
+        list_frame = Frame(results_frame, bg=self.colors.bg_dark)
         list_frame.pack(fill="both", expand=True)
         
-        scrollbar = Scrollbar(list_frame, bg=COLORS['bg_light'],
-                             troughcolor=COLORS['bg_dark'])
+        scrollbar = Scrollbar(list_frame, bg=self.colors.bg_light,
+                             troughcolor=self.colors.bg_dark)
         scrollbar.pack(side="right", fill="y")
         
         results_text = Text(list_frame, wrap="word", yscrollcommand=scrollbar.set,
                            height=15, font=self.font_mono,
-                           bg=COLORS['bg_medium'], fg=COLORS['text_primary'],
-                           insertbackground=COLORS['text_primary'], relief="flat",
+                           bg=self.colors.bg_medium, fg=self.colors.text_primary,
+                           insertbackground=self.colors.text_primary, relief="flat",
                            padx=8, pady=8)
         results_text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=results_text.yview)
@@ -6440,7 +7639,9 @@ obtained ROM files.
         
         def detect_system_from_name(name, size_bytes=None):
             """Detect system from filename, with metadata/size/ID heuristics for ISO (PS2 vs PSP)."""
-            file_ext = Path(name).suffix.lower()
+            file_ext = os.path.splitext(name)[1].lower()
+            if file_ext not in ROM_EXTENSIONS:
+                return None
             if file_ext == '.iso':
                 system = self.detect_iso_system(name, size_bytes)
                 if system:
@@ -6478,12 +7679,18 @@ obtained ROM files.
                     if self.seven_zip_path:
                         # Use 7z to list archive contents
                         cmd = [self.seven_zip_path, 'l', '-ba', str(archive_path)]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+                        result = subprocess.run(cmd, capture_output=True, timeout=60)
                         if result.returncode == 0:
-                            for line in result.stdout.split('\n'):
+                            encoding = locale.getpreferredencoding(False)
+                            for line in result.stdout.splitlines():
                                 # 7z list output format varies, try to extract filename
-                                parts = line.strip().split()
+                                parts = line.split()
                                 if parts:
+                                    # Filter on the raw bytes; only ROM names get decoded
+                                    dot = parts[-1].rfind(b'.')
+                                    if dot < 0 or parts[-1][dot:].lower() not in ROM_EXTENSIONS_BYTES:
+                                        continue
+                                    parts = [part.decode(encoding, 'replace') for part in parts]
                                     name = parts[-1]  # Filename is usually last
                                     size_val = None
                                     if len(parts) >= 3 and parts[-3].isdigit():
@@ -6526,8 +7733,8 @@ obtained ROM files.
                 # Re-add placeholder
                 Label(system_list_frame, 
                       text="No archives found. Select a different source folder.",
-                      font=self.font_small, fg=COLORS['text_muted'],
-                      bg=COLORS['bg_medium'], pady=20).pack()
+                      font=self.font_small, fg=self.colors.text_muted,
+                      bg=self.colors.bg_medium, pady=20).pack()
                 return
             
             results_text.insert("end", f"Found {len(archives)} archive(s). Analyzing contents...\n\n")
@@ -6550,8 +7757,8 @@ obtained ROM files.
                 # Re-add placeholder
                 Label(system_list_frame, 
                       text="No ROMs detected. Archives may contain unsupported formats.",
-                      font=self.font_small, fg=COLORS['text_muted'],
-                      bg=COLORS['bg_medium'], pady=20).pack()
+                      font=self.font_small, fg=self.colors.text_muted,
+                      bg=self.colors.bg_medium, pady=20).pack()
                 return
             
             # Create system folder configuration rows for detected systems with ROM counts
@@ -6883,7 +8090,8 @@ obtained ROM files.
                                 try:
                                     cmd = [self.seven_zip_path, 'e', str(archive_path), 
                                            f'-o{dest_folder}', rom, '-y']
-                                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+                                    result = subprocess.run(cmd, stdout=subprocess.DEVNULL,
+                                                            stderr=subprocess.DEVNULL, timeout=300)
                                     if result.returncode == 0:
                                         extracted_count += 1
                                         results_text.insert("end", f"   ✅ {Path(rom).name}\n")
@@ -6929,36 +8137,36 @@ obtained ROM files.
                               (f"Errors: {error_count}" if error_count > 0 else ""))
         
         # Action buttons
-        action_frame = Frame(dialog, padx=10, pady=10, bg=COLORS['bg_dark'])
+        action_frame = Frame(dialog, padx=10, pady=10, bg=self.colors.bg_dark)
         action_frame.pack(fill="x")
         
         Button(action_frame, text="▶ SCAN ARCHIVES", command=scan_archives,
                font=self.font_button,
-               bg=COLORS['button_green'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['text_primary'],
+               bg=self.colors.button_green, fg=self.colors.bg_dark,
+               activebackground=self.colors.text_primary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="🔀 REASSIGN ROM", command=reassign_rom_dialog,
                font=self.font_button,
-               bg=COLORS['button_blue'], fg="white",
-               activebackground=COLORS['text_secondary'],
+               bg=self.colors.button_blue, fg="white",
+               activebackground=self.colors.text_secondary,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="📁 ORGANIZE ARCHIVES", command=organize_archives_to_folders,
                font=self.font_button,
-               bg=COLORS['accent_purple'], fg="white",
-               activebackground=COLORS['accent_pink'],
+               bg=self.colors.accent_purple, fg="white",
+               activebackground=self.colors.accent_pink,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="📦 EXTRACT BY SYSTEM", command=extract_to_system_folders,
                font=self.font_button,
-               bg=COLORS['accent_yellow'], fg=COLORS['bg_dark'],
-               activebackground=COLORS['accent_orange'],
+               bg=self.colors.accent_yellow, fg=self.colors.bg_dark,
+               activebackground=self.colors.accent_orange,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="left", padx=5)
         
         Button(action_frame, text="✕ CLOSE", command=dialog.destroy,
                font=self.font_button,
-               activebackground=COLORS['accent_red'],
+               activebackground=self.colors.accent_red,
                relief="flat", cursor="hand2", padx=15, pady=5).pack(side="right", padx=5)
 
 